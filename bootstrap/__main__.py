@@ -6,15 +6,18 @@ from contextlib import AsyncExitStack, ExitStack, contextmanager
 from functools import wraps
 from pathlib import Path
 from sqlite3 import connect
+from tempfile import TemporaryDirectory
 from typing import IO, Any, ParamSpec, TypeVar
 
 import click
+from pkg_resources import resource_filename
 from selenium import webdriver
 
-from gobo.types import URI
+from gobo.types import URI, Edition
 
-from . import area, municipality, platinum, spot
+from . import area, edition, municipality, platinum, spot
 from .cache import Cache
+from .replay import Harness, Mode, Tape
 
 P = ParamSpec("P")
 T = TypeVar("T")
@@ -29,8 +32,27 @@ def run_decorator(f: Callable[P, Coroutine[Any, Any, T]]) -> Callable[P, T]:
 
 
 @click.group
-def main() -> None:
-    ...
+@click.option(
+    "--record",
+    type=click.Path(file_okay=False, path_type=Path),
+    help="Record browser pages and HTTP responses into DIR.",
+)
+@click.option(
+    "--replay",
+    type=click.Path(exists=True, file_okay=False, path_type=Path),
+    help="Replay pages and responses recorded in DIR offline.",
+)
+@click.pass_context
+def main(ctx: click.Context, record: Path | None, replay: Path | None) -> None:
+    match record, replay:
+        case None, None:
+            ctx.obj = Harness()
+        case Path(), None:
+            ctx.obj = Harness(Mode.record, Tape(record))
+        case None, Path():
+            ctx.obj = Harness(Mode.replay, Tape(replay))
+        case _:
+            raise click.UsageError("--record and --replay are mutually exclusive")
 
 
 @main.command(name="spots")
@@ -38,56 +60,67 @@ def main() -> None:
 @click.option("-o", "--output", type=click.File("w", encoding="utf-8"), default=sys.stdout)
 @click.option("-j", type=int, default=4)
 @click.option("--indent", type=int, default=2)
-async def spots_command(output: IO[str], indent: int | None, j: int) -> None:
+@click.option("--platinumaps", default=edition.PLATINUMAPS, show_default=True)
+@click.pass_obj
+async def spots_command(
+    harness: Harness, output: IO[str], indent: int | None, j: int, platinumaps: str
+) -> None:
     with ExitStack() as stack:
-        drivers = [stack.enter_context(open_chrome_driver()) for _ in range(max(1, j))]
-        (boot_option,) = platinum.find_boot_options(drivers[-1])
-        data = await platinum.get_spots(drivers, boot_option)
+        drivers = [
+            stack.enter_context(harness.open_driver(open_chrome_driver)) for _ in range(max(1, j))
+        ]
+        (boot_option,) = platinum.find_boot_options(drivers[-1], platinumaps)
+        data = await platinum.get_spots(drivers, boot_option, platinumaps)
     json.dump(data, output, indent=indent)
 
 
 @main.command
 @run_decorator
+@click.option("--edition", "edition_", type=int, required=True)
+@click.option("--platinumaps", default=edition.PLATINUMAPS, show_default=True)
 @click.option(
-    "-o", "--output", "output_file", type=click.File("w", encoding="utf-8"), default=sys.stdout
+    "-o",
+    "--output",
+    "output_path",
+    type=click.Path(dir_okay=False, path_type=Path),
+    default=None,
+    help="default: gobo/database/editions/EDITION.sql",
+)
+@click.option(
+    "--cache-path", type=click.Path(dir_okay=False, path_type=Path), default=Path(".cache.pickle")
 )
 @click.argument("input_file", metavar="JSON", type=click.File("r", encoding="utf-8"))
+@click.pass_obj
 async def database(
+    harness: Harness,
     input_file: IO[str],
-    output_file: IO[str],
+    output_path: Path | None,
+    cache_path: Path,
+    edition_: int,
+    platinumaps: str,
 ) -> None:
-    with connect(":memory:") as connection:
-        cursor = connection.cursor()
-        area.create_and_insert(cursor)
-        spot.create_and_insert(cursor)
+    if output_path is None:
+        output_path = Path(resource_filename("gobo.database", f"editions/{edition_}.sql"))
 
-        for sql in connection.iterdump():
-            print(sql, file=output_file)
-
-
-@main.command
-@run_decorator
-@click.option("-o", "--output", type=click.File("w", encoding="utf-8"), default=sys.stdout)
-@click.option(
-    "--cache-path", type=click.Path(dir_okay=False, path_type=Path), default=Path(".cache.pickle")
-)
-async def database_bak(output: IO[str], cache_path: Path) -> None:
     async with AsyncExitStack() as stack:
         enter = stack.enter_context
         connection = enter(connect(":memory:"))
 
-        cache = enter(Cache(cache_path))
+        if harness.mode is not Mode.live:
+            # 記録・再生時は既存のキャッシュを使わず、必ず harness を通して取得する
+            cache_path = Path(enter(TemporaryDirectory())) / cache_path.name
+        cache = enter(Cache(cache_path, harness.fetch))
 
         cursor = connection.cursor()
         municipality.create_and_insert(
             cursor,
-            await cache.get_html(
-                URI("http://www.tt.rim.or.jp/~ishato/tiri/code/rireki/12tiba.htm"), "cp932"
-            ),
+            await cache.get_html(URI(municipality.URI), "cp932"),
         )
         area.create_and_insert(cursor)
-        spot.create_and_insert(cursor)
+        spot.create_and_insert(cursor, json.load(input_file))
+        edition.create_and_insert(cursor, Edition(edition_), platinumaps)
 
+        output = enter(output_path.open("w", encoding="utf-8"))
         for sql in connection.iterdump():
             print(sql, file=output)
 
@@ -1,6 +1,7 @@
 from __future__ import annotations
 
-from contextlib import AsyncExitStack, ExitStack, closing, suppress
+from collections.abc import Awaitable, Callable
+from contextlib import ExitStack, closing, suppress
 from dataclasses import dataclass, field
 from pathlib import Path
 from typing import TYPE_CHECKING, Any, TypedDict
@@ -23,6 +24,7 @@ class Cache:
         html: NotRequired[dict[URI, str]]
 
     path: Path
+    fetch: Callable[[URI], Awaitable[bytes]] = field(default=lambda uri: download(uri))
     content: Content = field(init=False, default_factory=lambda: Cache.Content())
 
     def __post_init__(self) -> None:
@@ -48,10 +50,13 @@ class Cache:
 
     async def get_html(self, uri: URI, encoding: str | None) -> _Element:
         if uri not in self.html:
-            async with AsyncExitStack() as stack:
-                enter = stack.enter_async_context
-                session = await enter(ClientSession())
-                response = await enter(session.get(uri))
-                self.html[uri] = await response.text(encoding=encoding)
+            self.html[uri] = (await self.fetch(uri)).decode(encoding or "utf-8")
 
         return html.fromstring(self.html[uri])
+
+
+async def download(uri: URI, proxy: str | None = None) -> bytes:
+    async with ClientSession() as session:
+        async with session.get(uri, proxy=proxy) as response:
+            response.raise_for_status()
+            return await response.read()
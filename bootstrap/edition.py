@@ -0,0 +1,30 @@
+from sqlite3 import Cursor
+
+from gobo.types import Edition
+
+PLATINUMAPS = "gogo-boso"
+
+
+def create_and_insert(cursor: Cursor, edition: Edition, platinumaps: str) -> None:
+    cursor.execute(
+        """
+CREATE TABLE edition
+(
+    edition INTEGER PRIMARY KEY,
+    platinumaps TEXT NOT NULL
+)
+        """
+    )
+    cursor.execute(
+        """
+INSERT INTO edition
+(
+    edition, platinumaps
+)
+VALUES
+(
+    ?, ?
+)
+        """,
+        (edition, platinumaps),
+    )
@@ -1,4 +1,6 @@
+import re
 from collections.abc import Generator, Iterator
+from datetime import date
 from sqlite3 import Cursor
 
 from lxml.etree import _Element
@@ -72,6 +74,7 @@ ORDER = [
 def create_and_insert(cursor: Cursor, document: _Element) -> None:
     rows = list(_iter_rows(document))
     kanji = {kanji: id for id, _, (kanji, _) in rows}
+    changes = list(_iter_changes(document))
 
     cursor.execute(
         """
@@ -148,6 +151,36 @@ VALUES
         ((i, kanji[s]) for i, s in enumerate(ORDER, start=1)),
     )
 
+    cursor.execute(
+        """
+CREATE TABLE municipality_history
+(
+    municipality_id INTEGER NOT NULL,
+    notation_id INTEGER NOT NULL,
+    municipality_name TEXT NOT NULL,
+    valid_from TEXT NULL,
+    valid_until TEXT NULL
+)
+        """
+    )
+    cursor.executemany(
+        """
+INSERT INTO municipality_history
+(
+    municipality_id, notation_id, municipality_name, valid_from, valid_until
+)
+VALUES
+(
+    ?, ?, ?, ?, ?
+)
+        """,
+        (
+            (id, notation.value, name, _isoformat(valid_from), _isoformat(valid_until))
+            for id, names, valid_from, valid_until in _intervals(rows, changes)
+            for notation, name in zip(Notation, names)
+        ),
+    )
+
 
 def _iter_rows(
     document: _Element,
@@ -183,7 +216,7 @@ def _flatten(
         code = code0, code1
 
         shift = 0
-        while tr.xpath("td[3]/*/text()") == ["変更"]:
+        while _is_changed(tr, shift):
             shift = 2
             tr = next(tr_iterator)
 
@@ -201,5 +234,87 @@ def _flatten(
             yield code, parent, child
 
 
+def _iter_changes(
+    document: _Element,
+) -> Generator[tuple[int, tuple[str, str], tuple[str, str], date | None], None, None]:
+    """
+    「変更」の行から (コード, 変更前の名前, 変更後の名前, 変更日) を取り出す
+    """
+    table: _Element
+    (table,) = document.xpath("//table")  # type: ignore
+
+    tr_iterator: Iterator[_Element]
+    tr_iterator = iter(table.xpath("tr"))  # type: ignore
+    for tr in tr_iterator:
+        try:
+            code0: int
+            code1: int
+            code0, code1 = map(int, tr.xpath("td[position() <= 2]/text()"))  # type: ignore
+        except ValueError:
+            continue
+
+        shift = 0
+        while _is_changed(tr, shift):
+            before = tr
+            old = _names(before, shift)
+
+            shift = 2
+            tr = next(tr_iterator)
+            new = _names(tr, shift)
+
+            if len(old) == 2 and len(new) == 2 and old != new:
+                changed_on = _find_date(tr) or _find_date(before)
+                yield _code2int((code0, code1)), (old[0], old[1]), (new[0], new[1]), changed_on
+
+
+def _intervals(
+    rows: list[tuple[int, int | None, tuple[str, str]]],
+    changes: list[tuple[int, tuple[str, str], tuple[str, str], date | None]],
+) -> Generator[tuple[int, tuple[str, str], date | None, date | None], None, None]:
+    """
+    コードごとに名前が有効だった期間 [valid_from, valid_until) を並べる
+    """
+    for id, _, names in rows:
+        history = sorted(
+            ((changed_on, old) for code, old, _, changed_on in changes if code == id),
+            key=lambda change: change[0] or date.min,
+        )
+        valid_from: date | None = None
+        for changed_on, old in history:
+            yield id, old, valid_from, changed_on
+            valid_from = changed_on
+        yield id, names, valid_from, None
+
+
+def _is_changed(tr: _Element, shift: int) -> bool:
+    # 2 行目以降はコードの列が無いので、「変更」の列も左にずれる
+    return tr.xpath(f"td[{3 - shift}]/*/text()") == ["変更"]
+
+
+def _names(tr: _Element, shift: int) -> list[str]:
+    if tr.xpath("td[@colspan=2]"):
+        return tr.xpath("td[position() = 4 or position() = 6]/text()")  # type: ignore
+    position = f"position() = {4 - shift} or position() = {5 - shift}"
+    return tr.xpath(f"td[{position}]/text()")  # type: ignore
+
+
+_DATE = re.compile(r"(?P<year>\d{4})\s*[./\-年]\s*(?P<month>\d{1,2})\s*[./\-月]\s*(?P<day>\d{1,2})")
+
+
+def _find_date(tr: _Element) -> date | None:
+    text = "".join(tr.itertext())  # type: ignore
+    searched = _DATE.search(text)
+    if searched is None:
+        return None
+    try:
+        return date(int(searched["year"]), int(searched["month"]), int(searched["day"]))
+    except ValueError:
+        return None
+
+
+def _isoformat(value: date | None) -> str | None:
+    return None if value is None else value.isoformat()
+
+
 def _code2int(code: tuple[int, int]) -> int:
     return code[0] * 1000 + code[1]
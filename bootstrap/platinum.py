@@ -26,14 +26,16 @@ class StampRallySpot(TypedDict):
     spotTitle: str
 
 
-def find_boot_options(driver: WebDriver) -> Generator[BootOption, None, None]:
-    driver.get("https://platinumaps.jp/d/gogo-boso")
+def find_boot_options(driver: WebDriver, platinumaps: str) -> Generator[BootOption, None, None]:
+    driver.get(f"https://platinumaps.jp/d/{platinumaps}")
     for frame in driver.find_elements(by=By.XPATH, value="//iframe"):
         driver.switch_to.frame(frame)
         yield from _find_boot_options_from_frame(html.fromstring(driver.page_source))
 
 
-async def get_spots(drivers: Collection[WebDriver], boot_option: BootOption) -> list[Spot]:
+async def get_spots(
+    drivers: Collection[WebDriver], boot_option: BootOption, platinumaps: str
+) -> list[Spot]:
     queue: Queue[StampRallySpot] = Queue()
 
     for spot in sorted(boot_option["stampRallySpots"], key=itemgetter("spotId")):
@@ -41,14 +43,20 @@ async def get_spots(drivers: Collection[WebDriver], boot_option: BootOption) ->
 
     with ThreadPoolExecutor(len(drivers)) as executor:
         spots: list[Spot] = sum(
-            await gather(*(_each_get_spots(executor, driver, queue) for driver in drivers)), []
+            await gather(
+                *(_each_get_spots(executor, driver, queue, platinumaps) for driver in drivers)
+            ),
+            [],
         )
 
     return sorted(spots, key=lambda spot: spot["id"])
 
 
 async def _each_get_spots(
-    executor: ThreadPoolExecutor, driver: WebDriver, queue: Queue[StampRallySpot]
+    executor: ThreadPoolExecutor,
+    driver: WebDriver,
+    queue: Queue[StampRallySpot],
+    platinumaps: str,
 ) -> list[Spot]:
     loop = get_running_loop()
     spots: list[Spot] = []
@@ -56,7 +64,7 @@ async def _each_get_spots(
     while not queue.empty():
         source = await queue.get()
         try:
-            spot = await loop.run_in_executor(executor, _get_spot, driver, source)
+            spot = await loop.run_in_executor(executor, _get_spot, driver, source, platinumaps)
             spots.append(spot)
         finally:
             queue.task_done()
@@ -64,7 +72,7 @@ async def _each_get_spots(
     return spots
 
 
-def _get_spot(driver: WebDriver, source: StampRallySpot) -> Spot:
+def _get_spot(driver: WebDriver, source: StampRallySpot, platinumaps: str) -> Spot:
     spot = cast(
         Spot,
         {
@@ -73,7 +81,7 @@ def _get_spot(driver: WebDriver, source: StampRallySpot) -> Spot:
         },
     )
 
-    driver.get(f"https://platinumaps.jp/d/gogo-boso?s={spot['id']}")
+    driver.get(f"https://platinumaps.jp/d/{platinumaps}?s={spot['id']}")
     for frame in driver.find_elements(by=By.XPATH, value="//iframe"):
         driver.switch_to.frame(frame)
         for tr in driver.find_elements(by=By.XPATH, value='//tr[@class = "poiproperties__item"]'):
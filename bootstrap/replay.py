@@ -0,0 +1,266 @@
+from __future__ import annotations
+
+import json
+from collections.abc import AsyncGenerator, Callable, Generator, Iterable
+from contextlib import AbstractContextManager, asynccontextmanager, contextmanager
+from dataclasses import dataclass, field
+from enum import Enum
+from hashlib import sha256
+from pathlib import Path
+from typing import Any, TypedDict, cast
+from urllib.parse import urljoin
+
+from aiohttp import web
+from lxml import html
+from lxml.etree import _Element
+from selenium.webdriver.common.by import By
+from selenium.webdriver.remote.webdriver import WebDriver
+
+from gobo.types import URI
+
+from .cache import download
+
+
+class Mode(Enum):
+    live = 0
+    record = 1
+    replay = 2
+
+
+class Page(TypedDict):
+    uri: URI
+    page_source: str
+    frames: list[str]
+    # iframe の中の相対リンクはそれぞれのドキュメントの URL から解決する
+    frame_uris: list[URI]
+
+
+@dataclass(frozen=True)
+class Tape:
+    """
+    記録したページ(iframe を含む)と HTTP レスポンスを保存するディレクトリ
+    """
+
+    path: Path
+
+    def load_page(self, uri: URI) -> Page:
+        with self._path("browser", uri, ".json").open("r", encoding="utf-8") as f:
+            return cast(Page, json.load(f))
+
+    def save_page(self, page: Page) -> None:
+        path = self._path("browser", page["uri"], ".json")
+        path.parent.mkdir(parents=True, exist_ok=True)
+        with path.open("w", encoding="utf-8") as f:
+            json.dump(page, f, ensure_ascii=False)
+
+    def load_body(self, uri: URI) -> bytes:
+        return self._path("http", uri, ".body").read_bytes()
+
+    def save_body(self, uri: URI, body: bytes) -> None:
+        path = self._path("http", uri, ".body")
+        path.parent.mkdir(parents=True, exist_ok=True)
+        path.write_bytes(body)
+
+    def _path(self, kind: str, uri: URI, suffix: str) -> Path:
+        return self.path / kind / f"{sha256(uri.encode('utf-8')).hexdigest()}{suffix}"
+
+
+@dataclass(frozen=True)
+class Harness:
+    mode: Mode = Mode.live
+    tape: Tape | None = None
+
+    @contextmanager
+    def open_driver(
+        self, open_live: Callable[[], AbstractContextManager[WebDriver]]
+    ) -> Generator[WebDriver, None, None]:
+        match self.mode, self.tape:
+            case Mode.live, _:
+                with open_live() as driver:
+                    yield driver
+            case Mode.record, Tape() as tape:
+                with open_live() as driver:
+                    yield cast(WebDriver, RecordingDriver(driver, tape))
+            case Mode.replay, Tape() as tape:
+                yield cast(WebDriver, ReplayDriver(tape))
+            case _:
+                raise ValueError(self)
+
+    async def fetch(self, uri: URI) -> bytes:
+        match self.mode, self.tape:
+            case Mode.live, _:
+                return await download(uri)
+            case Mode.record, Tape() as tape:
+                body = await download(uri)
+                tape.save_body(uri, body)
+                return body
+            case Mode.replay, Tape() as tape:
+                async with serve(tape) as proxy:
+                    return await download(uri, proxy=proxy)
+            case _:
+                raise ValueError(self)
+
+
+@asynccontextmanager
+async def serve(tape: Tape) -> AsyncGenerator[str, None]:
+    """
+    記録した HTTP レスポンスを返すローカルのプロキシサーバーを立てる
+
+    http のみ対応 (https の CONNECT は扱わない)
+    """
+
+    async def handle(request: web.Request) -> web.Response:
+        try:
+            return web.Response(body=tape.load_body(URI(str(request.url))))
+        except FileNotFoundError:
+            raise web.HTTPNotFound()
+
+    app = web.Application()
+    app.router.add_route("GET", "/{tail:.*}", handle)
+    async with serve_app(app) as root:
+        yield root
+
+
+@asynccontextmanager
+async def serve_app(app: web.Application) -> AsyncGenerator[str, None]:
+    """
+    `app` を空いているローカルのポートで動かし、その URL (http://host:port) を返す
+    """
+    runner = web.AppRunner(app)
+    await runner.setup()
+    try:
+        site = web.TCPSite(runner, "127.0.0.1", 0)
+        await site.start()
+        host, port = runner.addresses[0][:2]
+        yield f"http://{host}:{port}"
+    finally:
+        await runner.cleanup()
+
+
+@dataclass
+class RecordingDriver:
+    """
+    本物の WebDriver で `get` したページと iframe の内容を `Tape` に保存する
+    """
+
+    driver: WebDriver
+    tape: Tape
+
+    def get(self, url: str) -> None:
+        self.driver.get(url)
+
+        frames = []
+        frame_uris = []
+        for frame in self.driver.find_elements(by=By.XPATH, value="//iframe"):
+            self.driver.switch_to.frame(frame)
+            frames.append(self.driver.page_source)
+            frame_uris.append(URI(self.driver.execute_script("return document.URL")))
+            self.driver.switch_to.default_content()
+
+        self.tape.save_page(
+            {
+                "uri": URI(url),
+                "page_source": self.driver.page_source,
+                "frames": frames,
+                "frame_uris": frame_uris,
+            }
+        )
+
+    def __getattr__(self, name: str) -> Any:
+        return getattr(self.driver, name)
+
+
+@dataclass
+class ReplayDriver:
+    """
+    `Tape` に保存したページを返す WebDriver の代用品
+
+    XPath による要素の検索と、トップレベルの iframe への切り替えだけを扱う
+    """
+
+    tape: Tape
+    current_url: str = field(init=False, default="")
+    _page: Page | None = field(init=False, default=None)
+    _frame: int | None = field(init=False, default=None)
+
+    @property
+    def switch_to(self) -> ReplayDriver._SwitchTo:
+        return ReplayDriver._SwitchTo(self)
+
+    @property
+    def document_url(self) -> str:
+        """
+        今いるドキュメント (トップレベルか iframe) の URL
+        """
+        if self._page is None or self._frame is None:
+            return self.current_url
+        return self._page["frame_uris"][self._frame]
+
+    @property
+    def page_source(self) -> str:
+        if self._page is None:
+            return ""
+        if self._frame is None:
+            return self._page["page_source"]
+        return self._page["frames"][self._frame]
+
+    def get(self, url: str) -> None:
+        self._page = self.tape.load_page(URI(url))
+        self._frame = None
+        self.current_url = url
+
+    def find_elements(self, by: str = By.XPATH, value: str = "") -> list[ReplayElement]:
+        document = html.fromstring(self.page_source)
+        return ReplayElement._find(self, document, by, value)
+
+    def close(self) -> None:
+        self._page = None
+
+    @dataclass(frozen=True)
+    class _SwitchTo:
+        driver: ReplayDriver
+
+        def frame(self, frame: ReplayElement) -> None:
+            if frame.frame is None:
+                raise ValueError(frame)
+            self.driver._frame = frame.frame
+
+        def default_content(self) -> None:
+            self.driver._frame = None
+
+
+@dataclass(frozen=True)
+class ReplayElement:
+    driver: ReplayDriver
+    element: _Element
+    base_url: str
+    frame: int | None = None
+
+    @property
+    def text(self) -> str:
+        return " ".join("".join(cast(Iterable[str], self.element.itertext())).split())
+
+    def get_attribute(self, name: str) -> str | None:
+        value = self.element.get(name)
+        if value is not None and name in {"href", "src"}:
+            return urljoin(self.base_url, value)
+        return value
+
+    def find_elements(self, by: str = By.XPATH, value: str = "") -> list[ReplayElement]:
+        return ReplayElement._find(self.driver, self.element, by, value)
+
+    @staticmethod
+    def _find(driver: ReplayDriver, element: _Element, by: str, value: str) -> list[ReplayElement]:
+        if by != By.XPATH:
+            raise NotImplementedError(by)
+
+        found = cast(list[_Element], element.xpath(value))
+        base_url = driver.document_url
+        if driver._frame is not None:
+            return [ReplayElement(driver, e, base_url) for e in found]
+
+        iframes = cast(list[_Element], element.getroottree().xpath("//iframe"))
+        return [
+            ReplayElement(driver, e, base_url, iframes.index(e) if e in iframes else None)
+            for e in found
+        ]
@@ -1,7 +1,54 @@
+from collections.abc import Iterable
 from sqlite3 import Cursor
 
 from pkg_resources import resource_string
 
+from gobo.types import Notation
 
-def create_and_insert(cursor: Cursor) -> None:
+from .types import Spot
+
+
+def create_and_insert(cursor: Cursor, spots: Iterable[Spot]) -> None:
     cursor.executescript(resource_string(__name__, "spot.sql").decode("utf-8"))
+
+    for spot in spots:
+        cursor.execute(
+            """
+INSERT INTO spot_names
+(
+    spot_id, notation_id, spot_name
+)
+VALUES
+(
+    ?, ?, ?
+)
+            """,
+            (spot["id"], Notation.default.value, spot["name"]),
+        )
+        cursor.execute(
+            """
+INSERT INTO spot_addresses
+(
+    spot_id, spot_address
+)
+VALUES
+(
+    ?, ?
+)
+            """,
+            (spot["id"], spot["address"]),
+        )
+        if "uri" in spot:
+            cursor.execute(
+                """
+INSERT INTO spot_uris
+(
+    spot_id, spot_uri
+)
+VALUES
+(
+    ?, ?
+)
+                """,
+                (spot["id"], spot["uri"]),
+            )
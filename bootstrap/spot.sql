@@ -5,1474 +5,15 @@ CREATE TABLE spot_names
     spot_name TEXT NOT NULL,
     PRIMARY KEY(spot_id, notation_id)
 );
-INSERT INTO spot_names VALUES
-(207134, 0, '企画展「千葉の自然再発見　～銚子から見つめるカコ・イマそしてミライへ～」'),
-(207135, 0, '千葉県誕生150周年記念 　関東大震災100年企画展「関東大震災と館山」'),
-(207136, 0, '成田伝統芸能まつり秋の陣'),
-(207137, 0, 'ぽるぽろ（Play Learn Protect and Live with the Ocean）'),
-(207138, 0, '企画展「土に実りぬ―八街の１５０年―」'),
-(207139, 0, 'やちまた落花生まつり2023'),
-(207140, 0, '伊能忠敬記念館開館25周年特別展「描かれた日本～伊能図焼失100年目の再会～」'),
-(207141, 0, '日西墨友好の絆記念日事業'),
-(207142, 0, '鋸山・日本寺コンサート'),
-(207143, 0, '千葉県誕生150周年記念「田んぼアート in 山武市」稲刈りイベント'),
-(207144, 0, '「葛南地域５市で見つけた！夕焼け・夜景の名所フォトコンテスト」写真展'),
-(207145, 0, '「葛南地域５市で見つけた！夕焼け・夜景の名所フォトコンテスト」写真展'),
-(207146, 0, '「葛南地域５市で見つけた！夕焼け・夜景の名所フォトコンテスト」写真展'),
-(207147, 0, '「葛南地域５市で見つけた！夕焼け・夜景の名所フォトコンテスト」写真展'),
-(207148, 0, '「葛南地域５市で見つけた！夕焼け・夜景の名所フォトコンテスト」写真展'),
-(207149, 0, '県立中央博物館　特別展「よみがえるチバニアン期の古生物」'),
-(207150, 0, '県立美術館「房総の海をめぐる光と影とアート展」'),
-(208179, 0, '千葉県立関宿城博物館'),
-(208180, 0, '関根名人記念館'),
-(208181, 0, 'こうのとりの里'),
-(208182, 0, '清水公園'),
-(208183, 0, '櫻木神社'),
-(208184, 0, '野田市市民会館（旧茂木佐平治邸）'),
-(208185, 0, '興風会館'),
-(208186, 0, '野田市鈴木貫太郎記念館'),
-(208187, 0, '公益財団法人髙梨本家 上花輪歴史館'),
-(208188, 0, '赤城神社'),
-(208227, 0, '一茶双樹記念館'),
-(208228, 0, '近藤勇陣屋跡'),
-(208229, 0, '流山万華鏡ギャラリー＆ミュージアムと葉茶屋寺田園'),
-(208230, 0, '流山本町まちなかミュージアム'),
-(208231, 0, '浅間神社'),
-(208232, 0, '流山市立博物館'),
-(208233, 0, '運河水辺公園'),
-(208234, 0, 'こんぶくろ池自然博物公園'),
-(208235, 0, '紅龍山布施弁天東海寺'),
-(208236, 0, '旧吉田家住宅歴史公園'),
-(208237, 0, '北柏ふるさと公園'),
-(208238, 0, '農産物直売所かしわで'),
-(208239, 0, '道の駅　しょうなん'),
-(208240, 0, '旧手賀教会堂'),
-(208241, 0, '柏しょうなんゆめファーム'),
-(208242, 0, '龍光院・将門神社'),
-(208243, 0, 'あけぼの山農業公園'),
-(208244, 0, '蓬莱山弘誓院福満寺'),
-(208245, 0, '増尾城址総合公園'),
-(208246, 0, '手賀沼公園'),
-(208247, 0, '手賀沼親水広場・水の館'),
-(208248, 0, '我孫子市白樺文学館'),
-(208249, 0, '我孫子市杉村楚人冠記念館'),
-(208250, 0, '旧村川別荘'),
-(208251, 0, '日秀観音'),
-(208252, 0, '葺不合神社'),
-(208253, 0, '戸定が丘歴史公園（戸定邸・戸定歴史館）'),
-(208254, 0, '長谷山 本土寺'),
-(208255, 0, '矢切の渡し'),
-(208256, 0, '東漸寺'),
-(208257, 0, '松戸市立博物館'),
-(208258, 0, '野馬除土手'),
-(208259, 0, '浦安市郷土博物館'),
-(208260, 0, '旧医院'),
-(208261, 0, '三番瀬環境観察館'),
-(208262, 0, '旧大塚家住宅'),
-(208263, 0, '旧宇田川家住宅'),
-(208264, 0, '千葉県立現代産業科学館'),
-(208265, 0, '市川市行徳野鳥観察舎「あいねすと」'),
-(208266, 0, '日蓮宗大本山　中山法華経寺'),
-(208267, 0, '市川市動植物園'),
-(208268, 0, 'アイ・リンクタウン展望施設'),
-(208269, 0, '道の駅　いちかわ'),
-(208270, 0, '市立市川考古博物館'),
-(208271, 0, '行徳神輿ミュージアム'),
-(208272, 0, '白幡天神社'),
-(208273, 0, '小塚山フィールドアスレチック'),
-(208274, 0, '真間山　弘法寺'),
-(208275, 0, '葛飾八幡宮'),
-(208276, 0, '鎌ケ谷大仏'),
-(208277, 0, 'ファイターズ鎌ケ谷スタジアム'),
-(208278, 0, '貝柄山公園'),
-(208279, 0, '市制記念公園'),
-(208280, 0, '国史跡下総小金中野牧跡・捕込'),
-(208281, 0, '鎌ケ谷市郷土資料館'),
-(208282, 0, '白井そろばん博物館'),
-(208283, 0, 'ふなばし三番瀬海浜公園'),
-(208284, 0, 'ふなばしアンデルセン公園'),
-(208285, 0, 'ふなばしメグスパ'),
-(208286, 0, '千葉県立船橋県民の森'),
-(208287, 0, 'ふなばし三番瀬環境学習館'),
-(208288, 0, '農産物直売所 ふなっこ畑'),
-(208289, 0, '船橋大神宮（意富比神社）'),
-(208290, 0, '三番瀬みなとや'),
-(208291, 0, '京成バラ園'),
-(208292, 0, '道の駅 やちよ'),
-(208293, 0, '村上緑地公園'),
-(208294, 0, '萱田地区公園'),
-(208295, 0, 'ファーマーズマーケット「よったいよ」'),
-(208296, 0, '八千代市立郷土博物館'),
-(208297, 0, '正覚院（毘沙門天）'),
-(208298, 0, '長福寺（弁財天）'),
-(208299, 0, '妙徳寺（大黒天）'),
-(208300, 0, '妙光寺（吉祥天）'),
-(208301, 0, '東栄寺（福禄寿）'),
-(208302, 0, '貞福寺（恵比寿）'),
-(208303, 0, '観音寺（布袋尊）'),
-(208304, 0, '長福寺（寿老人）'),
-(208305, 0, '北総花の丘公園'),
-(208306, 0, '木下交流の杜歴史資料センター'),
-(208307, 0, '草深の森（そうふけのもり）'),
-(208308, 0, '谷津バラ園'),
-(208309, 0, '谷津干潟自然観察センター'),
-(208310, 0, 'フォレストアドベンチャー・千葉'),
-(208311, 0, '千葉市立郷土博物館'),
-(208312, 0, '千葉県立中央博物館'),
-(208313, 0, '千葉市立加曽利貝塚博物館'),
-(208314, 0, '富田さとにわ耕園'),
-(208315, 0, '千葉ウシノヒロバ'),
-(208316, 0, '千葉市動物公園'),
-(208317, 0, '千葉市科学館'),
-(208318, 0, '千葉市美術館'),
-(208319, 0, '千葉県立美術館'),
-(208320, 0, '千葉公園'),
-(208321, 0, 'TIPSTAR DOME CHIBA'),
-(208322, 0, 'フクダ電子アリーナ'),
-(208323, 0, 'ZOZOマリンスタジアム'),
-(208324, 0, '幕張メッセ'),
-(208325, 0, 'アクアリンクちば'),
-(208326, 0, 'ホキ美術館'),
-(208327, 0, '千葉港めぐり（ケーズハーバー）'),
-(208328, 0, '千葉ポートタワー'),
-(208329, 0, 'SUNSET BEACH PARK INAGE（稲毛海浜公園）'),
-(208330, 0, '昭和の森'),
-(208331, 0, '旧神谷傳兵衛稲毛別荘'),
-(208332, 0, '千葉市ゆかりの家・いなげ'),
-(208333, 0, '千葉御茶屋御殿跡'),
-(208334, 0, '千葉神社'),
-(208335, 0, '四街道市鹿放ヶ丘 ふれあいセンター'),
-(208336, 0, '佐倉ふるさと広場'),
-(208337, 0, '国立歴史民俗博物館'),
-(208338, 0, '佐倉城址公園'),
-(208339, 0, '佐倉市立美術館'),
-(208340, 0, '佐倉草ぶえの丘'),
-(208341, 0, '佐倉武家屋敷'),
-(208342, 0, '塚本刀剣美術館'),
-(208343, 0, '佐倉順天堂記念館'),
-(208344, 0, '旧堀田邸（さくら庭園）'),
-(208345, 0, '麻賀多神社'),
-(208346, 0, 'ひよどり坂'),
-(208347, 0, 'DIC川村記念美術館'),
-(208348, 0, '千葉県立房総のむら'),
-(208349, 0, 'コスプレの館'),
-(208350, 0, '龍角寺古墳群・岩屋古墳'),
-(208351, 0, '龍角寺'),
-(208352, 0, '大鷲神社'),
-(208353, 0, '飯沼本家 きのえねまがり家'),
-(208354, 0, '本佐倉城跡'),
-(208355, 0, 'しすい・ハーブガーデン'),
-(208356, 0, '成田山新勝寺'),
-(208357, 0, '成田ゆめ牧場'),
-(208358, 0, '宗吾霊堂'),
-(208359, 0, '空の駅 さくら館'),
-(208360, 0, '成田市さくらの山'),
-(208361, 0, '成田空港'),
-(208362, 0, 'からくり時計'),
-(208363, 0, '成田観光館'),
-(208364, 0, '坂田ヶ池総合公園'),
-(208365, 0, '三里塚御料牧場記念館'),
-(208366, 0, '下総歴史民俗資料館'),
-(208367, 0, '新生成田市場（成田市公設地方卸売市場）'),
-(208368, 0, '八街市推奨の店　ぼっち'),
-(208369, 0, '八街市郷土資料館'),
-(208370, 0, '観光・交流拠点施設「末廣農場」'),
-(208371, 0, '富里鎮守　香取神社'),
-(208372, 0, '旧岩崎久彌末廣農場別邸公園'),
-(208373, 0, '三谷胤政供養塔'),
-(208374, 0, '道の駅　発酵の里こうざき'),
-(208375, 0, '神崎神社（なんじゃもんじゃの木）'),
-(208376, 0, 'こうざき天の川公園'),
-(208377, 0, '西の城貝塚'),
-(208378, 0, '水郷佐原山車会館'),
-(208379, 0, '佐原町並み交流館・佐原三菱館'),
-(208380, 0, 'さわら町屋館（上川岸小公園）'),
-(208381, 0, '水郷佐原あやめパーク'),
-(208382, 0, '道の駅・川の駅　水の郷さわら'),
-(208383, 0, 'やます蔵 風土村'),
-(208384, 0, '香取神宮'),
-(208385, 0, '道の駅　くりもと紅小町の郷'),
-(208386, 0, '観福寺'),
-(208387, 0, '伊能忠敬記念館'),
-(208388, 0, '伊能忠敬旧宅'),
-(208389, 0, '府馬の大クス'),
-(208390, 0, '天保水滸伝遺品館/諏訪神社'),
-(208391, 0, '千葉県立東庄県民の森'),
-(208392, 0, '延命寺'),
-(208393, 0, '福聚寺'),
-(208394, 0, '犬吠埼灯台'),
-(208395, 0, '屏風ケ浦/銚子マリーナ海水浴場'),
-(208396, 0, 'ウオッセ21'),
-(208397, 0, '銚子ポートタワー'),
-(208398, 0, '地球の丸く見える丘展望館'),
-(208399, 0, '外川町の町並み'),
-(208400, 0, '銚子ジオパークミュージアム'),
-(208401, 0, '猿田神社'),
-(208402, 0, '妙見宮　妙福寺'),
-(208403, 0, '飯沼観音（圓福寺）'),
-(208404, 0, '外川ミニ郷土資料館'),
-(208405, 0, '旧公正会館'),
-(208406, 0, '銚子ちぢみ伝統工芸館'),
-(208407, 0, '道の駅　多古あじさい館'),
-(208408, 0, '澁谷嘉助旧宅正門'),
-(208409, 0, '妙印山　妙光寺'),
-(208410, 0, '多古町魅力発信交流館「たこらぼ」'),
-(208411, 0, '木内家住宅'),
-(208412, 0, '土橋山東禅寺'),
-(208413, 0, 'おひさまテラス'),
-(208414, 0, '大原幽学記念館'),
-(208415, 0, '旭市防災資料館'),
-(208416, 0, '玉﨑神社'),
-(208417, 0, '中央児童遊園'),
-(208418, 0, '東漸寺'),
-(208419, 0, '芝山町立芝山古墳・はにわ博物館'),
-(208420, 0, '航空科学博物館'),
-(208421, 0, '道の駅 　風和里しばやま'),
-(208422, 0, 'ひこうきの丘'),
-(208423, 0, 'グリーンポートエコ・アグリパーク'),
-(208424, 0, '空の駅　風和里しばやま'),
-(208425, 0, '松山神社'),
-(208426, 0, '八重垣神社'),
-(208427, 0, '八日市場東照宮'),
-(208428, 0, '老尾神社'),
-(208429, 0, '曾我兄弟の墓'),
-(208430, 0, '西小笹八幡神社'),
-(208431, 0, '野栄ふれあい公園'),
-(208432, 0, '天神山公園'),
-(208433, 0, '飯高檀林跡（飯高寺）'),
-(208434, 0, '松山庭園美術館'),
-(208435, 0, 'ふれあいパーク八日市場'),
-(208436, 0, 'そうさ観光物産センター　匝りの里'),
-(208437, 0, '安久山のスダジイ'),
-(208438, 0, '坂田城跡'),
-(208439, 0, 'マリンピアくりやまがわ'),
-(208440, 0, '成田山御本尊 上陸の地'),
-(208441, 0, '横芝駅前情報交流館「ヨリドコロ」'),
-(208442, 0, '広済寺'),
-(208443, 0, '道の駅　オライはすぬま'),
-(208444, 0, '浪切不動院（成東山不動院長勝寺）'),
-(208445, 0, '伊藤左千夫の生家（山武市歴史民俗資料館）'),
-(208446, 0, '蓮沼海浜公園'),
-(208447, 0, 'さんぶの森公園'),
-(208448, 0, '雄蛇ヶ池'),
-(208449, 0, '山王台公園'),
-(208450, 0, '日吉神社'),
-(208451, 0, '最福寺'),
-(208452, 0, 'ときがね湖（東金ダム）'),
-(208453, 0, '道の駅　みのりの郷東金'),
-(208454, 0, '小中池公園'),
-(208455, 0, '十枝の森'),
-(208456, 0, '宮谷八幡神社'),
-(208457, 0, '縣神社'),
-(208458, 0, '海の駅　九十九里'),
-(208459, 0, '伊能忠敬記念公園（伊能忠敬出生地）'),
-(208460, 0, '宮島池親水公園'),
-(208461, 0, '九十九里ハーブガーデン'),
-(208462, 0, 'Sghr 菅原工芸硝子'),
-(208463, 0, '市原湖畔美術館'),
-(208464, 0, '養老渓谷'),
-(208465, 0, '飯香岡八幡宮'),
-(208466, 0, '養老川臨海公園'),
-(208467, 0, '史跡上総国分尼寺跡展示館'),
-(208468, 0, '道の駅　あずの里いちはら'),
-(208469, 0, 'こみなと待合室'),
-(208470, 0, '西願寺'),
-(208471, 0, '千葉こどもの国キッズダム'),
-(208472, 0, 'チバニアンビジターセンター'),
-(208473, 0, 'ANIMAL WONDER REZOURT 市原ぞうの国'),
-(208474, 0, 'Toilet in Nature／飯給駅'),
-(208475, 0, '長柄ダム'),
-(208476, 0, '史跡長柄横穴群'),
-(208477, 0, '道の駅　ながら'),
-(208478, 0, '大田中将顕彰碑'),
-(208479, 0, 'フォレストアドベンチャー・ターザニア'),
-(208480, 0, '掩体壕'),
-(208481, 0, '白子神社'),
-(208482, 0, '袖ケ浦公園'),
-(208483, 0, '東京ドイツ村'),
-(208484, 0, '袖ケ浦海浜公園'),
-(208485, 0, '袖ケ浦市農畜産物直売所「ゆりの里」'),
-(208486, 0, '百目木公園'),
-(208487, 0, '袖ケ浦ふれあいどうぶつ縁'),
-(208488, 0, '袖ケ浦市郷土博物館'),
-(208489, 0, 'ひらおかの里農村公園'),
-(208490, 0, '野見金公園'),
-(208491, 0, '熊野の清水'),
-(208492, 0, '笠森観音（笠森寺観音堂）'),
-(208493, 0, '長南集学校'),
-(208494, 0, '道の駅　むつざわつどいの郷'),
-(208495, 0, '諏訪神社'),
-(208496, 0, '鵜羽神社'),
-(208497, 0, 'お寺カフェそわか'),
-(208498, 0, '長生観音'),
-(208499, 0, '一松神社'),
-(208500, 0, '尼ヶ台総合公園'),
-(208501, 0, '釣ヶ崎海岸'),
-(208502, 0, '上総国一之宮　玉前神社'),
-(208503, 0, '證誠寺'),
-(208504, 0, '八剱八幡神社'),
-(208505, 0, 'チーバくんプラザ-千葉県観光情報館-'),
-(208506, 0, '高倉観音（高蔵寺）'),
-(208507, 0, '木更津市郷土博物館金のすず'),
-(208508, 0, '木更津かんらんしゃパーク　キサラピア'),
-(208509, 0, '道の駅　木更津うまくたの里'),
-(208510, 0, '鳥居崎海浜公園'),
-(208511, 0, 'かずさアーク'),
-(208512, 0, 'きみさらずタワー／太田山公園'),
-(208513, 0, '燈籠坂大師の切通しトンネル'),
-(208514, 0, 'マザー牧場'),
-(208515, 0, '明治百年記念展望塔'),
-(208516, 0, '金谷港'),
-(208517, 0, '鋸山ロープウェー'),
-(208518, 0, '岩谷観音堂やぐら群'),
-(208519, 0, '鋸山美術館'),
-(208520, 0, 'ザ・フィッシュ'),
-(208521, 0, '小泉酒造合資会社ソムリエハウス酒匠の館'),
-(208522, 0, '東京湾観音'),
-(208523, 0, '富津元洲堡塁砲台（中の島）'),
-(208524, 0, '富津公園'),
-(208525, 0, '久留里城（君津市立久留里城址資料館）'),
-(208526, 0, '九十九谷展望公園'),
-(208527, 0, '清水渓流広場（濃溝の滝・亀岩の洞窟）'),
-(208528, 0, 'はちみつとミードのはちみつ工房'),
-(208529, 0, '亀山湖'),
-(208530, 0, '鹿野山　神野寺'),
-(208531, 0, '猟師工房ドライブイン'),
-(208532, 0, 'ドリプレ・ローズガーデン'),
-(208533, 0, 'カズサの郷 愛彩畑'),
-(208534, 0, '君津市久留里観光交流センター'),
-(208535, 0, '渡辺家住宅'),
-(208536, 0, '釜屋（旧江澤邸）'),
-(208537, 0, '道の駅　たけゆらの里おおたき'),
-(208538, 0, '山の駅 養老渓谷 喜楽里'),
-(208539, 0, '粟又の滝'),
-(208540, 0, '大多喜ハーブガーデン'),
-(208541, 0, '天然ガス記念館'),
-(208542, 0, 'ポッポの丘'),
-(208543, 0, '千葉県いすみ環境と文化のさとセンター'),
-(208544, 0, '国吉神社・上総出雲大社'),
-(208545, 0, '鋸山 日本寺（地獄のぞき）'),
-(208546, 0, '都市交流施設・道の駅 保田小学校'),
-(208547, 0, '佐久間ダム湖親水公園'),
-(208548, 0, '江月水仙ロード'),
-(208549, 0, '保田海水浴場'),
-(208550, 0, '道の駅　きょなん'),
-(208551, 0, 'をくづれ水仙郷'),
-(208552, 0, '保田漁協ばんや'),
-(208553, 0, '鴨川シーワールド'),
-(208554, 0, '大山千枚田'),
-(208555, 0, '鯛の浦遊覧船'),
-(208556, 0, '誕生寺'),
-(208557, 0, '大本山　清澄寺'),
-(208558, 0, '道の駅　鴨川オーシャンパーク'),
-(208559, 0, '菜な畑ロード'),
-(208560, 0, '潮騒市場'),
-(208561, 0, '魚見塚展望台'),
-(208562, 0, '四方木不動滝'),
-(208563, 0, '鴨川ウォールアート'),
-(208564, 0, '鴨川市郷土資料館'),
-(208565, 0, '大山寺不動尊'),
-(208566, 0, '鵜原海岸（白い鳥居）'),
-(208567, 0, 'SGT美術館'),
-(208568, 0, '八幡岬公園'),
-(208569, 0, '官軍塚'),
-(208570, 0, 'かつうら海中公園'),
-(208571, 0, '千葉県立中央博物館分館　海の博物館'),
-(208572, 0, 'JAXA勝浦宇宙通信所'),
-(208573, 0, '勝浦朝市'),
-(208574, 0, '守谷海岸（渡島）'),
-(208575, 0, '高照寺'),
-(208576, 0, '遠見岬神社'),
-(208577, 0, '月の沙漠記念館'),
-(208578, 0, '道の駅　とみうら枇杷倶楽部'),
-(208579, 0, '道の駅　富楽里とみやま'),
-(208580, 0, '道の駅　おおつの里花俱楽部'),
-(208581, 0, '道の駅　三芳村鄙の里'),
-(208582, 0, '道の駅　和田浦WA・O！'),
-(208583, 0, '道の駅　ローズマリー公園'),
-(208584, 0, '道の駅　ちくら潮風王国'),
-(208585, 0, '道の駅　白浜野島崎'),
-(208586, 0, '野島埼灯台'),
-(208587, 0, '岡本桟橋（原岡桟橋）'),
-(208588, 0, '最果てのベンチ［ラバーズベンチ］'),
-(208589, 0, '抱湖園（元朝桜）'),
-(208590, 0, '千葉県　酪農のさと'),
-(208591, 0, '花嫁街道　黒滝'),
-(208592, 0, '大房岬自然公園（ビジターセンター）'),
-(208593, 0, '白浜海洋美術館'),
-(208594, 0, '白浜城'),
-(208595, 0, '伏姫籠穴'),
-(208596, 0, '南房千倉大橋（公園）'),
-(208597, 0, 'シラハマ校舎'),
-(208598, 0, '白間津のお花畑'),
-(208599, 0, '沖ノ島公園'),
-(208600, 0, '"渚の駅"たてやま'),
-(208601, 0, '城山公園'),
-(208602, 0, '館山海軍航空隊 赤山地下壕跡'),
-(208603, 0, '道の駅 南房パラダイス/アロハガーデンたてやま'),
-(208604, 0, '大福寺（崖観音）'),
-(208605, 0, '安房高野山　妙音院'),
-(208606, 0, '洲埼灯台'),
-(208607, 0, '青木繁「海の幸」記念館'),
-(208608, 0, 'ギャラリー ＆ カフェ　船形倉庫'),
-(208609, 0, '飛ノ台史跡公園博物館'),
-(208610, 0, '大多喜城（県立中央博物館大多喜城分館）'),
-(208611, 0, '光明寺'),
-(208612, 0, '茜浜緑地（関東富士見百景）'),
-(208613, 0, '旧鴇田家住宅'),
-(208614, 0, '旧大沢家住宅'),
-(208615, 0, '有森裕子記念碑'),
-(208616, 0, '鈴木大地記念碑'),
-(208617, 0, '山縣飛行士殉空之地碑'),
-(208618, 0, 'ドイツ捕虜オーケストラの碑'),
-(208619, 0, '千葉工業大学通用門（旧陸軍鉄道第二聯隊表門）'),
-(208620, 0, '東身延 本山 藻原寺'),
-(208621, 0, '飯縄寺'),
-(208622, 0, '館山ジビエセンター'),
-(208623, 0, '市原歴史博物館'),
-(208624, 0, '菱川師宣記念館'),
-(208625, 0, '道の駅 ふれあいパーク・きみつ'),
-(208626, 0, 'ウミガメの丘'),
-(208627, 0, '稲花酒造'),
-(208628, 0, '延命寺観音堂'),
-(208629, 0, '蔵の図書館'),
-(208630, 0, '寝釈迦'),
-(208631, 0, '市川市行徳ふれあい伝承館'),
-(208632, 0, '野菊の墓文学碑（西蓮寺）'),
-(208633, 0, '旧井上家住宅'),
-(208634, 0, 'ヤマサ醤油 しょうゆ味わい体験館'),
-(208635, 0, '妙楽寺'),
-(208636, 0, '皇産靈神社'),
-(208637, 0, 'メキシコ記念公園（日西墨三国交通発祥記念之碑）'),
-(208638, 0, '鶴谷八幡宮'),
-(208639, 0, '光福寺'),
-(208640, 0, '長福寺'),
-(208641, 0, '三島神社'),
-(208642, 0, '龍腹寺'),
-(208643, 0, '龍尾寺'),
-(208644, 0, '喫茶さくら'),
-(208645, 0, '中央公園'),
-(208646, 0, '三舟山'),
-(208647, 0, '髙瀧神社'),
-(208648, 0, '音楽と珈琲の店　岬'),
-(208649, 0, 'ホテルスプリングス幕張'),
-(208650, 0, 'おゆみ野四季のみち'),
-(208651, 0, 'メッセモール'),
-(208652, 0, 'さつきが丘名店街'),
-(208653, 0, '東金青年の森公園'),
-(208654, 0, '公津の杜コミュニティセンター（もりんぴあこうづ）'),
-(208655, 0, '船橋港親水公園'),
-(208656, 0, '海老川ジョギングロード'),
-(208657, 0, '船橋市民文化ホール'),
-(208658, 0, '根本海水浴場'),
-(208659, 0, '多田良北浜海水浴場'),
-(208660, 0, '榎町商店街'),
-(208661, 0, '成田山公園'),
-(208662, 0, '八日市場本町通り商店街の町並み'),
-(208663, 0, '大土手山（ルボン山）'),
-(209281, 0, '我孫子インフォメーションセンター（アビシルベ）'),
-(209282, 0, 'JA富里市産直センター'),
-(209283, 0, '銚子セレクト市場'),
-(209284, 0, '上永井公園（飯岡灯台、飯岡刑部岬展望館）'),
-(209285, 0, '道の駅　季楽里あさひ'),
-(209286, 0, 'JR横芝駅舎'),
-(209287, 0, '海ほたるパーキングエリア'),
-(209288, 0, '太東埼灯台'),
-(209289, 0, '夫婦岩'),
-(209290, 0, '万木城跡公園'),
-(209291, 0, '大原公園「平和の鐘」'),
-(209292, 0, '源頼朝上陸地'),
-(209293, 0, '里のMUJI みんなみの里'),
-(209294, 0, '檀特山 小松寺'),
-(209295, 0, '高家神社'),
-(209296, 0, '下総国 柏鎮守 諏訪神社'),
-(209297, 0, '布鎌惣社水神社'),
-(209298, 0, '八鶴湖'),
-(209460, 0, '大原漁港 港の朝市'),
-(209461, 0, '真野寺'),
-(210057, 0, '仁右衛門島'),
-(210058, 0, '市川市東山魁夷記念館'),
-(210059, 0, '殿塚・姫塚'),
-(210060, 0, '屋形四社神社'),
-(210061, 0, '町原大銀杏'),
-(210062, 0, '山武姥山貝塚'),
-(210663, 0, '椿ノ海水神社');
 
 CREATE TABLE spot_uris
 (
     spot_id INTEGER PRIMARY KEY,
     spot_uri TEXT NOT NULL
 );
-INSERT INTO spot_uris VALUES
-(207134, 'https://www.city.choshi.chiba.jp/edu/sg-guide/index.html'),
-(207135, 'https://www.city.tateyama.chiba.jp/hakubutukan/page100065.html'),
-(207136, 'http://www.nrtk.jp/enjoy/shikisaisai/traditional-performing-arts.html'),
-(207137, 'https://www.city.asahi.lg.jp/soshiki/30/21573.html'),
-(207138, 'https://www.city.yachimata.lg.jp/soshiki/39/'),
-(207139, 'https://www.city.yachimata.lg.jp/soshiki/20/37204.html'),
-(207140, 'https://www.city.katori.lg.jp/sightseeing/museum/index.html'),
-(207141, 'https://www.town.onjuku.chiba.jp/sub4/3/mexico_kinentou1.html'),
-(207143, 'https://chiba150th-tamboart.com/'),
-(207144, 'https://www.pref.chiba.lg.jp/kc-katsunan/event/2023/photocontest.html'),
-(207145, 'https://www.pref.chiba.lg.jp/kc-katsunan/event/2023/photocontest.html'),
-(207146, 'https://www.pref.chiba.lg.jp/kc-katsunan/event/2023/photocontest.html'),
-(207147, 'https://www.pref.chiba.lg.jp/kc-katsunan/event/2023/photocontest.html'),
-(207148, 'https://www.pref.chiba.lg.jp/kc-katsunan/event/2023/photocontest.html'),
-(207149, 'http://www2.chiba-muse.or.jp/NATURAL/'),
-(207150, 'http://www2.chiba-muse.or.jp/ART/'),
-(208179, 'http://www2.chiba-muse.or.jp/www/SEKIYADO/index.html'),
-(208180, 'https://www.city.noda.chiba.jp/shisetsu/bunka/1028434.html'),
-(208181, 'https://www.city.noda.chiba.jp/shisetsu/etc/1001113.html'),
-(208182, 'https://www.shimizu-kouen.com/'),
-(208183, 'https://sakuragi.info/'),
-(208184, 'https://noda-muse.jp/'),
-(208185, 'https://www.kouhoo1929.or.jp/'),
-(208186, 'https://www.city.noda.chiba.jp/kantaro_museum/index.html'),
-(208187, 'https://kamihanawa.jp/'),
-(208188, 'https://nagareyamakankou.com/tourism-information/akagi-2/'),
-(208227, 'https://nagareyama-td.com/issasouju/'),
-(208228, 'https://nagareyamakankou.com/tourism-information/kondo-isami-3/'),
-(208229, 'https://nagareyama-td.com/misegura/'),
-(208230, 'https://nagareyamakankou.com/tourism-information/machinaka-museum-2/'),
-(208231, 'https://nagareyamakankou.com/tourism-information/asama/'),
-(208232, 'https://www.city.nagareyama.chiba.jp/life/1001780/1001785/index.html'),
-(208233, 'https://www.city.nagareyama.chiba.jp/institution/1004355/1004357/1004358.html'),
-(208234, 'https://www.konbukuroike.com/'),
-(208235, 'https://www.fusebenten.com/'),
-(208236, 'http://former-yoshida.jp/'),
-(208237, 'https://www.city.kashiwa.lg.jp/facilities/park/kitakashiwa.html'),
-(208238, 'http://www.kasiwade.com/'),
-(208239, 'https://www.michinoeki-shonan.jp/'),
-(208240, 'https://www.city.kashiwa.lg.jp/bunka/about_kashiwa/culture/rekishi/shiteibunkazai/ken/kyokaido.html'),
-(208241, 'https://www.yumefarm.jp/'),
-(208242, 'https://kankou.kashiwa-cci.or.jp/spots/masakado-jinjya/'),
-(208243, 'https://www.akebonoyama-nougyoukouen.jp/'),
-(208244, 'https://kankou.kashiwa-cci.or.jp/spots/guzein/'),
-(208245, 'https://www.city.kashiwa.lg.jp/facilities/park/masuojoshi.html'),
-(208246, 'https://www.city.abiko.chiba.jp/event/shizennonaka/kouenryokuchi/park/citypark/teganuma.html'),
-(208247, 'https://www.abiko831.jp/'),
-(208248, 'https://www.city.abiko.chiba.jp/event/shiseki_bunkazai/shirakaba/'),
-(208249, 'https://www.city.abiko.chiba.jp/event/shiseki_bunkazai/sugimurasojinkan/'),
-(208250, 'https://www.city.abiko.chiba.jp/event/shiseki_bunkazai/kyu_murakawa/'),
-(208251, 'https://jiminzan.com/'),
-(208252, 'https://www.city.abiko.chiba.jp/kouko/siteibunkazai/hukiaezu.html'),
-(208253, 'https://www.city.matsudo.chiba.jp/tojo/index.html'),
-(208254, 'https://www.hondoji.net/index.html'),
-(208255, 'https://www.city.matsudo.chiba.jp/miryoku/kankoumiryokubunka/odekakemap/sanpo-map/yakiri-nogiku.html'),
-(208256, 'http://tozenji.life.coocan.jp/index.html'),
-(208257, 'https://www.city.matsudo.chiba.jp/m_muse/'),
-(208258, 'https://66map.main.jp/p5/p5-07/p5-07-01'),
-(208259, 'https://www.city.urayasu.lg.jp/kanko/kyodo/index.html'),
-(208260, 'https://www.city.urayasu.lg.jp/shisetsu/bunka/bunka/1005591.html'),
-(208261, 'https://www.ces-net.jp/sanbanze/'),
-(208262, 'https://www.urayasu-zaidan.or.jp/bunkazai/index.html'),
-(208263, 'https://www.urayasu-zaidan.or.jp/bunkazai/index.html'),
-(208264, 'http://www2.chiba-muse.or.jp/SCIENCE/'),
-(208265, 'https://www.city.ichikawa.lg.jp/env09/1111000028.html'),
-(208266, 'https://temple.nichiren.or.jp/1041026-hokekyoji/'),
-(208267, 'https://www.city.ichikawa.lg.jp/zoo/'),
-(208268, 'https://www.city.ichikawa.lg.jp/eco04/1111000055.html'),
-(208269, 'https://www.michinoeki-ichikawa.jp/'),
-(208270, 'https://www.city.ichikawa.lg.jp/edu14/'),
-(208271, 'http://www.mikoshiya.com/museum/'),
-(208272, 'https://www.shirahatatenjinsya.com/'),
-(208273, 'https://www.city.ichikawa.lg.jp/gre04/1111000002.html'),
-(208274, 'http://mamasan.or.jp/'),
-(208275, 'https://www.katsushikahachimangu.com/'),
-(208276, 'http://www.kama-navi.jp/spot/history/shiteibunkazai/1396502320519.html'),
-(208277, 'https://www.fighters.co.jp/stadium/kamagaya/'),
-(208278, 'http://www.city.kamagaya.chiba.jp/sisetsu/park/kaigarayama.html'),
-(208279, 'http://www.city.kamagaya.chiba.jp/sisetsu/park/shiseikinen.html'),
-(208280, 'http://www.kama-navi.jp/spot/history/shiteibunkazai/1396497581166.html'),
-(208281, 'https://www.city.kamagaya.chiba.jp/sisetsu/kyoudo_2/index.html'),
-(208282, 'https://soroban-muse.com/'),
-(208283, 'https://www.sambanze.jp/'),
-(208284, 'https://www.park-funabashi.or.jp/and/'),
-(208285, 'https://f-meguspa.jp/'),
-(208286, 'http://funabashi-mori.jp/'),
-(208287, 'https://www.sambanze.jp/'),
-(208288, 'http://www.ja-chibatoukatu.or.jp/directsales/'),
-(208289, 'http://www.oohijinja.jp/'),
-(208290, 'http://www.funabashi-gyokyou.jp/minatoya'),
-(208291, 'https://www.keiseirose.co.jp/garden/'),
-(208292, 'http://yachiyo-agri.org/'),
-(208293, 'https://www.city.yachiyo.lg.jp/soshiki/46/4035.html'),
-(208294, 'https://yachiyo-park.jp/kayadachiku-park/'),
-(208295, 'http://www.ja-yachiyo.or.jp/farmers_market/farmers_market.html'),
-(208296, 'https://www.yachiyo.ed.jp/yachiyo/sosiki/rekisi/'),
-(208297, 'https://www.yachiyo-kankou.com/spot/hachifukujin/'),
-(208298, 'https://www.yachiyo-kankou.com/spot/hachifukujin/'),
-(208299, 'https://www.yachiyo-kankou.com/spot/hachifukujin/'),
-(208300, 'https://www.yachiyo-kankou.com/spot/hachifukujin/'),
-(208301, 'https://www.yachiyo-kankou.com/spot/hachifukujin/'),
-(208302, 'https://www.yachiyo-kankou.com/spot/hachifukujin/'),
-(208303, 'https://www.yachiyo-kankou.com/spot/hachifukujin/'),
-(208304, 'https://www.yachiyo-kankou.com/spot/hachifukujin/'),
-(208305, 'https://www.seibu-la.co.jp/hokusou/'),
-(208306, 'https://www.city.inzai.lg.jp/0000005283.html'),
-(208307, 'https://www.city.inzai.lg.jp/0000013226.html'),
-(208308, 'http://www.yatsu-rosegarden.jp/'),
-(208309, 'https://www.seibu-la.co.jp/yatsuhigata/'),
-(208310, 'https://fa-chiba.foret-aventure.jp/'),
-(208311, 'https://www.city.chiba.jp/kyodo/'),
-(208312, 'http://www.chiba-muse.or.jp/NATURAL/'),
-(208313, 'https://www.city.chiba.jp/kasori/'),
-(208314, 'http://www.tomita-kan.jp/'),
-(208315, 'https://ushinohiroba.com/'),
-(208316, 'https://www.city.chiba.jp/zoo/'),
-(208317, 'https://www.kagakukanq.com/'),
-(208318, 'https://www.ccma-net.jp/'),
-(208319, 'http://www2.chiba-muse.or.jp/ART/'),
-(208320, 'https://www.city.chiba.jp/toshi/koenryokuchi/kanri/chuo-mihama/chibakouen.html'),
-(208321, 'https://www.pist6.com/'),
-(208322, 'https://sogasportspark.com/'),
-(208323, 'https://www.marines.co.jp/'),
-(208324, 'https://www.m-messe.co.jp/'),
-(208325, 'http://www.aquarink-chiba.jp/'),
-(208326, 'https://www.hoki-museum.jp/'),
-(208327, 'http://ksnetwork.co.jp/'),
-(208328, 'https://chiba-porttower.com/'),
-(208329, 'https://sunsetbeachpark.jp/'),
-(208330, 'https://www.showanomori.jp/'),
-(208331, 'https://galleryinage.jp/'),
-(208332, 'https://www.city.chiba.jp/kyoiku/shogaigakushu/bunkazai/yukarinoieinage.html'),
-(208333, 'https://www.city.chiba.jp/kyoiku/shogaigakushu/bunkazai/ochayagoten.html'),
-(208334, 'https://www.chibajinja.com/'),
-(208335, 'http://yotsu-foundation.or.jp/fureai/index.php'),
-(208336, 'https://www.sakurashi-kankou.or.jp/facility/furusato/'),
-(208337, 'https://www.rekihaku.ac.jp/'),
-(208338, 'https://www.city.sakura.lg.jp/soshiki/koenryokuchika/3/13/4609.html#wrapper'),
-(208339, 'https://www.city.sakura.lg.jp/section/museum/'),
-(208340, 'https://www.city.sakura.lg.jp/section/kusabue/'),
-(208341, 'https://www.city.sakura.lg.jp/soshiki/bunkaka/bunkazai/buke/3032.html'),
-(208342, 'https://www.city.sakura.lg.jp/soshiki/sakuranomiryoku/1/3036.html'),
-(208343, 'https://www.city.sakura.lg.jp/soshiki/bunkaka/bunkazai/juntendou/5797.html'),
-(208344, 'https://www.city.sakura.lg.jp/soshiki/bunkaka/bunkazai/hotta/4595.html'),
-(208345, 'http://www.makata.jp/'),
-(208346, 'https://www.city.sakura.lg.jp/soshiki/sakuranomiryoku/1/3599.html'),
-(208347, 'https://kawamura-museum.dic.co.jp/'),
-(208348, 'http://www2.chiba-muse.or.jp/MURA/'),
-(208349, 'http://www.town.sakae.chiba.jp/news.php?type=8'),
-(208350, 'https://www.pref.chiba.lg.jp/kyouiku/bunkazai/bunkazai/n411-017.html'),
-(208351, 'https://www.town.sakae.chiba.jp/page/page005873.html'),
-(208352, 'https://www.town.sakae.chiba.jp/page/page001249.html'),
-(208353, 'https://www.iinumahonke.co.jp/lp/shisui-magariya'),
-(208354, 'https://www.town.shisui.chiba.jp/docs/2017120600025/'),
-(208355, 'https://www.town.shisui.chiba.jp/docs/2017112200059/'),
-(208356, 'https://www.naritasan.or.jp/'),
-(208357, 'https://www.yumebokujo.com/'),
-(208358, 'http://sougo.frenchkiss.jp/'),
-(208359, 'https://www.soranoekisakurakan.com/'),
-(208360, 'https://www.soranoekisakurakan.com/'),
-(208361, 'https://www.narita-airport.jp/jp/'),
-(208362, 'https://www.nrtk.jp/news/20181007.html'),
-(208363, 'http://www.nrtk.jp/mypage/00109.html'),
-(208364, 'https://www.city.narita.chiba.jp/shisetsu/page000195.html'),
-(208365, 'https://www.city.narita.chiba.jp/bunka_sports/page205700.html'),
-(208366, 'https://www.city.narita.chiba.jp/shisetsu/page000176.html'),
-(208367, 'https://www.city.narita.chiba.jp/business/page0139_00039.html'),
-(208368, 'https://www.city.yachimata.lg.jp/site/peanuts/43.html'),
-(208369, 'https://www.city.yachimata.lg.jp/soshiki/39/'),
-(208370, 'https://suehiro-gs.com/'),
-(208371, 'http://tomisatokatori.com/'),
-(208372, 'https://www.city.tomisato.lg.jp/0000013134.html'),
-(208373, 'https://www.city.tomisato.lg.jp/0000001199.html'),
-(208374, 'https://www.hakkounosato.com/'),
-(208375, 'https://www.pref.chiba.lg.jp/kyouiku/bunkazai/bunkazai/n431-005.html'),
-(208376, 'https://www.town.kozaki.chiba.jp/kanko_iju/kanko/park.html'),
-(208377, 'https://www.town.kozaki.chiba.jp/kanko_iju/kanko/history.html'),
-(208378, 'https://www.city.katori.lg.jp/smph/sightseeing/matsuri/dashikaikan/'),
-(208379, 'https://sawara-machinami.com/'),
-(208380, 'https://www.nipponia-sawara.com/uwagashi/'),
-(208381, 'https://ayamepark.jp/'),
-(208382, 'http://www.e-sawara.com/'),
-(208383, 'http://www.yamasu.com/foodmura/'),
-(208384, 'https://katori-jingu.or.jp/'),
-(208385, 'https://www.benikomachi.jp/'),
-(208386, 'http://kanpukuji.or.jp/'),
-(208387, 'https://www.city.katori.lg.jp/smph/sightseeing/museum/index.html'),
-(208388, 'https://www.city.katori.lg.jp/smph/sightseeing/museum/index.html'),
-(208389, 'https://www.city.katori.lg.jp/smph/sightseeing/meisho/rekishi/kusu.html'),
-(208390, 'https://www.tohnosho-kanko.jp/spot/tenposuikodenihinkan/'),
-(208391, 'http://tonosho-mori.jp/'),
-(208392, 'https://www.tohnosho-kanko.jp/spot/enmeiji/'),
-(208393, 'https://www.tohnosho-kanko.jp/spot/fukusyuuji/'),
-(208394, 'https://www.tokokai.org/tourlight/tourlight03/'),
-(208395, 'https://www.choshi-geopark.jp/geosite/22/index.html'),
-(208396, 'http://www.wosse21.net/'),
-(208397, 'http://www.wosse21.net/porttower.html'),
-(208398, 'https://www.choshikanko.com/tenbokan/'),
-(208400, 'https://www.choshi-geopark.jp/'),
-(208401, 'https://www.choshikanko.com/kankoDB/%E7%8C%BF%E7%94%B0%E7%A5%9E%E7%A4%BE/'),
-(208402, 'https://www.myokensama.jp/'),
-(208403, 'http://iinumakannon.com/'),
-(208404, 'http://www.tokawa.jp/'),
-(208405, 'https://www.city.choshi.chiba.jp/edu/sg-guide/page2101_00015.html'),
-(208406, 'https://www.facebook.com/people/%E9%8A%9A%E5%AD%90%E3%81%A1%E3%81%A2%E3%81%BF%E4%BC%9D%E7%B5%B1%E5%B7%A5%E8%8A%B8%E9%A4%A8/100054283311038/?sk=about'),
-(208407, 'https://www.michinoeki-tako.com/'),
-(208408, 'https://www.pref.chiba.lg.jp/kyouiku/bunkazai/bunkazai/q111-039.html'),
-(208409, 'https://www.town.tako.chiba.jp/docs/2018012900278/'),
-(208410, 'https://www.town.tako.chiba.jp/docs/2018020700020/'),
-(208411, 'https://www.pref.chiba.lg.jp/kyouiku/bunkazai/bunkazai/q111-040.html'),
-(208412, 'https://www.town.tako.chiba.jp/docs/2018012900261/'),
-(208413, 'https://ohisama-terrace.jp/'),
-(208414, 'http://www.city.asahi.chiba.jp/yugaku/'),
-(208415, 'https://www.city.asahi.lg.jp/soshiki/3/2421.html'),
-(208416, 'https://www.tamasakijinja.com/'),
-(208418, 'https://tozenji.sakura.ne.jp/'),
-(208419, 'https://www.haniwakan.com/'),
-(208420, 'http://www.aeromuseum.or.jp/'),
-(208421, 'https://www.fuwarishibayama.com/'),
-(208422, 'https://www.town.shibayama.lg.jp/0000002556.html'),
-(208423, 'https://www.naa.jp/jp/csr/syuhen_04.html'),
-(208424, 'https://sorafuwa.com/'),
-(208425, 'https://www.matsuyamajinja.jp/'),
-(208426, 'https://sosa-kanko.com/sightseeing/spot/yaegakijinjya/'),
-(208427, 'https://sosa-kanko.com/sightseeing/spot/toshogu/'),
-(208429, 'https://www.city.sosa.lg.jp/page/page001246.html'),
-(208430, 'https://sosa-kanko.com/sightseeing/spot/hachimanjinjya/'),
-(208431, 'https://www.city.sosa.lg.jp/page/page001342.html'),
-(208432, 'https://www.city.sosa.lg.jp/page/dir001623.html'),
-(208433, 'https://www.city.sosa.lg.jp/page/page000918.html'),
-(208434, 'http://matuyamaartmuseum.web.fc2.com/'),
-(208435, 'http://fureaipark.jp/'),
-(208436, 'https://www.city.sosa.lg.jp/page/page000905.html'),
-(208437, 'https://www.imth.jp/'),
-(208438, 'https://www.town.yokoshibahikari.chiba.jp/site/yokoshibahikari-navi/'),
-(208439, 'https://www.town.yokoshibahikari.chiba.jp/soshiki/8/1398.html'),
-(208440, 'https://www.town.yokoshibahikari.chiba.jp/site/yokoshibahikari-navi/8715.html#3'),
-(208441, 'https://yoridokoro.chiba.jp/article/207/'),
-(208442, 'https://twitter.com/ko_saiji'),
-(208443, 'https://oraihasunuma.jimdofree.com/'),
-(208444, 'https://sammukanko.jp/attraction/245/'),
-(208445, 'https://www.city.sammu.lg.jp/page/page001467.html'),
-(208446, 'http://www.hasunuma.co.jp/'),
-(208447, 'https://www.city.sammu.lg.jp/page/page003746.html'),
-(208450, 'https://www.touganehiyoshi.org/'),
-(208451, 'https://saifukuji-togane.org/'),
-(208452, 'https://www.water.go.jp/kanto/bouso/01shinchaku/news.html'),
-(208453, 'https://minorinosato-togane.com/'),
-(208454, 'https://www.city.oamishirasato.lg.jp/0000011840.html'),
-(208455, 'https://www.city.oamishirasato.lg.jp/0000010995.html'),
-(208456, 'https://sanmu-jinja.jimdo.com/%E5%B7%AB%E5%A5%B3%E9%B3%A5%E3%82%A2%E3%82%B8%E3%82%B5%E3%82%A4%E6%97%A5%E8%AA%8C/%E5%AE%AE%E8%B0%B7%E5%85%AB%E5%B9%A1%E7%A5%9E%E7%A4%BE/'),
-(208457, 'https://www.city.oamishirasato.lg.jp/0000000255.html'),
-(208458, 'https://uminoeki99.com/'),
-(208459, 'https://www.town.kujukuri.chiba.jp/0000000336.html'),
-(208460, 'https://www.town.kujukuri.chiba.jp/0000000338.html'),
-(208461, 'https://www.herb-cool.com/'),
-(208462, 'https://www.sugahara.com/'),
-(208463, 'https://lsm-ichihara.jp/'),
-(208464, 'http://kankouotaki.com/Yourou.html'),
-(208465, 'https://www.facebook.com/iigaokahatimangu?locale=ja_JP'),
-(208466, 'https://www.city.ichihara.chiba.jp/article?articleId=61fa37ff5df8b3573930cfe8'),
-(208467, 'https://www.city.ichihara.chiba.jp/article?articleId=60236e9eece4651c88c17b6d'),
-(208468, 'https://azunosato.tsukahara-ri.com/'),
-(208469, 'https://kominatomachiai.com/'),
-(208471, 'https://kidsdom.jp/'),
-(208472, 'https://www.city.ichihara.chiba.jp/article?articleId=60236e72ece4651c88c17b26'),
-(208473, 'https://zounokuni.com/'),
-(208474, 'https://ichihara-kankou.or.jp/introduce/toiletinnature/'),
-(208475, 'http://wakuwaku-nagara.com/'),
-(208476, 'https://adeac.jp/nagara-town/top/'),
-(208477, 'http://www.nagaramitinoeki.com/'),
-(208479, 'https://www.tarzania.jp/'),
-(208480, 'https://www.city.mobara.chiba.jp/0000007259.html'),
-(208481, 'https://shirakojinja.jp/'),
-(208482, 'https://www.park-sodegaura.or.jp/'),
-(208483, 'https://t-doitsumura.co.jp/'),
-(208484, 'https://sodegaura-kaihinpark.com/'),
-(208485, 'https://www.city.sodegaura.lg.jp/soshiki/nourin/yurinosato.html'),
-(208486, 'https://www.doumeki-park.jp/'),
-(208487, 'https://www.sodegaura-animal.jp/'),
-(208488, 'https://www.city.sodegaura.lg.jp/soshiki/hakubutsukan/'),
-(208489, 'https://www.city.sodegaura.lg.jp/soshiki/nourin/tanbonogakkoujigyou.html'),
-(208490, 'https://www.town.chonan.chiba.jp/shoukai/nomikane/514/'),
-(208491, 'https://www.town.chonan.chiba.jp/shoukai/kankou/511/'),
-(208492, 'https://kasamori-ji.or.jp/'),
-(208493, 'https://chonan.shugakko.jp/'),
-(208494, 'https://mutsuzawa-swt.jp/'),
-(208497, 'https://sowaka.gugyouji.jp/'),
-(208498, 'https://www.vill.chosei.chiba.jp/0000000304.html'),
-(208499, 'https://www.vill.chosei.chiba.jp/0000000310.html'),
-(208500, 'https://www.vill.chosei.chiba.jp/0000000170.html'),
-(208501, 'https://www.town.ichinomiya.chiba.jp/machizukuri/2/408.html'),
-(208502, 'https://tamasaki.org/index.htm'),
-(208503, 'https://shojoji.net/'),
-(208504, 'http://www.yaturugi.net/'),
-(208505, 'https://mitsui-shopping-park.com/mop/kisarazu/shop/800689.html'),
-(208506, 'https://takakurakannon.com/'),
-(208507, 'https://www.city.kisarazu.lg.jp/shokai/rekishi/hakubutsukan/1002106.html'),
-(208508, 'http://kisarapia.com/'),
-(208509, 'http://chiba-kisarazu.com/'),
-(208510, 'https://parkbay-totriizaki.com/'),
-(208511, 'http://www.kap.co.jp/'),
-(208512, 'https://www.city.kisarazu.lg.jp/shokai/shisetsu/kouen/1000844.html'),
-(208513, 'https://www.futtsu-kanko.info/places/tourouzakadaishi/'),
-(208514, 'https://www.motherfarm.co.jp/'),
-(208515, 'https://www.city.futtsu.lg.jp/0000000524.html'),
-(208516, 'https://www.tokyowanferry.com/'),
-(208517, 'http://www.mt-nokogiri.co.jp/'),
-(208518, 'https://www.futtsu-kanko.info/places/%e5%b2%a9%e8%b0%b7%e8%a6%b3%e9%9f%b3%e5%a0%82/'),
-(208519, 'https://nokogiriyama.com/'),
-(208520, 'https://thefish.co.jp/'),
-(208521, 'http://www.sommelier.co.jp/'),
-(208522, 'http://www.t-kannon.jp/'),
-(208523, 'https://www.cue-net.or.jp/kouen/futtsu/index.html'),
-(208524, 'https://www.cue-net.or.jp/kouen/futtsu/index.html'),
-(208525, 'https://www.city.kimitsu.lg.jp/site/kanko/2189.html'),
-(208526, 'https://www.city.kimitsu.lg.jp/site/kanko/2230.html'),
-(208527, 'https://www.city.kimitsu.lg.jp/site/kanko/2259.html'),
-(208528, 'http://hachimitsu-koubou.com/'),
-(208529, 'https://www.city.kimitsu.lg.jp/site/kanko/2180.html'),
-(208530, 'https://jinyaji.web.fc2.com/index.html'),
-(208531, 'https://www.facebook.com/people/%E7%8C%9F%E5%B8%AB%E5%B7%A5%E6%88%BF%E3%83%89%E3%83%A9%E3%82%A4%E3%83%96%E3%82%A4%E3%83%B3/100087274105871/'),
-(208532, 'https://www.dreaming-place-garden.com/'),
-(208533, 'http://www.aisaibatake.com/'),
-(208534, 'https://www.city.kimitsu.lg.jp/site/kanko/2188.html'),
-(208535, 'https://www.pref.chiba.lg.jp/kyouiku/bunkazai/bunkazai/n111-020.html'),
-(208536, 'http://www.kankouotaki.com/jokamachi.html'),
-(208537, 'https://www.takeyura.net/'),
-(208538, 'https://yourokeikoku-kirari.jp/'),
-(208539, 'http://www.youroukeikoku.com/spot/awamata/'),
-(208540, 'https://herbisland.co.jp/'),
-(208541, 'http://kankouotaki.com/Midokoro.html'),
-(208542, 'https://www.popponooka.com/'),
-(208543, 'http://www.isumi-sato.com/'),
-(208544, 'https://ttn7raz24z.wixsite.com/kuniyosijinja'),
-(208545, 'http://www.nihonji.jp/index.html'),
-(208546, 'https://hotasho.jp/'),
-(208547, 'http://sakumadam.com/'),
-(208548, 'https://www.town.kyonan.chiba.jp/soshiki/10/2453.html'),
-(208549, 'https://www.town.kyonan.chiba.jp/soshiki/10/2454.html'),
-(208550, 'https://www.town.kyonan.chiba.jp/soshiki/10/2505.html'),
-(208551, 'http://www.okuzure.com/'),
-(208552, 'https://banya-grp.jp/'),
-(208553, 'https://www.kamogawa-seaworld.jp/'),
-(208554, 'https://www.senmaida.com/'),
-(208555, 'https://tainoura.jp/'),
-(208556, 'http://www.tanjoh-ji.jp/'),
-(208557, 'http://www.seichoji.com/index.html'),
-(208558, 'http://www.kamogawaocean-park.com/'),
-(208559, 'https://nanabatake.jp/'),
-(208560, 'https://shiosaig.jp/'),
-(208561, 'https://www.city.kamogawa.lg.jp/site/nobinobi-kamokko/1189.html'),
-(208562, 'http://yomogiyomogi.jp/'),
-(208563, 'https://www.city.kamogawa.lg.jp/site/kamogawa-kanko/9715.html'),
-(208564, 'https://www.city.kamogawa.lg.jp/site/shiryoukan/'),
-(208565, 'https://www.city.kamogawa.lg.jp/site/kamogawa-kanko/1001.html'),
-(208566, 'https://www.katsuura-kankou.net/'),
-(208567, 'http://sgtmuseum.s2.xrea.com/'),
-(208569, 'https://www.city.katsuura.lg.jp/Info/19'),
-(208570, 'https://www.katsuura.org/'),
-(208571, 'http://www2.chiba-muse.or.jp/UMIHAKU/index.html'),
-(208572, 'https://track.sfo.jaxa.jp/facilities/katsuura.html'),
-(208573, 'https://www.katsuura-kankou.net/asaichitop/'),
-(208574, 'https://www.city.katsuura.lg.jp/Info/206'),
-(208575, 'https://temple.nichiren.or.jp/1031004-kousyouji/'),
-(208576, 'http://www.tomisaki.or.jp/'),
-(208577, 'https://www.town.onjuku.chiba.jp/sub4/3/2043.html'),
-(208578, 'https://www.biwakurabu.jp/index.html'),
-(208579, 'https://www.furaritomiyama.jp/index.html'),
-(208580, 'https://www.hana-kurabu.jp/'),
-(208582, 'http://wa-o.awa.jp/'),
-(208583, 'https://rosemary-park.jp/'),
-(208584, 'https://shiokaze-oukoku.jp/'),
-(208585, 'https://www.michi-no-eki.jp/stations/views/19143'),
-(208586, 'https://www.tokokai.org/tourlight/tourlight04/'),
-(208587, 'https://toritabi.enjoyboso.jp/tomiura/'),
-(208588, 'https://toritabi.enjoyboso.jp/shirahama/'),
-(208589, 'https://toritabi.enjoyboso.jp/wada/'),
-(208590, 'https://www.e-makiba.jp/facility/index.html'),
-(208591, 'https://toritabi.enjoyboso.jp/wada/'),
-(208592, 'http://taibusa-misaki.jp/'),
-(208593, 'http://kaibi.art.coocan.jp/'),
-(208594, 'https://www.cm-boso.com/gojoin3.html'),
-(208595, 'https://www.mboso-etoko.jp/cgi-bin/co_kanihp/info.asp?uid=1304&p=4'),
-(208596, 'https://www.mboso-etoko.jp/cgi-bin/co_kaniHP/info.asp?uid=1044'),
-(208597, 'https://www.awashirahama.com/nagao/index.html'),
-(208598, 'https://toritabi.enjoyboso.jp/special/'),
-(208599, 'https://www.city.tateyama.chiba.jp/kankou-bunka/cate00385.html'),
-(208600, 'https://www.city.tateyama.chiba.jp/minato/page100034.html'),
-(208601, 'https://tateyamacastle.jp/'),
-(208602, 'https://www.city.tateyama.chiba.jp/syougaigaku/page001892.html'),
-(208603, 'https://www.aloha-garden-t.com/'),
-(208604, 'http://www.gakekannon.jp/'),
-(208605, 'https://myoonin.jimdofree.com/'),
-(208606, 'https://tateyamacity.com/archives/295'),
-(208607, 'https://awa-ecom.jp/aoki-shigeru/'),
-(208608, 'https://funakatasoko.com/'),
-(208609, 'https://www.city.funabashi.lg.jp/shisetsu/bunka/0001/0006/0001/p036786.html'),
-(208610, 'http://www2.chiba-muse.or.jp/www/SONAN/index.html'),
-(208611, 'https://temple.nichiren.or.jp/1021096-komyoji/'),
-(208612, 'https://www.city.narashino.lg.jp/shisetu/koenshiseki/akanehamaryokuti.html'),
-(208613, 'https://www.city.narashino.lg.jp/soshiki/shakaikyoiku/gyomu/shisetu/koenshiseki/kyutokitake.html'),
-(208614, 'https://www.city.narashino.lg.jp/soshiki/shakaikyoiku/gyomu/shisetu/koenshiseki/kyuosawake.html'),
-(208617, 'https://www.city.narashino.lg.jp/citysales/kanko/mamechishiki.html'),
-(208618, 'https://www.city.narashino.lg.jp/soshiki/shakaikyoiku/gyomu/shisetu/koenshiseki/doituhoryookenohi.html'),
-(208619, 'https://www.city.narashino.lg.jp/citysales/kanko/bunkahistory/rekishi/tetudourentai/gate_railway_regiment.html'),
-(208620, 'https://higashiminobu.sougenji.nichiren-shu.jp/'),
-(208621, 'http://www.isumi-kankou.com/isumi-kanko-tousyu/iduna.html'),
-(208622, 'https://tateyamagibiercenter.com/'),
-(208623, 'https://www.imuseum.jp/'),
-(208624, 'https://www.town.kyonan.chiba.jp/site/hishikawamoronobukinenkan/'),
-(208625, 'https://www.city.kimitsu.lg.jp/soshiki/24/2122.html'),
-(208626, 'https://shirako.net/tourism/'),
-(208627, 'https://inahana.co.jp/'),
-(208628, 'http://enmeijishiroi.web.fc2.com/index.html'),
-(208629, 'https://peraichi.com/landing_pages/view/kuratosyo'),
-(208630, 'https://www.city.yachimata.lg.jp/site/iju/21274.html'),
-(208631, 'https://www.city.ichikawa.lg.jp/cul01/1111000189.html'),
-(208632, 'https://www.matsudo-kankou.jp/sightseeing/%E9%87%8E%E8%8F%8A%E3%81%AE%E5%A2%93%E6%96%87%E5%AD%A6%E7%A2%91/'),
-(208633, 'https://www.city.abiko.chiba.jp/event/shiseki_bunkazai/inoueke/index.html'),
-(208634, 'https://www.yamasa.com/enjoy/factory-visit/'),
-(208635, 'https://tougaku.exblog.jp/'),
-(208636, 'https://www.vill.chosei.chiba.jp/0000000302.html'),
-(208637, 'https://onjuku-kankou.com/spot/kinento/'),
-(208638, 'https://tateyamacity.com/archives/2824'),
-(208640, 'https://www.suzurisan.info/'),
-(208641, 'https://www.city.kimitsu.lg.jp/site/kanko/2224.html'),
-(208643, 'https://sosa-kanko.com/sightseeing/spot/ryubiji/'),
-(208644, 'https://www.instagram.com/kissasakura/?hl=ja'),
-(208645, 'https://www.city.urayasu.lg.jp/shisetsu/kouen/1005638.html'),
-(208646, 'https://www.city.kimitsu.lg.jp/site/kanko/2219.html'),
-(208647, 'https://twitter.com/Takataki_jinja'),
-(208648, 'https://www.instagram.com/coffee.misaki/'),
-(208649, 'https://springs.co.jp/'),
-(208650, 'https://fc.ccb.or.jp/movie/detail.html?CN=332033'),
-(208651, 'https://fc.ccb.or.jp/movie/detail.html?CN=317680'),
-(208652, 'https://fc.ccb.or.jp/movie/detail.html?CN=329242'),
-(208653, 'https://www.togane-bunspo.or.jp/arena/'),
-(208654, 'http://morinpiakozu.jp/'),
-(208655, 'https://funabashiport-shinsuipark.com/'),
-(208656, 'https://funakan.or.jp/tourism/853/'),
-(208657, 'https://www.city.funabashi.lg.jp/shisetsu/bunka/0001/0001/index.html'),
-(208658, 'http://business4.plala.or.jp/nemotoku/index.html'),
-(208659, 'https://www.cm-boso.com/'),
-(208660, 'https://fc.ccb.or.jp/movie/detail.html?CN=304263'),
-(208661, 'https://www.naritasan.or.jp/'),
-(209281, 'https://www.abikoinfo.jp/'),
-(209282, 'https://www.ja-tomisato.or.jp/shop/index.html'),
-(209283, 'http://www.choshiselect.jp/index.html'),
-(209284, 'http://gyobumisaki.com/index.html'),
-(209285, 'http://kirari-asahi.com/'),
-(209286, 'https://www.jreast.co.jp/estation/station/info.aspx?StationCd=1634'),
-(209287, 'https://www.umihotaru.com/'),
-(209288, 'http://www.isumi-kankou.com/isumi-kanko-tousyu/toudai.html'),
-(209289, 'http://www.isumi-kankou.com/'),
-(209290, 'https://www.city.isumi.lg.jp/gyosei/bunka_sports/rekishi/2281.html'),
-(209291, 'https://www.city.isumi.lg.jp/gyosei/bunka_sports/rekishi/2281.html'),
-(209292, 'https://www.town.kyonan.chiba.jp/soshiki/19/2498.html'),
-(209293, 'https://www.muji.com/jp/ja/shop/detail/046602'),
-(209294, 'https://www.komatsuji.jp/index.html'),
-(209295, 'https://takabejinja.com/'),
-(209296, 'https://jinjya.wixsite.com/kashiwa'),
-(209297, 'https://www.town.sakae.chiba.jp/page/page001248.html'),
-(209298, 'https://www.toganekanko.jp/'),
-(209460, 'https://minato-asaichi.com/'),
-(209461, 'https://www.manodaikoku.com/'),
-(210057, 'http://www.niemonjima.com/'),
-(210058, 'https://www.city.ichikawa.lg.jp/higashiyama/'),
-(210059, 'https://www.town.yokoshibahikari.chiba.jp/soshiki/14/1395.html#a01'),
-(210060, 'https://www.town.yokoshibahikari.chiba.jp/map/15-011.html'),
-(210061, 'https://www.town.yokoshibahikari.chiba.jp/soshiki/14/1395.html#a02'),
-(210062, 'https://www.town.yokoshibahikari.chiba.jp/soshiki/14/1395.html#a08'),
-(210663, 'https://twitter.com/harumi_suijinja');
-
 
 CREATE TABLE spot_addresses
 (
     spot_id INTEGER PRIMARY KEY,
     spot_address TEXT NOT NULL
 );
-INSERT INTO spot_addresses VALUES
-
-(207134, '銚子市八木町1777-1'),
-(207135, '館山市館山351-2'),
-(207136, '成田市仲町381'),
-(207137, '旭市萩園1437'),
-(207138, '八街市八街ほ796-1'),
-(207139, '八街市中央14-1'),
-(207140, '香取市佐原イ1722-1'),
-(207141, '夷隅郡御宿町岩和田702'),
-(207143, '山武市蓮沼ハ4826'),
-(207144, '船橋市山手1-1-8'),
-(207145, '八千代市緑が丘2-1-3'),
-(207146, '市川市鬼高1-1-1'),
-(207147, '浦安市入船1-4-1'),
-(207148, '習志野市谷津1-16-1'),
-(207149, '千葉市中央区青葉町955-2'),
-(207150, '千葉市中央区 中央港1-10-1'),
-(208179, '野田市関宿三軒家143-4'),
-(208180, '野田市東宝珠花237番地1いちいのホール5階'),
-(208181, '野田市三ツ堀369'),
-(208182, '野田市清水906'),
-(208183, '野田市桜台210'),
-(208184, '野田市野田370-8'),
-(208185, '野田市野田250'),
-(208186, '野田市関宿町1273'),
-(208187, '野田市上花輪507'),
-(208188, '流山市流山6-649'),
-(208227, '流山市流山6-670-1'),
-(208228, '流山市流山2-109-9'),
-(208229, '流山市流山2-101-1'),
-(208230, '流山市流山3-90'),
-(208231, '流山市流山1-153'),
-(208232, '流山市加1-1225-6'),
-(208233, '流山市東深井368-1'),
-(208234, '柏市中十余二399-1'),
-(208235, '柏市布施1738'),
-(208236, '柏市花野井字原974-1'),
-(208237, '柏市呼塚新田字南道灌橋205他'),
-(208238, '柏市柏市高田100'),
-(208239, '柏市箕輪新田59-2'),
-(208240, '柏市手賀666-2'),
-(208241, '柏市布瀬89-1'),
-(208242, '柏市岩井424'),
-(208243, '柏市布施2005-2'),
-(208244, '柏市柳戸612'),
-(208245, '柏市増尾字稲荷下650他'),
-(208246, '我孫子市若松1'),
-(208247, '我孫子市高野山新田193'),
-(208248, '我孫子市緑2-11-8'),
-(208249, '我孫子市緑2-5-5'),
-(208250, '我孫子市寿2-27-9'),
-(208251, '我孫子市日秀90'),
-(208252, '我孫子市新木1812'),
-(208253, '千葉県松戸市松戸７１４−１ 戸定が丘歴史公園'),
-(208254, '松戸市平賀63'),
-(208255, '松戸市下矢切1257'),
-(208256, '旭市イ2337'),
-(208257, '松戸市千駄堀671'),
-(208258, '松戸市五香8-31-1'),
-(208259, '浦安市猫実1-2-7'),
-(208260, '浦安市堀江3-1-8'),
-(208261, '浦安市日の出7-9-1'),
-(208262, '浦安市堀江3-3-1'),
-(208263, '浦安市堀江3-4-8'),
-(208264, '市川市鬼高1-1-3'),
-(208265, '市川市福栄4-22-11'),
-(208266, '市川市中山2-10-1'),
-(208267, '市川市大町284-1'),
-(208268, '市川市市川南1-10-1ザ・タワーズ・ウエスト45階'),
-(208269, '市川市国分6-10-1'),
-(208270, '市川市堀之内2-26-1'),
-(208271, '市川市本塩21-3'),
-(208272, '市川市菅野1-15-2'),
-(208273, '市川市北国分1-1'),
-(208274, '市川市真間4-9-1'),
-(208275, '市川市八幡4-2-1'),
-(208276, '鎌ケ谷市鎌ケ谷1-5'),
-(208277, '鎌ケ谷市中沢459'),
-(208278, '鎌ケ谷市初富本町2丁目22番'),
-(208279, '鎌ケ谷市初富924-6他'),
-(208280, '鎌ケ谷市東中沢2-1'),
-(208281, '鎌ケ谷市中央1-8-31'),
-(208282, '白井市復1459-12'),
-(208283, '船橋市潮見町40'),
-(208284, '船橋市金堀町525'),
-(208285, '船橋市大神保町1356-3'),
-(208286, '船橋市大神保町586-2'),
-(208287, '船橋市潮見町40'),
-(208288, '船橋市行田3-7-1'),
-(208289, '船橋市宮本5-2-1'),
-(208290, '船橋市日の出1-22-1'),
-(208291, '八千代市大和田新田755'),
-(208292, '八千代市米本4905−1'),
-(208293, '八千代市村上901-2'),
-(208294, '八千代市ゆりのき台3-8-1'),
-(208295, '八千代市大和田新田640-7'),
-(208296, '八千代市村上1170-2'),
-(208297, '八千代市村上1530−1'),
-(208298, '八千代市米本1587'),
-(208299, '千葉県八千代市真木野２４４'),
-(208300, '八千代市小池531'),
-(208301, '八千代市保品917'),
-(208302, '八千代市吉橋804'),
-(208303, '千葉県八千代市高津１３４７'),
-(208304, '八千代市萱田1427'),
-(208305, '印西市原山1-12-1'),
-(208306, '印西市木下1489-1'),
-(208307, '印西市草深178-2'),
-(208308, '習志野市谷津3-1-14'),
-(208309, '習志野市秋津5-1-1'),
-(208310, '千葉市若葉区野呂町108 泉自然公園内'),
-(208311, '千葉市中央区亥鼻1-6-1'),
-(208312, '千葉市中央区青葉町955-2（青葉の森公園内）'),
-(208313, '千葉市若葉区桜木8-33-1'),
-(208314, '千葉県千葉市若葉区富田町７１１−１ 富田さとにわ耕園'),
-(208315, '千葉市若葉区富田町983-1'),
-(208316, '千葉市若葉区源町280'),
-(208317, '千葉市中央区中央4-5-1'),
-(208318, '千葉市中央区中央3-10-8'),
-(208319, '千葉市中央区中央港1-10-1'),
-(208320, '千葉市中央区弁天3-1-1'),
-(208321, '千葉市中央区弁天4-1-1'),
-(208322, '千葉市中央区川崎町1-20'),
-(208323, '千葉市美浜区美浜1'),
-(208324, '千葉市美浜区中瀬2-1'),
-(208325, '千葉市美浜区新港224-1'),
-(208326, '千葉市緑区あすみが丘東3－15'),
-(208327, '千葉市中央区中央港1-20-1'),
-(208328, '千葉市中央区中央港1'),
-(208329, '千葉市美浜区高浜7-2'),
-(208330, '千葉市緑区土気町34'),
-(208331, '千葉市稲毛区稲毛1-8-35(千葉市民ギャラリー･いなげ内)'),
-(208332, '千葉市稲毛区稲毛1-16-12'),
-(208333, '千葉市若葉区御殿町2549'),
-(208334, '千葉市中央区院内1-16-1'),
-(208335, '四街道市鹿放ヶ丘284-12'),
-(208336, '佐倉市臼井田2714'),
-(208337, '佐倉市城内町117'),
-(208338, '佐倉市城内町官有無番地'),
-(208339, '佐倉市新町210'),
-(208340, '佐倉市飯野820'),
-(208341, '佐倉市宮小路町57'),
-(208342, '佐倉市裏新町1-4'),
-(208343, '佐倉市本町81'),
-(208344, '佐倉市鏑木町274'),
-(208345, '佐倉市鏑木町933-1'),
-(208346, '佐倉市城内町5-23'),
-(208347, '千葉県佐倉市坂戸631'),
-(208348, '印旛郡栄町龍角寺1028'),
-(208349, '印旛郡栄町龍角寺1039-1'),
-(208350, '印旛郡栄町龍角寺1039-1地先'),
-(208351, '印旛郡栄町龍角寺239'),
-(208352, '印旛郡栄町安食3620'),
-(208353, '印旛郡酒々井町馬橋106'),
-(208354, '印旛郡酒々井町本佐倉・佐倉市大佐倉'),
-(208355, '印旛郡酒々井町墨1549-1（酒々井町コミュニティプラザ敷地内）'),
-(208356, '成田市成田1'),
-(208357, '成田市名木730-3'),
-(208358, '成田市宗吾1-558'),
-(208359, '成田市駒井野1353-1'),
-(208360, '成田市駒井野1338-1'),
-(208361, '成田市古込1-1'),
-(208362, '成田市花崎町付近 （JR成田駅前参道口）'),
-(208363, '成田市仲町383-1'),
-(208364, '成田市大竹1450'),
-(208365, '成田市三里塚御料1-34'),
-(208366, '成田市高岡1500'),
-(208367, '成田市天神峰80-1'),
-(208368, '八街市八街ほ237'),
-(208369, '八街市八街ほ796-1'),
-(208370, '富里市七栄650-206（旧岩崎久彌末廣農場別邸公園隣）'),
-(208371, '富里市高松101'),
-(208372, '富里市七栄650-25（旧岩崎家末廣別邸所在地）'),
-(208373, '富里市中沢593-1'),
-(208374, '香取郡神崎町松崎855'),
-(208375, '香取郡神崎町本宿1994'),
-(208376, '香取郡神崎町神宿1982-3'),
-(208377, '香取郡神崎町並木671'),
-(208378, '香取市佐原イ3368（八坂神社境内）'),
-(208379, '香取市佐原ｲ1903-1'),
-(208380, '香取市佐原ｲ499-1'),
-(208381, '香取市扇島1837-2'),
-(208382, '香取市佐原イ3981-2（道の駅）佐原イ4051-3（川の駅）'),
-(208383, '香取市鳩山344-4'),
-(208384, '香取市香取1697-1'),
-(208385, '香取市沢1372-1'),
-(208386, '香取市牧野1752'),
-(208387, '香取市佐原イ1722-1'),
-(208388, '香取市佐原ｲ1900-1'),
-(208389, '香取市府馬2395'),
-(208390, '香取郡東庄町笹川い580-1'),
-(208391, '香取郡東庄町小南639'),
-(208392, '香取郡東庄町笹川い597'),
-(208393, '香取郡東庄町小南690'),
-(208394, '銚子市犬吠埼9576'),
-(208395, '銚子市潮見町'),
-(208396, '銚子市川口町2-6529-34'),
-(208397, '銚子市川口町2-6385-267'),
-(208398, '銚子市天王台1421-1'),
-(208399, '銚子市外川町'),
-(208400, '銚子市八木町1777-1'),
-(208401, '銚子市猿田町1677'),
-(208402, '銚子市妙見町1465'),
-(208403, '銚子市馬場町1-1'),
-(208404, '銚子市外川町2-10610'),
-(208405, '銚子市新生町2-1-5'),
-(208406, '銚子市松岸町3-228'),
-(208407, '香取郡多古町多古1069-1'),
-(208408, '香取郡多古町北中83'),
-(208409, '香取郡多古町多古2550'),
-(208410, '香取郡多古町多古2444-1'),
-(208411, '香取郡多古町多古2613'),
-(208412, '香取郡多古町寺作117'),
-(208413, '旭市ｲ4337-1イオンタウン旭2階'),
-(208414, '旭市長部345-2'),
-(208415, '旭市萩園1437（いいおか潮騒ホテル1階東側隣接）'),
-(208416, '旭市飯岡2126-1'),
-(208417, '旭市ロの1425'),
-(208418, '松戸市小金359'),
-(208419, '山武郡芝山町芝山438-1'),
-(208420, '山武郡芝山町岩山111-3'),
-(208421, '山武郡芝山町小池2568'),
-(208422, '山武郡芝山町岩山2012-6'),
-(208423, '山武郡芝山町岩山1864-2'),
-(208424, '山武郡芝山町朝倉394-15'),
-(208425, '匝瑳市松山1127'),
-(208426, '匝瑳市八日市場イ2939'),
-(208427, '匝瑳市八日市場ｲ2435'),
-(208428, '匝瑳市生尾75'),
-(208429, '匝瑳市山桑108'),
-(208430, '匝瑳市西小笹1031'),
-(208431, '匝瑳市今泉363番地'),
-(208432, '匝瑳市八日市場イ2291'),
-(208433, '匝瑳市飯高1789'),
-(208434, '匝瑳市松山630'),
-(208435, '匝瑳市飯塚299-2'),
-(208436, '匝瑳市八日市場イ137-1'),
-(208437, '匝瑳市安久山197'),
-(208438, '山武郡横芝光町坂田字登城地先'),
-(208439, '山武郡横芝光町屋形地先'),
-(208440, '山武郡横芝光町尾垂浜'),
-(208441, '山武郡横芝光町横芝1355-2'),
-(208442, '山武郡横芝光町虫生483'),
-(208443, '山武市蓮沼ハ4826'),
-(208444, '山武市成東2551'),
-(208445, '山武市殿台343-2（山武市歴史民俗資料館）'),
-(208446, 'HGV6+3W 日本、千葉県山武市'),
-(208447, '山武市埴谷1904-5'),
-(208448, '東金市田中199'),
-(208449, '東金市東金1703-4'),
-(208450, '東金市大豆谷860'),
-(208451, '東金市東金1693'),
-(208452, '東金市松之郷'),
-(208453, '東金市田間1300-3'),
-(208454, '大網白里市小中1703'),
-(208455, '大網白里市北吉田758'),
-(208456, '大網白里市大網2990'),
-(208457, '大網白里市土気飛地1876（カーナビ検索不可）／最寄り・季美の森南1丁目1番地／Googleマップ『縣神社　千葉県』で検索'),
-(208458, '山武郡九十九里町小関2347-98'),
-(208459, '山武郡九十九里町小関854'),
-(208460, '山武郡九十九里町田中荒生414-1'),
-(208461, '山武郡九十九里町片貝4477'),
-(208462, '山武郡九十九里町藤下797'),
-(208463, '市原市不入75-1'),
-(208464, '夷隅郡大多喜町粟又～市原市朝生原'),
-(208465, '市原市八幡1057-1'),
-(208466, '市原市五井南海岸1-12'),
-(208467, '市原市国分寺台中央3-5-2'),
-(208468, '市原市浅井小向492-1'),
-(208469, '市原市五井中央東1-1-2'),
-(208470, '市原市平蔵1360'),
-(208471, '市原市山倉1487'),
-(208472, '市原市田淵1157'),
-(208473, '市原市山小川937'),
-(208474, '市原市飯給941-1'),
-(208475, '市原市・長生郡長柄町'),
-(208476, '長生郡長柄町徳増小榎本地先'),
-(208477, '長生郡長柄町六地蔵138-1'),
-(208478, '長生郡長柄町高山686'),
-(208479, '長生郡長柄町味庄東台1067'),
-(208480, '茂原市本小轡1108-2'),
-(208481, '長生郡白子町関5364'),
-(208482, '袖ケ浦市飯富2360'),
-(208483, '袖ケ浦市永吉419'),
-(208484, '袖ケ浦市南袖36'),
-(208485, '袖ケ浦市飯富1635-1'),
-(208486, '袖ケ浦市百目木200'),
-(208487, '袖ケ浦市上泉1506−10'),
-(208488, '袖ケ浦市下新田1133'),
-(208489, '袖ケ浦市永地1943'),
-(208490, '長生郡長南町岩撫36-1'),
-(208491, '長生郡長南町佐坪2388'),
-(208492, '長生郡長南町笠森302'),
-(208493, '長生郡長南町長南770-1'),
-(208494, '長生郡睦沢町森2-1'),
-(208495, '長生郡睦沢町上之郷1794'),
-(208496, '長生郡睦沢町岩井831'),
-(208497, '長生郡睦沢町下之郷1875'),
-(208498, '長生郡長生村一松戊'),
-(208499, '長生郡長生村一松丙916'),
-(208500, '長生郡長生村本郷5366-1'),
-(208501, '長生郡一宮町東浪見'),
-(208502, '長生郡一宮町一宮3048'),
-(208503, '木更津市富士見2-9-30'),
-(208504, '木更津市富士見1-6-15'),
-(208505, '木更津市金田東3-1-1 三井アウトレットパー木更津6400'),
-(208506, '木更津市矢那1245'),
-(208507, '木更津市太田2-16-2'),
-(208508, '木更津市金田東2-10-1'),
-(208509, '木更津市下郡1369-1'),
-(208510, '木更津市富士見3-5'),
-(208511, '木更津市かずさ鎌足2-3-9'),
-(208512, '木更津市太田2-16'),
-(208513, '富津市萩生8-2'),
-(208514, '富津市田倉940-3'),
-(208515, '富津市富津2280'),
-(208516, '富津市金谷4303'),
-(208517, '富津市金谷4052-1'),
-(208518, '富津市数馬268-3'),
-(208519, '富津市金谷2146-1'),
-(208520, '富津市金谷2288'),
-(208521, '富津市上後423-1'),
-(208522, '富津市小久保1588'),
-(208523, '富津市富津2280'),
-(208524, '富津市富津2280'),
-(208525, '君津市久留里字内山'),
-(208526, '千葉県君津市鹿野山１１９−１ 鹿野山九十九谷（かのうざん くじゅうくたに）展望公園'),
-(208527, '君津市笹1954'),
-(208528, '君津市大井305'),
-(208529, '君津市亀山湖'),
-(208530, '君津市鹿野山324-1'),
-(208531, '君津市笹1765-9'),
-(208532, '君津市大野台815-85'),
-(208533, '君津市向郷1687-1'),
-(208534, '君津市久留里市場195-4'),
-(208535, '夷隅郡大多喜町久保126'),
-(208536, '夷隅郡大多喜町久保159'),
-(208537, '夷隅郡大多喜町石神855'),
-(208538, '夷隅郡大多喜町小田代148-24'),
-(208539, '夷隅郡大多喜町粟又地先'),
-(208540, '夷隅郡大多喜町小土呂2423'),
-(208541, '夷隅郡大多喜町大多喜259-1'),
-(208542, 'いすみ市作田1298'),
-(208543, 'いすみ市万木2050'),
-(208544, 'いすみ市苅谷630'),
-(208545, '安房郡鋸南町鋸山'),
-(208546, '安房郡鋸南町保田724'),
-(208547, '安房郡鋸南町大崩39'),
-(208548, '安房郡鋸南町江月448'),
-(208549, '安房郡鋸南町保田'),
-(208550, '安房郡鋸南町吉浜517-1'),
-(208551, '安房郡鋸南町大崩1114'),
-(208552, '安房郡鋸南町吉浜99-5'),
-(208553, '鴨川市東町1464-18'),
-(208554, '鴨川市平塚540'),
-(208555, '鴨川市小湊183-8'),
-(208556, '鴨川市小湊183'),
-(208557, '鴨川市清澄322-1'),
-(208558, '鴨川市江見太夫崎22'),
-(208559, '鴨川市広場'),
-(208560, '鴨川市広場777'),
-(208561, '鴨川市貝渚3277'),
-(208562, '鴨川市四方木366（四方木ふれあい館から徒歩20分程度）'),
-(208563, '鴨川市前原359-71'),
-(208564, '鴨川市横渚1401-6'),
-(208565, '鴨川市平塚1718'),
-(208566, '勝浦市鵜原地先'),
-(208567, '勝浦市守谷1512'),
-(208568, '勝浦市浜勝浦221'),
-(208569, '勝浦市川津1394'),
-(208570, '勝浦市吉尾174'),
-(208571, '勝浦市吉尾123'),
-(208572, '勝浦市芳賀花立山1-14'),
-(208573, '勝浦市浜勝浦･下本町朝市通り(毎月1日〜15日)･仲本町通り(毎月16日〜月末)'),
-(208574, '勝浦市守谷地先'),
-(208575, '勝浦市勝浦49'),
-(208576, '勝浦市浜勝浦1'),
-(208577, '夷隅郡御宿町六軒町505-1'),
-(208578, '南房総市富浦町青木123-1'),
-(208579, '南房総市二部2211'),
-(208580, '南房総市富浦町大津320'),
-(208581, '南房総市川田82-2'),
-(208582, '南房総市和田町仁我浦243'),
-(208583, '南房総市白子1501'),
-(208584, '南房総市千倉町千田1051'),
-(208585, '南房総市白浜町滝口9240'),
-(208586, '南房総市白浜町白浜630'),
-(208587, '南房総市富浦町原岡地先'),
-(208588, '南房総市白浜町白浜630'),
-(208589, '南房総市和田町花園'),
-(208590, '南房総市大井686'),
-(208591, '南房総市和田町花園'),
-(208592, '南房総市富浦町多田良1212-29'),
-(208593, '南房総市白浜町白浜628-1'),
-(208594, '南房総市白浜町白浜'),
-(208595, '南房総市合戸'),
-(208596, '南房総市千倉町白間津'),
-(208597, '南房総市白浜町滝口5185-1'),
-(208598, '南房総市千倉町白間津'),
-(208599, '館山市富士見地先'),
-(208600, '館山市館山1564-1'),
-(208601, '館山市館山362'),
-(208602, '館山市宮城192-2'),
-(208603, '館山市藤原1497'),
-(208604, '館山市船形835'),
-(208605, '館山市上真倉1689'),
-(208606, '館山市洲崎1043'),
-(208607, '館山市布良1256'),
-(208608, '館山市船形1422-6'),
-(208609, '船橋市海神4-27-2'),
-(208610, '夷隅郡大多喜町大多喜481'),
-(208611, '木更津市中央1-3-5'),
-(208612, '習志野市茜浜3'),
-(208613, '習志野市実籾2-24-1（実籾本郷公園内）'),
-(208614, '習志野市藤崎1-14-43（藤崎森林公園内）'),
-(208615, '習志野市東習志野2-19付近（ハミングロード起点から1km地点）'),
-(208616, '習志野市茜浜2-3-3（千葉県国際総合水泳場）'),
-(208617, '習志野市鷺沼5-4付近'),
-(208618, '習志野市東習志野4-4（東習志野四丁目児童遊園内）'),
-(208619, '習志野市津田沼2-17-1（千葉工業大学）'),
-(208620, '茂原市茂原1201'),
-(208621, 'いすみ市岬町和泉2935-1'),
-(208622, '館山市西長田1163-5'),
-(208623, '市原市能満1489'),
-(208624, '安房郡鋸南町吉浜516'),
-(208625, '君津市笹1766-3'),
-(208626, '長生郡白子町剃金2730-1'),
-(208627, '長生郡一宮町東浪見5841'),
-(208628, '白井市平塚939'),
-(208629, '四街道市吉岡49'),
-(208630, '八街市根古谷 塩古道'),
-(208631, '市川市本行徳35番7号（旧浅子神輿店店舗兼主屋）、本行徳37番13号（休憩所）'),
-(208632, '松戸市下矢切261　西蓮寺境内'),
-(208633, '我孫子市相島新田1'),
-(208634, '銚子市北小川町2570'),
-(208635, '長生郡睦沢町妙楽寺500'),
-(208636, '長生郡長生村岩沼1番地'),
-(208637, '夷隅郡御宿町岩和田702'),
-(208638, '舘山市八幡68'),
-(208639, 'いすみ市大野1107'),
-(208640, 'いすみ市下布施757'),
-(208641, '君津市宿原844'),
-(208642, '印西市竜腹寺626'),
-(208643, '匝瑳市大寺1856'),
-(208644, '浦安市北栄1-15-6北栄1-15-6'),
-(208645, '浦安市富岡4-25'),
-(208646, '君津市小香359-1'),
-(208647, '市原市高滝1'),
-(208648, '安房郡鋸南町元名1'),
-(208649, '千葉市美浜区ひび野1-11'),
-(208650, '千葉市緑区おゆみ野3-15-3（緑区役所）'),
-(208651, '千葉市美浜区中瀬'),
-(208652, '千葉市花見川区さつきが丘2-11-13'),
-(208653, '東金市松之郷186'),
-(208654, '成田市公津の杜4-8'),
-(208655, '船橋市浜町2丁目地先'),
-(208656, '船橋市夏見5丁目付近'),
-(208657, '船橋市本町2-2-5'),
-(208658, '南房総市白浜町根本無番地'),
-(208659, '南房総市富浦町多田良地先'),
-(208660, '茂原市高師821-11'),
-(208661, '成田市成田1'),
-(208662, '匝瑳市八日市場イ２９１７（ポケットパーク）'),
-(208663, '四街道市大日396-8'),
-(209281, '我孫子市本町2-1-10'),
-(209282, '富里市七栄652-225'),
-(209283, '銚子市双葉町3-6'),
-(209284, '旭市上永井1309-1'),
-(209285, '旭市イの5238'),
-(209286, '山武郡横芝光町横芝'),
-(209287, '木更津市中島地先海ほたる'),
-(209288, 'いすみ市岬町和泉'),
-(209289, 'いすみ市岬町和泉2363−17'),
-(209290, 'いすみ市万木834'),
-(209291, 'いすみ市大原9775'),
-(209292, '安房郡鋸南町竜島165-1'),
-(209293, '鴨川市宮山1696'),
-(209294, '南房総市千倉町大貫1057'),
-(209295, '南房総市千倉町南朝夷164'),
-(209296, '柏市柏5-7-4'),
-(209297, '印旛郡栄町西199'),
-(209298, '東金市東金1415-1'),
-(209460, 'いすみ市大原11574'),
-(209461, '南房総市久保587'),
-(210057, '鴨川市太海浜445'),
-(210058, '市川市中山1-16-2'),
-(210059, '山武郡横芝光町中台1462'),
-(210060, '山武郡横芝光町屋形921'),
-(210061, '山武郡横芝光町木戸台1917'),
-(210062, '山武郡横芝光町姥山宇台513−1'),
-(210663, '匝瑳市春海15');
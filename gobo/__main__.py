@@ -1,14 +1,22 @@
+import json
+import re
+import sys
+import time
 from asyncio import run
 from collections.abc import Callable, Coroutine
-from contextlib import suppress
+from concurrent.futures import ProcessPoolExecutor
+from contextlib import closing
 from functools import wraps
-from typing import Any, ParamSpec, TypeVar
+from pathlib import Path
+from sqlite3 import connect
+from typing import IO, Any, ParamSpec, TypeVar
 
 import click
-from openpyxl import Workbook
 
-from .database import db
-from .types import SpotID
+from .catalog import Catalog
+from .database import Database, editions, get_db, latest_edition, recurring_spots
+from .excel import build_layout, create_workbook, read_progress, write_batch
+from .types import Edition, SpotID
 
 P = ParamSpec("P")
 T = TypeVar("T")
@@ -27,88 +35,240 @@ def main() -> None:
     ...
 
 
-CLEARED = "A"
-NAME = "B"
-MUNICIPALITY = "C"
+def _get_db(ctx: click.Context, param: click.Parameter, value: int) -> Database:
+    try:
+        return get_db(Edition(value))
+    except ValueError:
+        raise click.BadParameter(f"{value} not in {list(editions())}")
+
+
+def catalog_option(f: Callable[P, T]) -> Callable[P, T]:
+    return click.option(
+        "--catalog/--no-catalog",
+        default=False,
+        help="Load the whole edition into an in-memory catalog first.",
+    )(f)
+
+
+def edition_option(f: Callable[P, T]) -> Callable[P, T]:
+    return click.option(
+        "--edition",
+        "db",
+        type=int,
+        default=lambda: latest_edition(),
+        show_default="latest",
+        callback=_get_db,
+    )(f)
 
 
 @main.command
 @click.argument("output", type=click.Path(dir_okay=False))
+@edition_option
+@catalog_option
 @run_decorator
 async def excel(
     output: str,
+    db: Database,
+    catalog: bool,
 ) -> None:
-    wb = Workbook()
-
-    spot_sheet = wb.create_sheet("スポット")
-    spot_sheet[f"{CLEARED}1"] = "達成"
-    spot_sheet[f"{NAME}1"] = "名前"
-    spot_sheet[f"{MUNICIPALITY}1"] = "市町村"
-
-    for i, spot_id in enumerate(db.spots, start=2):
-        spot_sheet[f"{CLEARED}{i}"] = False
-        spot_sheet[f"{NAME}{i}"].value = db.spot_name(spot_id).replace("\u3000", " ")
-        spot_sheet[f"{MUNICIPALITY}{i}"] = scraping_address(spot_id)
-        spot_sheet[f"D{i}"].value = "リンク(GoGo房総)"
-        spot_sheet[f"D{i}"].hyperlink = f"https://platinumaps.jp/d/gogo-boso?s={spot_id}"
-        with suppress(ValueError):
-            spot_sheet[f"E{i}"].hyperlink = db.spot_uri(spot_id)
-            spot_sheet[f"E{i}"].value = "リンク(施設)"
-
-    spot_sheet.auto_filter.ref = spot_sheet.dimensions
-
-    spot_clear_range = f"スポット!${CLEARED}${1+1}:${CLEARED}${1+len(db.spots)}"
-    spot_area_range = f"スポット!${MUNICIPALITY}${1+1}:${MUNICIPALITY}${1+len(db.spots)}"
-
-    total_sheet = wb.create_sheet("集計")
-    total_sheet["A1"] = "市町村"
-    total_sheet["B1"] = "達成数"
-    total_sheet["C1"] = "総数"
-    total_sheet["D1"] = "達成率"
-    for i, municipality_id in enumerate(db.municipalities, start=2):
-        total_sheet[f"A{i}"] = db.municipality_name(municipality_id)
-        total_sheet[f"B{i}"] = (
-            f"=COUNTIFS({spot_area_range}, "
-            f'"*{db.municipality_name(municipality_id)}*", {spot_clear_range}, TRUE)'
-        )
-        total_sheet[
-            f"C{i}"
-        ] = f'=COUNTIFS({spot_area_range}, "*{db.municipality_name(municipality_id)}*")'
-        total_sheet[f"D{i}"] = f"=100 * $B${i} / $C${i}"
-
-    wb.remove(wb.worksheets[0])
+    source = Catalog.from_db(db) if catalog else db
+    wb = create_workbook(build_layout(source))
     wb.save(output)
 
 
-def scraping_address(spot_id: SpotID) -> str:
-    c = db.connection.cursor()
-    c.execute(
-        """
-SELECT spot_address
-FROM spot_addresses
-WHERE spot_id = ?
-        """,
-        (spot_id,),
-    )
-    (address,) = c.fetchone()
-
-    if address == "印旛郡酒々井町本佐倉・佐倉市大佐倉":
-        return "酒々井町;佐倉市"
-    if address == "夷隅郡大多喜町粟又～市原市朝生原":
-        return "大多喜町;市原市"
-    if address == "市原市・長生郡長柄町":
-        return "市原市;長柄町"
-
-    names = [
-        name
-        for name in map(db.municipality_name, db.municipalities)
-        if name in address.replace("ケ", "ヶ").replace("舘山", "館山")
+@main.command(name="excel-batch")
+@click.argument("participants", type=click.File("r", encoding="utf-8"))
+@click.argument("outdir", type=click.Path(file_okay=False, path_type=Path))
+@click.option("-j", type=int, default=None)
+@edition_option
+@catalog_option
+@run_decorator
+async def excel_batch(
+    participants: IO[str], outdir: Path, j: int | None, db: Database, catalog: bool
+) -> None:
+    """
+    PARTICIPANTS is a JSON list of names, or an object mapping each name to
+    the spot IDs they cleared (as written by import-progress --by-participant).
+    """
+    match json.load(participants):
+        case list() as names:
+            for name in names:
+                if not isinstance(name, str):
+                    raise click.BadParameter(f"{name!r} is not a name", param_hint="PARTICIPANTS")
+            progress: dict[str, list[int]] = {name: [] for name in names}
+        case dict() as progress:
+            progress = {name: spots or [] for name, spots in progress.items()}
+        case _:
+            raise click.BadParameter("expected a JSON list or object", param_hint="PARTICIPANTS")
+
+    paths: dict[str, str] = {}
+    for name, spots in progress.items():
+        if not isinstance(spots, list) or not all(isinstance(id, int) for id in spots):
+            raise click.BadParameter(
+                f"{name}: expected a list of spot IDs", param_hint="PARTICIPANTS"
+            )
+        filename = _filename(name)
+        # 大文字と小文字を区別しないファイルシステムでも衝突しないようにする
+        other = paths.setdefault(filename.casefold(), name)
+        if other != name:
+            raise click.BadParameter(
+                f"{other!r} and {name!r} both map to {filename}", param_hint="PARTICIPANTS"
+            )
+
+    outdir.mkdir(parents=True, exist_ok=True)
+    outputs = [
+        (outdir / _filename(name), list(map(SpotID, spots))) for name, spots in progress.items()
     ]
 
-    if len(names) == 1:
-        return names[0]
+    layout = build_layout(Catalog.from_db(db) if catalog else db)
+    for path in write_batch(layout, outputs, None if j is None else max(1, j)):
+        click.echo(path)
+
+
+def _filename(name: str) -> str:
+    # Windows でもファイル名に使えない文字と制御文字を置き換える
+    stem = re.sub(r'[<>:"/\\|?*\x00-\x1f]', "_", name).rstrip(". ")
+    return f"{stem or '_'}.xlsx"
+
+
+@main.command(name="import-progress")
+@click.argument(
+    "files",
+    metavar="FILE...",
+    nargs=-1,
+    required=True,
+    type=click.Path(exists=True, dir_okay=False, path_type=Path),
+)
+@click.option("-o", "--output", type=click.File("w", encoding="utf-8"), default=sys.stdout)
+@click.option("-j", type=int, default=4)
+@click.option("--indent", type=int, default=2)
+@click.option(
+    "--by-participant",
+    is_flag=True,
+    help="Write {file stem: [spot ids]} for excel-batch instead of one merged list.",
+)
+@edition_option
+@run_decorator
+async def import_progress(
+    files: tuple[Path, ...],
+    output: IO[str],
+    j: int,
+    indent: int | None,
+    by_participant: bool,
+    db: Database,
+) -> None:
+    spots = set(db.spots)
+    cleared: dict[str, set[SpotID]] = {}
+
+    if by_participant:
+        names: dict[str, Path] = {}
+        for file in files:
+            other = names.setdefault(file.stem, file)
+            if other != file:
+                raise click.BadParameter(
+                    f"{other} and {file} have the same name", param_hint="FILE..."
+                )
+
+    with ProcessPoolExecutor(max(1, min(j, len(files) or 1))) as executor:
+        for file, progress in zip(files, executor.map(read_progress, files)):
+            unknown = progress.keys() - spots
+            if unknown:
+                click.echo(f"{file}: unknown spots {sorted(unknown)}", err=True)
+            cleared.setdefault(file.stem, set()).update(
+                id for id, value in progress.items() if value and id in spots
+            )
+
+    if by_participant:
+        json.dump({name: sorted(ids) for name, ids in cleared.items()}, output, indent=indent)
     else:
-        raise ValueError(address, names)
+        json.dump(sorted(set().union(*cleared.values())), output, indent=indent)
+
+
+@main.command(name="check-links")
+@click.option(
+    "--cache-path", type=click.Path(dir_okay=False, path_type=Path), default=Path(".links.sqlite")
+)
+@click.option("--max-age", type=float, default=24.0, show_default=True, help="hours")
+@click.option("-j", type=int, default=16, show_default=True)
+@click.option("--per-host", type=int, default=2, show_default=True)
+@click.option("--timeout", type=float, default=10.0, show_default=True, help="seconds")
+@edition_option
+@run_decorator
+async def check_links(
+    cache_path: Path, max_age: float, j: int, per_host: int, timeout: float, db: Database
+) -> None:
+    # aiohttp は bootstrap グループにしか無いので、必要になるまで読み込まない
+    from . import links
+
+    spot_uris = db.spot_uris
+    with closing(connect(cache_path)) as connection:
+        links.create_table(connection)
+        statuses = links.load(connection, spot_uris.values())
+
+        now = time.time()
+        targets = links.stale(statuses, spot_uris.values(), max_age * 3600, now)
+        checked = await links.check_links(targets, max(1, j), max(1, per_host), timeout)
+        links.save(connection, checked)
+        statuses.update((status.uri, status) for status in checked)
+
+    click.echo(f"checked {len(targets)} of {len(set(spot_uris.values()))} links", err=True)
+    for spot_id, uri in sorted(spot_uris.items()):
+        status = statuses[uri]
+        if not status.ok:
+            click.echo(f"{spot_id}\t{status.status or status.error}\t{uri}")
+
+
+@main.command
+@click.argument("output", type=click.File("wb"))
+@edition_option
+@run_decorator
+async def snapshot(output: IO[bytes], db: Database) -> None:
+    from .snapshot import write
+
+    write(db, output)
+
+
+@main.command
+@click.argument("outdir", type=click.Path(file_okay=False, path_type=Path))
+@click.option("-j", type=int, default=None)
+@edition_option
+@catalog_option
+@run_decorator
+async def site(outdir: Path, j: int | None, db: Database, catalog: bool) -> None:
+    from .site import build, collect_pages, spot_municipalities
+
+    source = Catalog.from_db(db) if catalog else db
+    pages = collect_pages(source, spot_municipalities(source))
+    result = build(outdir, pages, None if j is None else max(1, j))
+    click.echo(
+        f"written {len(result.written)}, unchanged {len(result.skipped)}, "
+        f"removed {len(result.removed)}",
+        err=True,
+    )
+
+
+@main.command
+@click.argument("old", type=int, callback=_get_db)
+@click.argument("new", type=int, callback=_get_db)
+@run_decorator
+async def recurring(old: Database, new: Database) -> None:
+    for old_id, new_id in recurring_spots(old, new):
+        click.echo(f"{old_id}\t{new_id}\t{new.spot_name(new_id)}")
+
+
+@main.command(name="catalog-footprint")
+@edition_option
+@run_decorator
+async def catalog_footprint(db: Database) -> None:
+    start = time.perf_counter()
+    catalog = Catalog.from_db(db)
+    elapsed = time.perf_counter() - start
+
+    footprint = catalog.footprint()
+    for name, size in footprint.items():
+        click.echo(f"{name}\t{size}")
+    click.echo(f"total\t{sum(footprint.values())}")
+    click.echo(f"load\t{elapsed:.3f}s", err=True)
 
 
 if __name__ == "__main__":
@@ -0,0 +1,239 @@
+"""
+データベースの内容を一度だけ読み込んで辞書で引くカタログ
+
+`Database` と同じシグネチャのメソッドを持つので、`scraping_address` や
+`excel` にそのまま渡せる
+"""
+
+from __future__ import annotations
+
+import sys
+from collections.abc import Iterable
+from dataclasses import dataclass, field
+from datetime import date
+from sqlite3 import Error
+from typing import TYPE_CHECKING, Any
+
+from .types import URI, Area, Edition, MunicipalityID, Notation, SpotID
+
+if TYPE_CHECKING:
+    from .database import Database
+
+
+@dataclass(frozen=True, slots=True)
+class AreaRecord:
+    area: Area
+    names: tuple[str | None, ...]
+
+
+@dataclass(frozen=True, slots=True)
+class MunicipalityRecord:
+    id: MunicipalityID
+    names: tuple[str | None, ...]
+    parts: tuple[MunicipalityID, ...] | None
+
+
+@dataclass(frozen=True, slots=True)
+class SpotRecord:
+    id: SpotID
+    names: tuple[str | None, ...]
+    address: str | None
+    uri: URI | None
+    area: Area | None
+
+
+@dataclass(frozen=True, eq=False)
+class Catalog:
+    edition: Edition
+    platinumaps: str
+    areas: dict[Area, AreaRecord]
+    municipality_records: dict[MunicipalityID, MunicipalityRecord]
+    municipality_order: tuple[MunicipalityID, ...]
+    spot_records: dict[SpotID, SpotRecord]
+    municipality_history: list[tuple[MunicipalityID, Notation, str, date | None, date | None]]
+    municipality_names: dict[str, MunicipalityID] = field(init=False)
+    spot_names: dict[str, tuple[SpotID, ...]] = field(init=False)
+
+    def __post_init__(self) -> None:
+        object.__setattr__(
+            self,
+            "municipality_names",
+            {
+                name: record.id
+                for record in self.municipality_records.values()
+                for name in record.names
+                if name is not None
+            },
+        )
+        spot_names: dict[str, tuple[SpotID, ...]] = {}
+        for record in self.spot_records.values():
+            for name in set(record.names):
+                if name is not None:
+                    spot_names[name] = (*spot_names.get(name, ()), record.id)
+        object.__setattr__(self, "spot_names", spot_names)
+
+    @classmethod
+    def from_db(cls, db: Database) -> Catalog:
+        cursor = db.connection.cursor()
+        cursor.execute(
+            """
+SELECT DISTINCT municipality_id
+FROM municipality_names
+ORDER BY municipality_id
+            """
+        )
+        municipality_ids = [MunicipalityID(id) for id, in cursor.fetchall()]
+
+        uris = db.spot_uris
+        addresses = db.spot_addresses
+
+        return cls(
+            edition=db.edition,
+            platinumaps=db.platinumaps,
+            areas={area: AreaRecord(area, _names(db.area_name, area)) for area in Area},
+            municipality_records={
+                id: MunicipalityRecord(
+                    id,
+                    _names(db.municipality_name, id),
+                    _or_none(db.municipality_parts, id),
+                )
+                for id in municipality_ids
+            },
+            municipality_order=tuple(db.municipalities),
+            spot_records={
+                id: SpotRecord(
+                    id,
+                    _names(db.spot_name, id),
+                    addresses.get(id),
+                    uris.get(id),
+                    _or_none(db.spot_area, id),
+                )
+                for id in db.spots
+            },
+            municipality_history=db.municipality_history,
+        )
+
+    def footprint(self) -> dict[str, int]:
+        """
+        カタログが保持しているオブジェクトのおおよそのバイト数
+        """
+        seen: set[int] = set()
+        return {
+            name: _deep_sizeof(getattr(self, name), seen)
+            for name in (
+                "areas",
+                "municipality_records",
+                "municipality_order",
+                "spot_records",
+                "municipality_history",
+                "municipality_names",
+                "spot_names",
+            )
+        }
+
+    # edition
+
+    def platinumaps_uri(self, id: SpotID) -> URI:
+        return URI(f"https://platinumaps.jp/d/{self.platinumaps}?s={id}")
+
+    # area
+
+    def area_name(self, area: Area, notation: Notation = Notation.default) -> str:
+        name = self.areas[area].names[notation.value]
+        if name is None:
+            raise ValueError(area, notation)
+        return name
+
+    # municipality
+
+    @property
+    def municipalities(self) -> list[MunicipalityID]:
+        return list(self.municipality_order)
+
+    def municipality_by_name(self, name: str) -> MunicipalityID:
+        try:
+            return self.municipality_names[name]
+        except KeyError:
+            raise ValueError(name)
+
+    def municipality_parts(self, id: MunicipalityID) -> tuple[MunicipalityID, ...]:
+        record = self.municipality_records.get(id)
+        if record is None or record.parts is None:
+            raise ValueError(id)
+        return record.parts
+
+    def municipality_name(self, id: MunicipalityID, notation: Notation = Notation.default) -> str:
+        record = self.municipality_records.get(id)
+        name = None if record is None else record.names[notation.value]
+        if name is None:
+            raise ValueError(id)
+        return name
+
+    # spot
+
+    @property
+    def spots(self) -> list[SpotID]:
+        return list(self.spot_records)
+
+    def spots_by_name(self, name: str) -> tuple[SpotID, ...]:
+        return self.spot_names.get(name, ())
+
+    def spot_name(self, id: SpotID, notation: Notation = Notation.default) -> str:
+        record = self.spot_records.get(id)
+        name = None if record is None else record.names[notation.value]
+        if name is None:
+            raise ValueError(id, notation)
+        return name
+
+    def spot_uri(self, id: SpotID) -> URI:
+        record = self.spot_records.get(id)
+        if record is None or record.uri is None:
+            raise ValueError(id)
+        return record.uri
+
+    @property
+    def spot_uris(self) -> dict[SpotID, URI]:
+        return {id: r.uri for id, r in self.spot_records.items() if r.uri is not None}
+
+    def spot_address(self, id: SpotID) -> str:
+        record = self.spot_records.get(id)
+        if record is None or record.address is None:
+            raise ValueError(id)
+        return record.address
+
+    @property
+    def spot_addresses(self) -> dict[SpotID, str]:
+        return {id: r.address for id, r in self.spot_records.items() if r.address is not None}
+
+    def spot_area(self, id: SpotID) -> Area:
+        record = self.spot_records.get(id)
+        if record is None or record.area is None:
+            raise ValueError(id)
+        return record.area
+
+
+def _names(f: Any, *args: Any) -> tuple[str | None, ...]:
+    return tuple(_or_none(f, *args, notation) for notation in Notation)
+
+
+def _or_none(f: Any, *args: Any) -> Any:
+    try:
+        return f(*args)
+    except (ValueError, Error):
+        return None
+
+
+def _deep_sizeof(value: object, seen: set[int]) -> int:
+    if id(value) in seen:
+        return 0
+    seen.add(id(value))
+
+    size = sys.getsizeof(value)
+    children: Iterable[object] = ()
+    if isinstance(value, dict):
+        children = (*value.keys(), *value.values())
+    elif isinstance(value, (list, tuple, set, frozenset)):
+        children = value
+    elif hasattr(value, "__slots__"):
+        children = (getattr(value, name) for name in value.__slots__)
+    return size + sum(_deep_sizeof(child, seen) for child in children)
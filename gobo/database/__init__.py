@@ -1,15 +1,19 @@
 import atexit
+from collections import Counter
+from collections.abc import Mapping
 from dataclasses import dataclass
 from functools import cache
 from sqlite3 import Connection, connect
+from typing import Any
 
-from pkg_resources import resource_string
+from pkg_resources import resource_listdir, resource_string
 
-from . import area, municipality, spot
+from ..types import Edition, SpotID
+from . import area, edition, municipality, spot
 
 
 @dataclass(frozen=True)
-class Database(area.Database, municipality.Database, spot.Database):
+class Database(area.Database, edition.Database, municipality.Database, spot.Database):
     connection: Connection
 
     def close(self) -> None:
@@ -17,13 +21,77 @@ class Database(area.Database, municipality.Database, spot.Database):
 
 
 @cache
-def _get_db() -> Database:
+def editions() -> tuple[Edition, ...]:
+    return tuple(
+        sorted(
+            Edition(int(name.removesuffix(".sql")))
+            for name in resource_listdir(__name__, "editions")
+            if name.endswith(".sql")
+        )
+    )
+
+
+def latest_edition() -> Edition:
+    return editions()[-1]
+
+
+@cache
+def get_db(edition: Edition) -> Database:
+    if edition not in editions():
+        raise ValueError(edition)
+
     connection = connect(":memory:")
-    connection.cursor().executescript(resource_string(__name__, "gobo.sql").decode("utf-8"))
+    connection.cursor().executescript(
+        resource_string(__name__, f"editions/{edition}.sql").decode("utf-8")
+    )
 
     db = Database(connection)
     atexit.register(db.close)
     return db
 
 
-db = _get_db()
+def recurring_spots(old: Database, new: Database) -> list[tuple[SpotID, SpotID]]:
+    """
+    前の版と次の版で同じスポットの組
+
+    同じ ID で URI か住所が一致するものを優先し、残りはどちらの版でも一つの
+    スポットにしか使われていない URI、住所の順に対応付ける。前の版のスポットは一度しか使わない
+    """
+    old_uris, new_uris = old.spot_uris, new.spot_uris
+    old_addresses, new_addresses = old.spot_addresses, new.spot_addresses
+
+    matches: dict[SpotID, SpotID] = {}
+    for id in new.spots:
+        uri, address = new_uris.get(id), new_addresses.get(id)
+        if (uri is not None and old_uris.get(id) == uri) or (
+            address is not None and old_addresses.get(id) == address
+        ):
+            matches[id] = id
+
+    used = set(matches.values())
+    for old_values, new_values in ((old_uris, new_uris), (old_addresses, new_addresses)):
+        candidates = _unique(old_values)
+        unique_new = _unique(new_values)
+        for value, new_id in unique_new.items():
+            old_id = candidates.get(value)
+            if new_id in matches or old_id is None or old_id in used:
+                continue
+            matches[new_id] = old_id
+            used.add(old_id)
+
+    return [(matches[id], id) for id in new.spots if id in matches]
+
+
+def _unique(values: Mapping[SpotID, str]) -> dict[str, SpotID]:
+    """
+    一つのスポットにしか使われていない値からスポットへの辞書
+    """
+    counts = Counter(values.values())
+    return {value: id for id, value in values.items() if counts[value] == 1}
+
+
+def __getattr__(name: str) -> Any:
+    # `db` は従来通り最新版を指すが、参照されるまで読み込まない
+    if name == "db":
+        return get_db(latest_edition())
+    raise AttributeError(name)
@@ -0,0 +1,34 @@
+from sqlite3 import Connection
+
+from ..types import URI, Edition, SpotID
+
+
+class Database:
+    connection: Connection
+
+    @property
+    def edition(self) -> Edition:
+        cursor = self.connection.cursor()
+        cursor.execute(
+            """
+SELECT edition
+FROM edition
+            """
+        )
+        (edition,) = map(Edition, cursor.fetchone())
+        return edition
+
+    @property
+    def platinumaps(self) -> str:
+        cursor = self.connection.cursor()
+        cursor.execute(
+            """
+SELECT platinumaps
+FROM edition
+            """
+        )
+        (platinumaps,) = map(str, cursor.fetchone())
+        return platinumaps
+
+    def platinumaps_uri(self, id: SpotID) -> URI:
+        return URI(f"https://platinumaps.jp/d/{self.platinumaps}?s={id}")
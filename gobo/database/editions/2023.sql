@@ -12,6 +12,148 @@ INSERT INTO "area_names" VALUES(3,0,'北総エリア');
 INSERT INTO "area_names" VALUES(4,0,'九十九里エリア');
 INSERT INTO "area_names" VALUES(5,0,'南房総エリア');
 INSERT INTO "area_names" VALUES(6,0,'かずさ・臨海エリア');
+CREATE TABLE municipality_history
+(
+    municipality_id INTEGER NOT NULL,
+    notation_id INTEGER NOT NULL,
+    municipality_name TEXT NOT NULL,
+    valid_from TEXT NULL,
+    valid_until TEXT NULL
+);
+INSERT INTO "municipality_history" VALUES(12000,0,'千葉県',NULL,NULL);
+INSERT INTO "municipality_history" VALUES(12000,1,'ちばけん',NULL,NULL);
+INSERT INTO "municipality_history" VALUES(12100,0,'千葉市',NULL,NULL);
+INSERT INTO "municipality_history" VALUES(12100,1,'ちばし',NULL,NULL);
+INSERT INTO "municipality_history" VALUES(12101,0,'中央区',NULL,NULL);
+INSERT INTO "municipality_history" VALUES(12101,1,'ちゅうおうく',NULL,NULL);
+INSERT INTO "municipality_history" VALUES(12102,0,'花見川区',NULL,NULL);
+INSERT INTO "municipality_history" VALUES(12102,1,'はなみがわく',NULL,NULL);
+INSERT INTO "municipality_history" VALUES(12103,0,'稲毛区',NULL,NULL);
+INSERT INTO "municipality_history" VALUES(12103,1,'いなげく',NULL,NULL);
+INSERT INTO "municipality_history" VALUES(12104,0,'若葉区',NULL,NULL);
+INSERT INTO "municipality_history" VALUES(12104,1,'わかばく',NULL,NULL);
+INSERT INTO "municipality_history" VALUES(12105,0,'緑区',NULL,NULL);
+INSERT INTO "municipality_history" VALUES(12105,1,'みどりく',NULL,NULL);
+INSERT INTO "municipality_history" VALUES(12106,0,'美浜区',NULL,NULL);
+INSERT INTO "municipality_history" VALUES(12106,1,'みはまく',NULL,NULL);
+INSERT INTO "municipality_history" VALUES(12202,0,'銚子市',NULL,NULL);
+INSERT INTO "municipality_history" VALUES(12202,1,'ちょうしし',NULL,NULL);
+INSERT INTO "municipality_history" VALUES(12203,0,'市川市',NULL,NULL);
+INSERT INTO "municipality_history" VALUES(12203,1,'いちかわし',NULL,NULL);
+INSERT INTO "municipality_history" VALUES(12204,0,'船橋市',NULL,NULL);
+INSERT INTO "municipality_history" VALUES(12204,1,'ふなばしし',NULL,NULL);
+INSERT INTO "municipality_history" VALUES(12205,0,'館山市',NULL,NULL);
+INSERT INTO "municipality_history" VALUES(12205,1,'たてやまし',NULL,NULL);
+INSERT INTO "municipality_history" VALUES(12206,0,'木更津市',NULL,NULL);
+INSERT INTO "municipality_history" VALUES(12206,1,'きさらづし',NULL,NULL);
+INSERT INTO "municipality_history" VALUES(12207,0,'松戸市',NULL,NULL);
+INSERT INTO "municipality_history" VALUES(12207,1,'まつどし',NULL,NULL);
+INSERT INTO "municipality_history" VALUES(12208,0,'野田市',NULL,NULL);
+INSERT INTO "municipality_history" VALUES(12208,1,'のだし',NULL,NULL);
+INSERT INTO "municipality_history" VALUES(12210,0,'茂原市',NULL,NULL);
+INSERT INTO "municipality_history" VALUES(12210,1,'もばらし',NULL,NULL);
+INSERT INTO "municipality_history" VALUES(12211,0,'成田市',NULL,NULL);
+INSERT INTO "municipality_history" VALUES(12211,1,'なりたし',NULL,NULL);
+INSERT INTO "municipality_history" VALUES(12212,0,'佐倉市',NULL,NULL);
+INSERT INTO "municipality_history" VALUES(12212,1,'さくらし',NULL,NULL);
+INSERT INTO "municipality_history" VALUES(12213,0,'東金市',NULL,NULL);
+INSERT INTO "municipality_history" VALUES(12213,1,'とうがねし',NULL,NULL);
+INSERT INTO "municipality_history" VALUES(12215,0,'旭市',NULL,NULL);
+INSERT INTO "municipality_history" VALUES(12215,1,'あさひし',NULL,NULL);
+INSERT INTO "municipality_history" VALUES(12216,0,'習志野市',NULL,NULL);
+INSERT INTO "municipality_history" VALUES(12216,1,'ならしのし',NULL,NULL);
+INSERT INTO "municipality_history" VALUES(12217,0,'柏市',NULL,NULL);
+INSERT INTO "municipality_history" VALUES(12217,1,'かしわし',NULL,NULL);
+INSERT INTO "municipality_history" VALUES(12218,0,'勝浦市',NULL,NULL);
+INSERT INTO "municipality_history" VALUES(12218,1,'かつうらし',NULL,NULL);
+INSERT INTO "municipality_history" VALUES(12219,0,'市原市',NULL,NULL);
+INSERT INTO "municipality_history" VALUES(12219,1,'いちはらし',NULL,NULL);
+INSERT INTO "municipality_history" VALUES(12220,0,'流山市',NULL,NULL);
+INSERT INTO "municipality_history" VALUES(12220,1,'ながれやまし',NULL,NULL);
+INSERT INTO "municipality_history" VALUES(12221,0,'八千代市',NULL,NULL);
+INSERT INTO "municipality_history" VALUES(12221,1,'やちよし',NULL,NULL);
+INSERT INTO "municipality_history" VALUES(12222,0,'我孫子市',NULL,NULL);
+INSERT INTO "municipality_history" VALUES(12222,1,'あびこし',NULL,NULL);
+INSERT INTO "municipality_history" VALUES(12223,0,'鴨川市',NULL,NULL);
+INSERT INTO "municipality_history" VALUES(12223,1,'かもがわし',NULL,NULL);
+INSERT INTO "municipality_history" VALUES(12224,0,'鎌ヶ谷市',NULL,NULL);
+INSERT INTO "municipality_history" VALUES(12224,1,'かまがやし',NULL,NULL);
+INSERT INTO "municipality_history" VALUES(12225,0,'君津市',NULL,NULL);
+INSERT INTO "municipality_history" VALUES(12225,1,'きみつし',NULL,NULL);
+INSERT INTO "municipality_history" VALUES(12226,0,'富津市',NULL,NULL);
+INSERT INTO "municipality_history" VALUES(12226,1,'ふっつし',NULL,NULL);
+INSERT INTO "municipality_history" VALUES(12227,0,'浦安市',NULL,NULL);
+INSERT INTO "municipality_history" VALUES(12227,1,'うらやすし',NULL,NULL);
+INSERT INTO "municipality_history" VALUES(12228,0,'四街道市',NULL,NULL);
+INSERT INTO "municipality_history" VALUES(12228,1,'よつかいどうし',NULL,NULL);
+INSERT INTO "municipality_history" VALUES(12229,0,'袖ヶ浦市',NULL,NULL);
+INSERT INTO "municipality_history" VALUES(12229,1,'そでがうらし',NULL,NULL);
+INSERT INTO "municipality_history" VALUES(12230,0,'八街市',NULL,NULL);
+INSERT INTO "municipality_history" VALUES(12230,1,'やちまたし',NULL,NULL);
+INSERT INTO "municipality_history" VALUES(12231,0,'印西市',NULL,NULL);
+INSERT INTO "municipality_history" VALUES(12231,1,'いんざいし',NULL,NULL);
+INSERT INTO "municipality_history" VALUES(12232,0,'白井市',NULL,NULL);
+INSERT INTO "municipality_history" VALUES(12232,1,'しろいし',NULL,NULL);
+INSERT INTO "municipality_history" VALUES(12233,0,'富里市',NULL,NULL);
+INSERT INTO "municipality_history" VALUES(12233,1,'とみさとし',NULL,NULL);
+INSERT INTO "municipality_history" VALUES(12234,0,'南房総市',NULL,NULL);
+INSERT INTO "municipality_history" VALUES(12234,1,'みなみぼうそうし',NULL,NULL);
+INSERT INTO "municipality_history" VALUES(12235,0,'匝瑳市',NULL,NULL);
+INSERT INTO "municipality_history" VALUES(12235,1,'そうさし',NULL,NULL);
+INSERT INTO "municipality_history" VALUES(12236,0,'香取市',NULL,NULL);
+INSERT INTO "municipality_history" VALUES(12236,1,'かとりし',NULL,NULL);
+INSERT INTO "municipality_history" VALUES(12237,0,'山武市',NULL,NULL);
+INSERT INTO "municipality_history" VALUES(12237,1,'さんむし',NULL,NULL);
+INSERT INTO "municipality_history" VALUES(12238,0,'いすみ市',NULL,NULL);
+INSERT INTO "municipality_history" VALUES(12238,1,'いすみし',NULL,NULL);
+INSERT INTO "municipality_history" VALUES(12239,0,'大網白里市',NULL,NULL);
+INSERT INTO "municipality_history" VALUES(12239,1,'おおあみしらさとし',NULL,NULL);
+INSERT INTO "municipality_history" VALUES(12320,0,'印旛郡',NULL,NULL);
+INSERT INTO "municipality_history" VALUES(12320,1,'いんばぐん',NULL,NULL);
+INSERT INTO "municipality_history" VALUES(12322,0,'酒々井町',NULL,NULL);
+INSERT INTO "municipality_history" VALUES(12322,1,'しすいまち',NULL,NULL);
+INSERT INTO "municipality_history" VALUES(12329,0,'栄町',NULL,NULL);
+INSERT INTO "municipality_history" VALUES(12329,1,'さかえまち',NULL,NULL);
+INSERT INTO "municipality_history" VALUES(12340,0,'香取郡',NULL,NULL);
+INSERT INTO "municipality_history" VALUES(12340,1,'かとりぐん',NULL,NULL);
+INSERT INTO "municipality_history" VALUES(12342,0,'神崎町',NULL,NULL);
+INSERT INTO "municipality_history" VALUES(12342,1,'こうざきまち',NULL,NULL);
+INSERT INTO "municipality_history" VALUES(12347,0,'多古町',NULL,NULL);
+INSERT INTO "municipality_history" VALUES(12347,1,'たこまち',NULL,NULL);
+INSERT INTO "municipality_history" VALUES(12349,0,'東庄町',NULL,NULL);
+INSERT INTO "municipality_history" VALUES(12349,1,'とうのしょうまち',NULL,NULL);
+INSERT INTO "municipality_history" VALUES(12400,0,'山武郡',NULL,NULL);
+INSERT INTO "municipality_history" VALUES(12400,1,'さんぶぐん',NULL,NULL);
+INSERT INTO "municipality_history" VALUES(12403,0,'九十九里町',NULL,NULL);
+INSERT INTO "municipality_history" VALUES(12403,1,'くじゅうくりまち',NULL,NULL);
+INSERT INTO "municipality_history" VALUES(12409,0,'芝山町',NULL,NULL);
+INSERT INTO "municipality_history" VALUES(12409,1,'しばやままち',NULL,NULL);
+INSERT INTO "municipality_history" VALUES(12410,0,'横芝光町',NULL,NULL);
+INSERT INTO "municipality_history" VALUES(12410,1,'よこしばひかりまち',NULL,NULL);
+INSERT INTO "municipality_history" VALUES(12420,0,'長生郡',NULL,NULL);
+INSERT INTO "municipality_history" VALUES(12420,1,'ちょうせいぐん',NULL,NULL);
+INSERT INTO "municipality_history" VALUES(12421,0,'一宮町',NULL,NULL);
+INSERT INTO "municipality_history" VALUES(12421,1,'いちのみやまち',NULL,NULL);
+INSERT INTO "municipality_history" VALUES(12422,0,'睦沢町',NULL,NULL);
+INSERT INTO "municipality_history" VALUES(12422,1,'むつざわまち',NULL,NULL);
+INSERT INTO "municipality_history" VALUES(12423,0,'長生村',NULL,NULL);
+INSERT INTO "municipality_history" VALUES(12423,1,'ちょうせいむら',NULL,NULL);
+INSERT INTO "municipality_history" VALUES(12424,0,'白子町',NULL,NULL);
+INSERT INTO "municipality_history" VALUES(12424,1,'しらこまち',NULL,NULL);
+INSERT INTO "municipality_history" VALUES(12426,0,'長柄町',NULL,NULL);
+INSERT INTO "municipality_history" VALUES(12426,1,'ながらまち',NULL,NULL);
+INSERT INTO "municipality_history" VALUES(12427,0,'長南町',NULL,NULL);
+INSERT INTO "municipality_history" VALUES(12427,1,'ちょうなんまち',NULL,NULL);
+INSERT INTO "municipality_history" VALUES(12440,0,'夷隅郡',NULL,NULL);
+INSERT INTO "municipality_history" VALUES(12440,1,'いすみぐん',NULL,NULL);
+INSERT INTO "municipality_history" VALUES(12441,0,'大多喜町',NULL,NULL);
+INSERT INTO "municipality_history" VALUES(12441,1,'おおたきまち',NULL,NULL);
+INSERT INTO "municipality_history" VALUES(12443,0,'御宿町',NULL,NULL);
+INSERT INTO "municipality_history" VALUES(12443,1,'おんじゅくまち',NULL,NULL);
+INSERT INTO "municipality_history" VALUES(12460,0,'安房郡',NULL,NULL);
+INSERT INTO "municipality_history" VALUES(12460,1,'あわぐん',NULL,NULL);
+INSERT INTO "municipality_history" VALUES(12463,0,'鋸南町',NULL,NULL);
+INSERT INTO "municipality_history" VALUES(12463,1,'きょなんまち',NULL,NULL);
 CREATE TABLE municipality_list
 (
     `index` INTEGER PRIMARY KEY,
@@ -1761,4 +1903,10 @@ INSERT INTO "spot_uris" VALUES(210060,'https://www.town.yokoshibahikari.chiba.jp
 INSERT INTO "spot_uris" VALUES(210061,'https://www.town.yokoshibahikari.chiba.jp/soshiki/14/1395.html#a02');
 INSERT INTO "spot_uris" VALUES(210062,'https://www.town.yokoshibahikari.chiba.jp/soshiki/14/1395.html#a08');
 INSERT INTO "spot_uris" VALUES(210663,'https://twitter.com/harumi_suijinja');
+CREATE TABLE edition
+(
+    edition INTEGER PRIMARY KEY,
+    platinumaps TEXT NOT NULL
+);
+INSERT INTO "edition" VALUES(2023,'gogo-boso');
 COMMIT;
@@ -1,3 +1,4 @@
+from datetime import date
 from sqlite3 import Connection
 
 from ..types import MunicipalityID, Notation
@@ -29,8 +30,11 @@ WHERE municipality_name = ?
             (name,),
         )
 
-        (id,) = map(MunicipalityID, cursor.fetchone())
-        return id
+        match cursor.fetchone():
+            case (id,):
+                return MunicipalityID(id)
+            case _:
+                raise ValueError(name)
 
     def municipality_parts(self, id: MunicipalityID) -> tuple[MunicipalityID, ...]:
         cursor = self.connection.cursor()
@@ -66,3 +70,25 @@ WHERE municipality_id = ? AND notation_id = ?
                 return name
             case _:
                 raise ValueError(id)
+
+    @property
+    def municipality_history(
+        self,
+    ) -> list[tuple[MunicipalityID, Notation, str, date | None, date | None]]:
+        cursor = self.connection.cursor()
+        cursor.execute(
+            """
+SELECT municipality_id, notation_id, municipality_name, valid_from, valid_until
+FROM municipality_history
+            """
+        )
+        return [
+            (
+                MunicipalityID(id),
+                Notation(notation_id),
+                name,
+                None if valid_from is None else date.fromisoformat(valid_from),
+                None if valid_until is None else date.fromisoformat(valid_until),
+            )
+            for id, notation_id, name, valid_from, valid_until in cursor.fetchall()
+        ]
@@ -50,6 +50,44 @@ WHERE spot_id = ?
             case _:
                 raise ValueError(id)
 
+    @property
+    def spot_uris(self) -> dict[SpotID, URI]:
+        cursor = self.connection.cursor()
+        cursor.execute(
+            """
+SELECT spot_id, spot_uri
+FROM spot_uris
+            """
+        )
+        return {SpotID(id): URI(uri) for id, uri in cursor.fetchall()}
+
+    def spot_address(self, id: SpotID) -> str:
+        cursor = self.connection.cursor()
+        cursor.execute(
+            """
+SELECT spot_address
+FROM spot_addresses
+WHERE spot_id = ?
+            """,
+            (id,),
+        )
+        match cursor.fetchone():
+            case (str(address),):
+                return address
+            case _:
+                raise ValueError(id)
+
+    @property
+    def spot_addresses(self) -> dict[SpotID, str]:
+        cursor = self.connection.cursor()
+        cursor.execute(
+            """
+SELECT spot_id, spot_address
+FROM spot_addresses
+            """
+        )
+        return {SpotID(id): address for id, address in cursor.fetchall()}
+
     def spot_area(self, id: SpotID) -> Area:
         cursor = self.connection.cursor()
         cursor.execute(
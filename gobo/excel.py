@@ -0,0 +1,224 @@
+from __future__ import annotations
+
+from collections.abc import Collection, Generator
+from concurrent.futures import ProcessPoolExecutor
+from contextlib import closing
+from dataclasses import dataclass
+from pathlib import Path, PurePosixPath
+from typing import TYPE_CHECKING
+from urllib.parse import parse_qs, urlparse
+from xml.etree.ElementTree import iterparse
+from zipfile import ZipFile
+
+from openpyxl import Workbook, load_workbook
+from openpyxl.utils.cell import column_index_from_string, range_boundaries
+
+from .history import get_history
+from .types import URI, SpotID
+
+if TYPE_CHECKING:
+    from .catalog import Catalog
+    from .database import Database
+    from .snapshot import Snapshot
+
+SPOT_SHEET = "スポット"
+TOTAL_SHEET = "集計"
+
+CLEARED = "A"
+NAME = "B"
+MUNICIPALITY = "C"
+PLATINUMAPS = "D"
+FACILITY = "E"
+
+_MAIN = "{http://schemas.openxmlformats.org/spreadsheetml/2006/main}"
+_PACKAGE = "{http://schemas.openxmlformats.org/package/2006/relationships}"
+_RELATIONSHIP = "{http://schemas.openxmlformats.org/officeDocument/2006/relationships}"
+
+
+@dataclass(frozen=True)
+class SpotRow:
+    id: SpotID
+    name: str
+    municipality: str
+    platinumaps: URI
+    uri: URI | None
+
+
+@dataclass(frozen=True)
+class Layout:
+    """
+    参加者によらないワークブックの中身
+    """
+
+    spots: tuple[SpotRow, ...]
+    municipalities: tuple[str, ...]
+
+
+def build_layout(db: Database | Catalog) -> Layout:
+    uris = db.spot_uris
+    return Layout(
+        spots=tuple(
+            SpotRow(
+                spot_id,
+                db.spot_name(spot_id).replace("\u3000", " "),
+                scraping_address(db, spot_id),
+                db.platinumaps_uri(spot_id),
+                uris.get(spot_id),
+            )
+            for spot_id in db.spots
+        ),
+        municipalities=tuple(map(db.municipality_name, db.municipalities)),
+    )
+
+
+def create_workbook(layout: Layout) -> Workbook:
+    wb = Workbook()
+
+    spot_sheet = wb.create_sheet(SPOT_SHEET)
+    spot_sheet[f"{CLEARED}1"] = "達成"
+    spot_sheet[f"{NAME}1"] = "名前"
+    spot_sheet[f"{MUNICIPALITY}1"] = "市町村"
+
+    for i, spot in enumerate(layout.spots, start=2):
+        spot_sheet[f"{CLEARED}{i}"] = False
+        spot_sheet[f"{NAME}{i}"].value = spot.name
+        spot_sheet[f"{MUNICIPALITY}{i}"] = spot.municipality
+        spot_sheet[f"{PLATINUMAPS}{i}"].value = "リンク(GoGo房総)"
+        spot_sheet[f"{PLATINUMAPS}{i}"].hyperlink = spot.platinumaps
+        if spot.uri is not None:
+            spot_sheet[f"{FACILITY}{i}"].hyperlink = spot.uri
+            spot_sheet[f"{FACILITY}{i}"].value = "リンク(施設)"
+
+    spot_sheet.auto_filter.ref = spot_sheet.dimensions
+
+    spot_clear_range = f"{SPOT_SHEET}!${CLEARED}${1+1}:${CLEARED}${1+len(layout.spots)}"
+    spot_area_range = f"{SPOT_SHEET}!${MUNICIPALITY}${1+1}:${MUNICIPALITY}${1+len(layout.spots)}"
+
+    total_sheet = wb.create_sheet(TOTAL_SHEET)
+    total_sheet["A1"] = "市町村"
+    total_sheet["B1"] = "達成数"
+    total_sheet["C1"] = "総数"
+    total_sheet["D1"] = "達成率"
+    for i, name in enumerate(layout.municipalities, start=2):
+        total_sheet[f"A{i}"] = name
+        total_sheet[f"B{i}"] = f'=COUNTIFS({spot_area_range}, "*{name}*", {spot_clear_range}, TRUE)'
+        total_sheet[f"C{i}"] = f'=COUNTIFS({spot_area_range}, "*{name}*")'
+        total_sheet[f"D{i}"] = f"=100 * $B${i} / $C${i}"
+
+    wb.remove(wb.worksheets[0])
+    return wb
+
+
+def set_progress(wb: Workbook, layout: Layout, cleared: Collection[SpotID]) -> None:
+    """
+    参加者ごとに違うセル (達成) だけを書き換える
+    """
+    spot_sheet = wb[SPOT_SHEET]
+    for i, spot in enumerate(layout.spots, start=2):
+        spot_sheet[f"{CLEARED}{i}"] = spot.id in cleared
+
+
+# プロセスプールの各ワーカーが一度だけ組み立てるワークブック
+_template: tuple[Layout, Workbook] | None = None
+
+
+def write_batch(
+    layout: Layout,
+    outputs: Collection[tuple[Path, Collection[SpotID]]],
+    max_workers: int | None = None,
+) -> list[Path]:
+    """
+    参加者ごとのワークブックをプロセスプールで書き出す
+
+    各ワーカーは `layout` からワークブックを一度だけ作り、達成の列だけを書き換えて保存する
+    """
+    paths = [path for path, _ in outputs]
+    cleared = [frozenset(spots) for _, spots in outputs]
+    with ProcessPoolExecutor(
+        max_workers, initializer=_initialize_template, initargs=(layout,)
+    ) as executor:
+        return list(executor.map(_write_from_template, paths, cleared, chunksize=8))
+
+
+def _initialize_template(layout: Layout) -> None:
+    global _template
+    _template = layout, create_workbook(layout)
+
+
+def _write_from_template(path: Path, cleared: frozenset[SpotID]) -> Path:
+    assert _template is not None
+    layout, wb = _template
+    set_progress(wb, layout, cleared)
+    wb.save(path)
+    return path
+
+
+def read_progress(path: Path) -> dict[SpotID, bool]:
+    with closing(load_workbook(path, read_only=True, data_only=True)) as wb:
+        ws = wb[SPOT_SHEET]
+        # read-only モードではハイパーリンクが読まれないので、シートの XML から直接拾う
+        archive: ZipFile = wb._archive  # type: ignore
+        worksheet_path: str = ws._worksheet_path  # type: ignore
+        links = dict(_iter_hyperlinks(archive, worksheet_path, column=PLATINUMAPS))
+
+        progress: dict[SpotID, bool] = {}
+        for row, (cleared,) in enumerate(
+            ws.iter_rows(min_row=2, max_col=1, values_only=True), start=2
+        ):
+            if row in links:
+                progress[links[row]] = cleared is True
+        return progress
+
+
+def _iter_hyperlinks(
+    archive: ZipFile, worksheet_path: str, column: str
+) -> Generator[tuple[int, SpotID], None, None]:
+    path = PurePosixPath(worksheet_path)
+    rels_path = str(path.parent / "_rels" / f"{path.name}.rels")
+    if rels_path not in archive.namelist():
+        return
+
+    targets: dict[str, str] = {}
+    with archive.open(rels_path) as source:
+        for _, element in iterparse(source):
+            if element.tag == f"{_PACKAGE}Relationship":
+                targets[element.attrib["Id"]] = element.attrib["Target"]
+            element.clear()
+
+    index = column_index_from_string(column)
+    with archive.open(worksheet_path) as source:
+        for _, element in iterparse(source):
+            if element.tag == f"{_MAIN}hyperlink":
+                # ref は "D2" のようなセルのほか、"D2:D3" のような範囲のこともある
+                # (行や列全体の範囲は読み飛ばす)
+                ref = range_boundaries(element.attrib["ref"])
+                target = targets.get(element.attrib.get(f"{_RELATIONSHIP}id", ""))
+                match ref, parse_qs(urlparse(target or "").query).get("s"):
+                    case (int(min_col), int(min_row), int(max_col), int(max_row)), [id] if (
+                        min_col <= index <= max_col
+                    ):
+                        for row in range(min_row, max_row + 1):
+                            yield row, SpotID(int(id))
+            element.clear()
+
+
+def scraping_address(db: Database | Catalog | Snapshot, spot_id: SpotID) -> str:
+    address = get_history(db).normalize_address(db.spot_address(spot_id))
+
+    if address == "印旛郡酒々井町本佐倉・佐倉市大佐倉":
+        return "酒々井町;佐倉市"
+    if address == "夷隅郡大多喜町粟又～市原市朝生原":
+        return "大多喜町;市原市"
+    if address == "市原市・長生郡長柄町":
+        return "市原市;長柄町"
+
+    names = [
+        name
+        for name in map(db.municipality_name, db.municipalities)
+        if name in address.replace("ケ", "ヶ").replace("舘山", "館山")
+    ]
+
+    if len(names) == 1:
+        return names[0]
+    else:
+        raise ValueError(address, names)
@@ -0,0 +1,145 @@
+"""
+市町村コードと名前の変遷を期間で引く索引
+
+同じキー(コードまたは名前)の期間は重ならないので、開始日で二分探索する
+"""
+
+from __future__ import annotations
+
+import re
+from bisect import bisect_right
+from collections import defaultdict
+from collections.abc import Iterable
+from dataclasses import dataclass, field
+from datetime import date
+from functools import cache
+from typing import TYPE_CHECKING, Generic, TypeVar
+
+from .types import MunicipalityID, Notation
+
+if TYPE_CHECKING:
+    from .catalog import Catalog
+    from .database import Database
+    from .snapshot import Snapshot
+
+T = TypeVar("T")
+
+
+@dataclass
+class _Intervals(Generic[T]):
+    """
+    [valid_from, valid_until) の期間と値の組。開始日順に並べて持つ
+    """
+
+    starts: list[date] = field(default_factory=list)
+    ends: list[date] = field(default_factory=list)
+    values: list[T] = field(default_factory=list)
+
+    def add(self, valid_from: date | None, valid_until: date | None, value: T) -> None:
+        start = valid_from or date.min
+        i = bisect_right(self.starts, start)
+        self.starts.insert(i, start)
+        self.ends.insert(i, valid_until or date.max)
+        self.values.insert(i, value)
+
+    def at(self, on: date) -> T | None:
+        i = bisect_right(self.starts, on) - 1
+        if i >= 0 and on < self.ends[i]:
+            return self.values[i]
+        return None
+
+    def latest(self) -> T:
+        return self.values[-1]
+
+
+class MunicipalityHistory:
+    def __init__(
+        self,
+        rows: Iterable[tuple[MunicipalityID, Notation, str, date | None, date | None]],
+        current: dict[MunicipalityID, str],
+    ) -> None:
+        self._names: defaultdict[tuple[MunicipalityID, Notation], _Intervals[str]]
+        self._names = defaultdict(_Intervals)
+        self._ids: defaultdict[str, _Intervals[MunicipalityID]] = defaultdict(_Intervals)
+
+        kanji = set()
+        for id, notation, name, valid_from, valid_until in rows:
+            self._names[id, notation].add(valid_from, valid_until, name)
+            self._ids[name].add(valid_from, valid_until, id)
+            if notation is Notation.default:
+                kanji.add(name)
+
+        # 今の名前と違う(古い)名前を、長いものから順に置き換える
+        self._old_names = {
+            name: current[id]
+            for name in kanji
+            if (id := self._ids[name].latest()) in current and current[id] != name
+        }
+        self._pattern = (
+            re.compile("|".join(map(re.escape, sorted(self._old_names, key=len, reverse=True))))
+            if self._old_names
+            else None
+        )
+
+    @classmethod
+    def from_db(cls, db: Database | Catalog | Snapshot) -> MunicipalityHistory:
+        rows = db.municipality_history
+        current = {
+            id: name
+            for id, notation, name, _, valid_until in rows
+            if notation is Notation.default and valid_until is None
+        }
+        return cls(rows, current)
+
+    def name(self, id: MunicipalityID, on: date, notation: Notation = Notation.default) -> str:
+        """
+        `on` の日に `id` が指していた名前
+        """
+        intervals = self._names.get((id, notation))
+        name = None if intervals is None else intervals.at(on)
+        if name is None:
+            raise ValueError(id, on, notation)
+        return name
+
+    def resolve(self, name: str, on: date | None = None) -> MunicipalityID:
+        """
+        `on` の日に `name` (どちらの表記でもよい) が指していた市町村。
+        `on` を省くと、その名前が最後に使われていた市町村
+        """
+        intervals = self._ids.get(name)
+        id = None
+        if intervals is not None:
+            id = intervals.latest() if on is None else intervals.at(on)
+        if id is None:
+            raise ValueError(name, on)
+        return id
+
+    def resolve_many(
+        self, names: Iterable[str], on: date | None = None
+    ) -> dict[str, MunicipalityID]:
+        result = {}
+        for name in set(names):
+            try:
+                result[name] = self.resolve(name, on)
+            except ValueError:
+                pass
+        return result
+
+    def current_name(self, name: str) -> str:
+        return self._old_names.get(name, name)
+
+    def normalize_address(self, address: str) -> str:
+        """
+        住所に含まれる古い市町村名を今の名前に置き換える
+        """
+        if self._pattern is None:
+            return address
+        return self._pattern.sub(lambda m: self._old_names[m.group()], address)
+
+    def normalize_addresses(self, addresses: Iterable[str]) -> list[str]:
+        return [self.normalize_address(address) for address in addresses]
+
+
+@cache
+def get_history(db: Database | Catalog | Snapshot) -> MunicipalityHistory:
+    return MunicipalityHistory.from_db(db)
@@ -0,0 +1,125 @@
+"""
+スポットの URI のリンク切れを調べる
+
+aiohttp (bootstrap グループ) が必要
+"""
+
+import time
+from asyncio import Semaphore, TimeoutError, gather
+from collections import defaultdict
+from collections.abc import Collection, Iterable
+from dataclasses import dataclass
+from sqlite3 import Connection
+from urllib.parse import urlparse
+
+from aiohttp import ClientError, ClientSession, ClientTimeout, TCPConnector
+
+from .types import URI
+
+
+@dataclass(frozen=True)
+class LinkStatus:
+    uri: URI
+    status: int | None
+    error: str | None
+    checked_at: float
+
+    @property
+    def ok(self) -> bool:
+        return self.status is not None and self.status < 400
+
+
+def create_table(connection: Connection) -> None:
+    connection.execute(
+        """
+CREATE TABLE IF NOT EXISTS link_status
+(
+    uri TEXT PRIMARY KEY,
+    status INTEGER NULL,
+    error TEXT NULL,
+    checked_at REAL NOT NULL
+)
+        """
+    )
+
+
+def load(connection: Connection, uris: Iterable[URI]) -> dict[URI, LinkStatus]:
+    cursor = connection.cursor()
+    result = {}
+    for uri in uris:
+        cursor.execute(
+            """
+SELECT status, error, checked_at
+FROM link_status
+WHERE uri = ?
+            """,
+            (uri,),
+        )
+        match cursor.fetchone():
+            case (status, error, checked_at):
+                result[uri] = LinkStatus(uri, status, error, checked_at)
+    return result
+
+
+def save(connection: Connection, statuses: Iterable[LinkStatus]) -> None:
+    with connection:
+        connection.executemany(
+            """
+INSERT OR REPLACE INTO link_status
+(
+    uri, status, error, checked_at
+)
+VALUES
+(
+    ?, ?, ?, ?
+)
+            """,
+            ((s.uri, s.status, s.error, s.checked_at) for s in statuses),
+        )
+
+
+def stale(
+    statuses: dict[URI, LinkStatus], uris: Iterable[URI], max_age: float, now: float
+) -> list[URI]:
+    return sorted(
+        {uri for uri in uris if uri not in statuses or now - statuses[uri].checked_at > max_age}
+    )
+
+
+async def check_links(
+    uris: Collection[URI],
+    limit: int = 16,
+    limit_per_host: int = 2,
+    timeout: float = 10.0,
+) -> list[LinkStatus]:
+    # 接続プールの空きを待つ時間も `total` に数えられてしまうので、
+    # 同時に投げるリクエストの数はセマフォで抑えてからタイムアウトを計る
+    semaphore = Semaphore(limit)
+    semaphores: defaultdict[str, Semaphore] = defaultdict(lambda: Semaphore(limit_per_host))
+
+    async with ClientSession(
+        connector=TCPConnector(limit=limit, limit_per_host=limit_per_host),
+        timeout=ClientTimeout(total=timeout),
+    ) as session:
+
+        async def check(uri: URI) -> LinkStatus:
+            async with semaphores[urlparse(uri).netloc], semaphore:
+                return await _check(session, uri)
+
+        return await gather(*map(check, uris))
+
+
+async def _check(session: ClientSession, uri: URI) -> LinkStatus:
+    # HEAD を受け付けないサーバーがあるので、失敗したら GET で確認する
+    try:
+        async with session.head(uri, allow_redirects=True) as response:
+            if response.status < 400:
+                return LinkStatus(uri, response.status, None, time.time())
+    except (ClientError, TimeoutError):
+        pass
+
+    try:
+        async with session.get(uri, allow_redirects=True) as response:
+            return LinkStatus(uri, response.status, None, time.time())
+    except (ClientError, TimeoutError) as error:
+        return LinkStatus(uri, None, str(error) or type(error).__name__, time.time())
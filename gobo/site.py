@@ -0,0 +1,233 @@
+"""
+市町村別・エリア別のスポット一覧を静的サイトとして書き出す
+
+各ページの元になる行のハッシュを manifest に残し、変わったページだけを
+プロセスプールで描画し直す
+"""
+
+from __future__ import annotations
+
+import json
+from collections.abc import Iterable, Mapping, Sequence
+from concurrent.futures import ProcessPoolExecutor
+from contextlib import suppress
+from dataclasses import dataclass
+from hashlib import sha256
+from html import escape
+from pathlib import Path
+from sqlite3 import Error
+from typing import TYPE_CHECKING, Any
+
+from .excel import scraping_address
+from .types import Area, MunicipalityID, SpotID
+
+if TYPE_CHECKING:
+    from .catalog import Catalog
+    from .database import Database
+
+MANIFEST = ".manifest.json"
+
+# テンプレートを変えたら上げる (全ページを描画し直す)
+TEMPLATE_VERSION = 2
+
+
+@dataclass(frozen=True)
+class Page:
+    path: str
+    title: str
+    kind: str
+    rows: Any
+
+    @property
+    def digest(self) -> str:
+        content = json.dumps(
+            [TEMPLATE_VERSION, self.title, self.kind, self.rows], ensure_ascii=False
+        )
+        return sha256(content.encode("utf-8")).hexdigest()
+
+
+@dataclass(frozen=True)
+class Result:
+    written: list[str]
+    skipped: list[str]
+    removed: list[str]
+
+
+def spot_municipalities(db: Database | Catalog) -> dict[SpotID, list[MunicipalityID]]:
+    return {
+        spot_id: [
+            db.municipality_by_name(name) for name in scraping_address(db, spot_id).split(";")
+        ]
+        for spot_id in db.spots
+    }
+
+
+def collect_pages(
+    db: Database | Catalog, municipalities: Mapping[SpotID, Sequence[MunicipalityID]]
+) -> list[Page]:
+    spots = db.spots
+    uris = db.spot_uris
+    areas = {id: area for id in spots if (area := _spot_area(db, id)) is not None}
+
+    def spot_row(id: SpotID) -> tuple[int, str]:
+        return id, db.spot_name(id)
+
+    municipality_pages = [
+        Page(
+            f"municipality/{municipality_id}.html",
+            db.municipality_name(municipality_id),
+            "spots",
+            [spot_row(id) for id in spots if municipality_id in municipalities.get(id, ())],
+        )
+        for municipality_id in db.municipalities
+    ]
+    # スポットとエリアの対応が無い版では、空のエリアのページは作らない
+    area_pages = [
+        Page(f"area/{area.value}.html", db.area_name(area), "spots", rows)
+        for area in Area
+        if (rows := [spot_row(id) for id in spots if areas.get(id) is area])
+    ]
+    spot_pages = [
+        Page(
+            f"spot/{id}.html",
+            db.spot_name(id),
+            "spot",
+            {
+                "address": db.spot_address(id),
+                "uri": uris.get(id),
+                "platinumaps": db.platinumaps_uri(id),
+                "municipalities": [
+                    (m, db.municipality_name(m)) for m in municipalities.get(id, ())
+                ],
+                "area": None if id not in areas else (areas[id].value, db.area_name(areas[id])),
+            },
+        )
+        for id in spots
+    ]
+    index = Page(
+        "index.html",
+        f"GoGo房総 {db.edition}",
+        "index",
+        {
+            "areas": [(p.path, p.title, len(p.rows)) for p in area_pages],
+            "municipalities": [(p.path, p.title, len(p.rows)) for p in municipality_pages],
+            "spots": len(spots),
+        },
+    )
+    return [index, *area_pages, *municipality_pages, *spot_pages]
+
+
+def build(outdir: Path, pages: Sequence[Page], max_workers: int | None = None) -> Result:
+    manifest_path = outdir / MANIFEST
+    manifest: dict[str, str] = {}
+    with suppress(FileNotFoundError):
+        manifest = json.loads(manifest_path.read_text(encoding="utf-8"))
+
+    digests = {page.path: page.digest for page in pages}
+    changed = [
+        page
+        for page in pages
+        if manifest.get(page.path) != digests[page.path] or not (outdir / page.path).exists()
+    ]
+    removed = sorted(manifest.keys() - digests.keys())
+
+    written: list[str] = []
+    if changed:
+        with ProcessPoolExecutor(max_workers) as executor:
+            written = list(executor.map(_write, [outdir] * len(changed), changed, chunksize=16))
+
+    for path in removed:
+        (outdir / path).unlink(missing_ok=True)
+
+    outdir.mkdir(parents=True, exist_ok=True)
+    manifest_path.write_text(json.dumps(digests, indent=2, sort_keys=True), encoding="utf-8")
+
+    return Result(
+        written=written,
+        skipped=sorted(digests.keys() - set(written)),
+        removed=removed,
+    )
+
+
+def render(page: Page) -> str:
+    depth = page.path.count("/")
+    root = "../" * depth
+
+    match page.kind:
+        case "index":
+            sections = [f"<p>{page.rows['spots']} スポット</p>"]
+            if page.rows["areas"]:
+                sections += ["<h2>エリア</h2>", _links(root, page.rows["areas"])]
+            sections += ["<h2>市町村</h2>", _links(root, page.rows["municipalities"])]
+            body = "".join(sections)
+        case "spots":
+            body = "<ul>{}</ul>".format(
+                "".join(
+                    f'<li><a href="{root}spot/{id}.html">{escape(name)}</a></li>'
+                    for id, name in page.rows
+                )
+            )
+        case "spot":
+            rows = page.rows
+            items = [("住所", escape(rows["address"]))]
+            if rows["municipalities"]:
+                items.append(
+                    (
+                        "市町村",
+                        " / ".join(
+                            f'<a href="{root}municipality/{id}.html">{escape(name)}</a>'
+                            for id, name in rows["municipalities"]
+                        ),
+                    )
+                )
+            if rows["area"] is not None:
+                area_id, area_name = rows["area"]
+                items.append(
+                    ("エリア", f'<a href="{root}area/{area_id}.html">{escape(area_name)}</a>')
+                )
+            items.append(("GoGo房総", f'<a href="{escape(rows["platinumaps"])}">platinumaps</a>'))
+            if rows["uri"] is not None:
+                items.append(("施設", f'<a href="{escape(rows["uri"])}">{escape(rows["uri"])}</a>'))
+            body = "<dl>{}</dl>".format(
+                "".join(f"<dt>{label}</dt><dd>{value}</dd>" for label, value in items)
+            )
+        case _:
+            raise ValueError(page.kind)
+
+    return f"""<!DOCTYPE html>
+<html lang="ja">
+<head>
+<meta charset="utf-8">
+<title>{escape(page.title)}</title>
+</head>
+<body>
+<nav><a href="{root}index.html">トップ</a></nav>
+<h1>{escape(page.title)}</h1>
+{body}
+</body>
+</html>
+"""
+
+
+def _write(outdir: Path, page: Page) -> str:
+    path = outdir / page.path
+    path.parent.mkdir(parents=True, exist_ok=True)
+    path.write_text(render(page), encoding="utf-8")
+    return page.path
+
+
+def _links(root: str, rows: Iterable[tuple[str, str, int]]) -> str:
+    return "<ul>{}</ul>".format(
+        "".join(
+            f'<li><a href="{root}{path}">{escape(title)}</a> ({count})</li>'
+            for path, title, count in rows
+        )
+    )
+
+
+def _spot_area(db: Database | Catalog, id: SpotID) -> Area | None:
+    # spot_areas テーブルが無いデータベースもある
+    try:
+        return db.spot_area(id)
+    except (ValueError, Error):
+        return None
@@ -0,0 +1,403 @@
+"""
+データセットを列指向の読み取り専用スナップショットに詰める
+
+ID の列は array、文字列は一つのプールにまとめてインデックスで参照する。
+スナップショットは mmap したファイルや multiprocessing.shared_memory 上に置き、
+各ワーカーはコピーせずに `Snapshot` から `Database` と同じように引ける。
+"""
+
+from __future__ import annotations
+
+import mmap
+import struct
+from array import array
+from bisect import bisect_left
+from collections.abc import Iterable
+from datetime import date
+from multiprocessing.shared_memory import SharedMemory
+from pathlib import Path
+from typing import IO, TYPE_CHECKING, Any
+
+from .types import URI, Area, Edition, MunicipalityID, Notation, SpotID
+
+if TYPE_CHECKING:
+    from typing_extensions import Self
+
+    from .database import Database
+
+MAGIC = b"GOBOSNAP"
+VERSION = 4
+
+_HEADER = struct.Struct("<8sII")
+_SECTION = struct.Struct("<32sc7xQQ")
+_ALIGN = 8
+
+# 文字列や親が無いことを表すインデックス
+MISSING = -1
+ROOT = -2
+
+
+class _Builder:
+    def __init__(self) -> None:
+        self.strings: dict[str, int] = {}
+        self.sections: dict[str, array[Any]] = {}
+
+    def intern(self, value: str | None) -> int:
+        if value is None:
+            return MISSING
+        return self.strings.setdefault(value, len(self.strings))
+
+    def add(self, name: str, typecode: str, values: Iterable[int]) -> None:
+        assert len(name) <= 32, name
+        self.sections[name] = array(typecode, values)
+
+    def build(self) -> bytes:
+        pool = [s.encode("utf-8") for s in self.strings]
+        offsets = array("q", [0])
+        for encoded in pool:
+            offsets.append(offsets[-1] + len(encoded))
+        self.sections["pool_offsets"] = offsets
+        self.sections["pool"] = array("B", b"".join(pool))
+
+        directory_size = _HEADER.size + _SECTION.size * len(self.sections)
+        position = _aligned(directory_size)
+        directory = [_HEADER.pack(MAGIC, VERSION, len(self.sections))]
+        chunks = []
+        for name, values in self.sections.items():
+            data = values.tobytes()
+            directory.append(
+                _SECTION.pack(
+                    name.encode("ascii"), values.typecode.encode("ascii"), position, len(data)
+                )
+            )
+            padding = _aligned(len(data)) - len(data)
+            chunks.append(data + b"\0" * padding)
+            position += len(data) + padding
+
+        header = b"".join(directory)
+        return header + b"\0" * (_aligned(directory_size) - len(header)) + b"".join(chunks)
+
+
+def pack(db: Database) -> bytes:
+    builder = _Builder()
+
+    builder.add("edition", "q", [db.edition, builder.intern(db.platinumaps)])
+
+    areas = list(Area)
+    builder.add("area_ids", "q", (area.value for area in areas))
+    for notation in Notation:
+        builder.add(
+            f"area_name{notation.value}",
+            "q",
+            (builder.intern(_or_none(db.area_name, area, notation)) for area in areas),
+        )
+
+    cursor = db.connection.cursor()
+    cursor.execute(
+        """
+SELECT DISTINCT municipality_id
+FROM municipality_names
+ORDER BY municipality_id
+        """
+    )
+    municipality_ids = [MunicipalityID(id) for id, in cursor.fetchall()]
+    cursor.execute(
+        """
+SELECT child_id, parent_id
+FROM municipality_tree
+        """
+    )
+    parents = {child: ROOT if parent is None else parent for child, parent in cursor.fetchall()}
+    builder.add("municipality_ids", "q", municipality_ids)
+    builder.add("municipality_parents", "q", (parents.get(id, MISSING) for id in municipality_ids))
+    builder.add("municipality_list", "q", db.municipalities)
+    for notation in Notation:
+        builder.add(
+            f"municipality_name{notation.value}",
+            "q",
+            (
+                builder.intern(_or_none(db.municipality_name, id, notation))
+                for id in municipality_ids
+            ),
+        )
+
+    # 名前から引くための索引。名前 (UTF-8) の順に並べ、二分探索する
+    names = sorted(
+        (name.encode("utf-8"), id)
+        for id in municipality_ids
+        for notation in Notation
+        if (name := _or_none(db.municipality_name, id, notation)) is not None
+    )
+    builder.add(
+        "municipality_name_index",
+        "q",
+        (builder.intern(name.decode("utf-8")) for name, _ in names),
+    )
+    builder.add("municipality_name_index_ids", "q", (id for _, id in names))
+
+    # 日付は date.toordinal() で持つ
+    history = db.municipality_history
+    builder.add("history_ids", "q", (id for id, *_ in history))
+    builder.add("history_notations", "q", (notation.value for _, notation, *_ in history))
+    builder.add("history_names", "q", (builder.intern(name) for _, _, name, *_ in history))
+    builder.add("history_from", "q", (_ordinal(valid_from) for *_, valid_from, _ in history))
+    builder.add("history_until", "q", (_ordinal(valid_until) for *_, valid_until in history))
+
+    spot_ids = db.spots
+    uris = db.spot_uris
+    addresses = db.spot_addresses
+    builder.add("spot_ids", "q", spot_ids)
+    for notation in Notation:
+        builder.add(
+            f"spot_name{notation.value}",
+            "q",
+            (builder.intern(_or_none(db.spot_name, id, notation)) for id in spot_ids),
+        )
+    builder.add("spot_uris", "q", (builder.intern(uris.get(id)) for id in spot_ids))
+    builder.add("spot_addresses", "q", (builder.intern(addresses.get(id)) for id in spot_ids))
+
+    # spot_areas テーブルが無いデータベースもある
+    spot_areas: dict[int, int] = {}
+    cursor.execute(
+        """
+SELECT name
+FROM sqlite_master
+WHERE type = 'table' AND name = 'spot_areas'
+        """
+    )
+    if cursor.fetchone() is not None:
+        cursor.execute(
+            """
+SELECT spot_id, area_id
+FROM spot_areas
+            """
+        )
+        spot_areas = dict(cursor.fetchall())
+    builder.add("spot_areas", "q", (spot_areas.get(id, MISSING) for id in spot_ids))
+
+    return builder.build()
+
+
+def write(db: Database, file: IO[bytes]) -> None:
+    file.write(pack(db))
+
+
+def share(db: Database, name: str | None = None) -> SharedMemory:
+    """
+    スナップショットを共有メモリに置く (呼び出し側で close / unlink すること)
+    """
+    data = pack(db)
+    shm = SharedMemory(name=name, create=True, size=len(data))
+    assert shm.buf is not None
+    shm.buf[: len(data)] = data
+    return shm
+
+
+class Snapshot:
+    """
+    スナップショット上の読み取り専用ビュー
+
+    `Database` と同じシグネチャで引けるが、データはバッファから直接読む
+    """
+
+    def __init__(self, buffer: Any, owner: Any = None) -> None:
+        self._buffer = memoryview(buffer)
+        self._owner = owner
+        self._sections: dict[str, memoryview] = {}
+
+        magic, version, count = _HEADER.unpack_from(self._buffer, 0)
+        if magic != MAGIC or version != VERSION:
+            raise ValueError(magic, version)
+
+        for i in range(count):
+            name, typecode, offset, size = _SECTION.unpack_from(
+                self._buffer, _HEADER.size + _SECTION.size * i
+            )
+            end = offset + size
+            view = self._buffer[offset:end]
+            self._sections[name.rstrip(b"\0").decode("ascii")] = view.cast(typecode.decode("ascii"))
+
+    @classmethod
+    def open(cls, path: Path) -> Self:
+        with path.open("rb") as f:
+            mapped = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+        return cls(mapped, mapped)
+
+    @classmethod
+    def attach(cls, name: str) -> Self:
+        # multiprocessing で起動したワーカーは親と同じ resource_tracker を使うので、
+        # 共有メモリの後始末は share() した側の unlink に任せる
+        shm = SharedMemory(name=name)
+        return cls(shm.buf, shm)
+
+    def close(self) -> None:
+        for view in self._sections.values():
+            view.release()
+        self._sections.clear()
+        self._buffer.release()
+        match self._owner:
+            case mmap.mmap() as mapped:
+                mapped.close()
+            case SharedMemory() as shm:
+                shm.close()
+
+    def __enter__(self) -> Self:
+        return self
+
+    def __exit__(self, *args: Any) -> None:
+        self.close()
+
+    @property
+    def nbytes(self) -> int:
+        return self._buffer.nbytes
+
+    def _bytes(self, index: int) -> bytes:
+        offsets = self._sections["pool_offsets"]
+        start, end = offsets[index], offsets[index + 1]
+        return bytes(self._sections["pool"][start:end])
+
+    def _string(self, index: int) -> str | None:
+        if index == MISSING:
+            return None
+        return self._bytes(index).decode("utf-8")
+
+    def _find(self, section: str, id: int) -> int:
+        ids = self._sections[section]
+        i = bisect_left(ids, id)
+        if i == len(ids) or ids[i] != id:
+            raise ValueError(id)
+        return i
+
+    def _column(self, section: str, id: int, key: str) -> str:
+        value = self._string(self._sections[key][self._find(section, id)])
+        if value is None:
+            raise ValueError(id)
+        return value
+
+    # edition
+
+    @property
+    def edition(self) -> Edition:
+        return Edition(self._sections["edition"][0])
+
+    @property
+    def platinumaps(self) -> str:
+        platinumaps = self._string(self._sections["edition"][1])
+        assert platinumaps is not None
+        return platinumaps
+
+    def platinumaps_uri(self, id: SpotID) -> URI:
+        return URI(f"https://platinumaps.jp/d/{self.platinumaps}?s={id}")
+
+    # area
+
+    def area_name(self, area: Area, notation: Notation = Notation.default) -> str:
+        try:
+            return self._column("area_ids", area.value, f"area_name{notation.value}")
+        except ValueError:
+            raise ValueError(area, notation)
+
+    # municipality
+
+    @property
+    def municipalities(self) -> list[MunicipalityID]:
+        return [MunicipalityID(id) for id in self._sections["municipality_list"]]
+
+    def municipality_by_name(self, name: str) -> MunicipalityID:
+        index = self._sections["municipality_name_index"]
+        encoded = name.encode("utf-8")
+        i = bisect_left(range(len(index)), encoded, key=lambda i: self._bytes(index[i]))
+        if i == len(index) or self._bytes(index[i]) != encoded:
+            raise ValueError(name)
+        return MunicipalityID(self._sections["municipality_name_index_ids"][i])
+
+    def municipality_parts(self, id: MunicipalityID) -> tuple[MunicipalityID, ...]:
+        parent_id = self._sections["municipality_parents"][self._find("municipality_ids", id)]
+        if parent_id == ROOT:
+            return (id,)
+        if parent_id == MISSING:
+            raise ValueError(id)
+        return (*self.municipality_parts(MunicipalityID(parent_id)), id)
+
+    def municipality_name(self, id: MunicipalityID, notation: Notation = Notation.default) -> str:
+        return self._column("municipality_ids", id, f"municipality_name{notation.value}")
+
+    @property
+    def municipality_history(
+        self,
+    ) -> list[tuple[MunicipalityID, Notation, str, date | None, date | None]]:
+        return [
+            (
+                MunicipalityID(id),
+                Notation(notation),
+                self._string(name) or "",
+                _date(valid_from),
+                _date(valid_until),
+            )
+            for id, notation, name, valid_from, valid_until in zip(
+                self._sections["history_ids"],
+                self._sections["history_notations"],
+                self._sections["history_names"],
+                self._sections["history_from"],
+                self._sections["history_until"],
+            )
+        ]
+
+    # spot
+
+    @property
+    def spots(self) -> list[SpotID]:
+        return [SpotID(id) for id in self._sections["spot_ids"]]
+
+    def spot_name(self, id: SpotID, notation: Notation = Notation.default) -> str:
+        try:
+            return self._column("spot_ids", id, f"spot_name{notation.value}")
+        except ValueError:
+            raise ValueError(id, notation)
+
+    def spot_uri(self, id: SpotID) -> URI:
+        return URI(self._column("spot_ids", id, "spot_uris"))
+
+    @property
+    def spot_uris(self) -> dict[SpotID, URI]:
+        return {
+            SpotID(id): URI(uri)
+            for id, index in zip(self._sections["spot_ids"], self._sections["spot_uris"])
+            if (uri := self._string(index)) is not None
+        }
+
+    def spot_address(self, id: SpotID) -> str:
+        return self._column("spot_ids", id, "spot_addresses")
+
+    @property
+    def spot_addresses(self) -> dict[SpotID, str]:
+        return {
+            SpotID(id): address
+            for id, index in zip(self._sections["spot_ids"], self._sections["spot_addresses"])
+            if (address := self._string(index)) is not None
+        }
+
+    def spot_area(self, id: SpotID) -> Area:
+        area_id = self._sections["spot_areas"][self._find("spot_ids", id)]
+        if area_id == MISSING:
+            raise ValueError(id)
+        return Area(area_id)
+
+
+def _aligned(size: int) -> int:
+    return (size + _ALIGN - 1) // _ALIGN * _ALIGN
+
+
+def _ordinal(value: date | None) -> int:
+    return MISSING if value is None else value.toordinal()
+
+
+def _date(value: int) -> date | None:
+    return None if value == MISSING else date.fromordinal(value)
+
+
+def _or_none(f: Any, *args: Any) -> str | None:
+    try:
+        return str(f(*args))
+    except ValueError:
+        return None
@@ -1,6 +1,8 @@
 from enum import Enum
 from typing import NewType
 
+Edition = NewType("Edition", int)
+
 
 class Area(Enum):
     ベイ = 1
@@ -3,6 +3,7 @@ import json
 import click
 from selenium import webdriver
 
+from bootstrap.edition import PLATINUMAPS
 from bootstrap.platinum import find_boot_options
 from gobo.__main__ import run_decorator
 
@@ -22,7 +23,7 @@ async def main(headed: bool) -> None:
 
     driver = webdriver.Chrome(options=options)
 
-    (boot_option,) = find_boot_options(driver)
+    (boot_option,) = find_boot_options(driver, PLATINUMAPS)
 
     print(json.dumps(boot_option, indent=2))
 
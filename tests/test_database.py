@@ -0,0 +1,51 @@
+from sqlite3 import connect
+
+from bootstrap.spot import create_and_insert
+from bootstrap.types import Spot, SpotID
+from gobo.database import Database, recurring_spots
+
+MUSEUM = "館山市館山351-2"
+MUSEUM_URI = "https://example.com/museum"
+
+
+def _db(*spots: tuple[int, str, str | None]) -> Database:
+    connection = connect(":memory:")
+    create_and_insert(
+        connection.cursor(),
+        [
+            Spot(id=SpotID(id), name=f"spot {id}", address=address)
+            if uri is None
+            else Spot(id=SpotID(id), name=f"spot {id}", address=address, uri=uri)
+            for id, address, uri in spots
+        ],
+    )
+    return Database(connection)
+
+
+def test_recurring_spots() -> None:
+    old = _db(
+        # 同じ博物館の企画展
+        (1, MUSEUM, MUSEUM_URI),
+        (2, MUSEUM, MUSEUM_URI),
+        (3, "銚子市川口町", "https://example.com/3"),
+        (4, "成田市仲町", None),
+        (5, "旭市", "https://example.com/5"),
+        (7, "鴨川市", "https://example.com/7"),
+    )
+    new = _db(
+        (1, MUSEUM, MUSEUM_URI),
+        (2, MUSEUM, MUSEUM_URI),
+        # 同じ博物館の新しい企画展は、どの企画展とも決められない
+        (6, MUSEUM, MUSEUM_URI),
+        # 同じ ID で住所が同じなら、URI が変わっても同じスポット
+        (7, "鴨川市", "https://example.com/7-new"),
+        (13, "銚子市川口町", "https://example.com/3"),
+        (14, "成田市仲町", None),
+        (15, "匝瑳市", "https://example.com/5"),
+        # 前の版の 5 は 15 に使ったので、住所が同じでも組にしない
+        (16, "旭市", None),
+        # 前の版の 7 は同じ ID の 7 に使った
+        (17, "南房総市", "https://example.com/7"),
+    )
+
+    assert recurring_spots(old, new) == [(1, 1), (2, 2), (7, 7), (3, 13), (4, 14), (5, 15)]
@@ -0,0 +1,141 @@
+import json
+from pathlib import Path
+from zipfile import ZipFile
+
+from click.testing import CliRunner
+
+from gobo.__main__ import main
+from gobo.database import get_db
+from gobo.excel import (
+    CLEARED,
+    SPOT_SHEET,
+    build_layout,
+    create_workbook,
+    read_progress,
+    write_batch,
+)
+from gobo.types import Edition, SpotID
+
+
+def test_import_progress_to_excel_batch(tmp_path: Path) -> None:
+    runner = CliRunner()
+    participants = tmp_path / "participants.json"
+    participants.write_text(
+        json.dumps({"alice": [207134, 207137], "bob": [207135]}), encoding="utf-8"
+    )
+
+    result = runner.invoke(main, ["excel-batch", str(participants), str(tmp_path / "first")])
+    assert result.exit_code == 0, result.output
+
+    # 参加者ごとの進捗を読み出し、そのまま excel-batch に渡せる
+    progress = tmp_path / "progress.json"
+    files = [str(tmp_path / "first" / name) for name in ["alice.xlsx", "bob.xlsx"]]
+    result = runner.invoke(
+        main, ["import-progress", "--by-participant", "-o", str(progress), *files]
+    )
+    assert result.exit_code == 0, result.output
+    assert json.loads(progress.read_text(encoding="utf-8")) == {
+        "alice": [207134, 207137],
+        "bob": [207135],
+    }
+
+    result = runner.invoke(main, ["excel-batch", str(progress), str(tmp_path / "second")])
+    assert result.exit_code == 0, result.output
+
+    merged = tmp_path / "merged.json"
+    files = [str(tmp_path / "second" / name) for name in ["alice.xlsx", "bob.xlsx"]]
+    result = runner.invoke(main, ["import-progress", "-o", str(merged), *files])
+    assert result.exit_code == 0, result.output
+    assert json.loads(merged.read_text(encoding="utf-8")) == [207134, 207135, 207137]
+
+
+def test_import_progress_same_stem(tmp_path: Path) -> None:
+    for directory in ["a", "b"]:
+        (tmp_path / directory).mkdir()
+        (tmp_path / directory / "alice.xlsx").touch()
+
+    result = CliRunner().invoke(
+        main,
+        [
+            "import-progress",
+            "--by-participant",
+            str(tmp_path / "a" / "alice.xlsx"),
+            str(tmp_path / "b" / "alice.xlsx"),
+        ],
+    )
+    assert result.exit_code == 2
+    assert "have the same name" in result.output
+
+
+def test_write_batch_resets_template(tmp_path: Path) -> None:
+    layout = build_layout(get_db(Edition(2023)))
+    alice, bob = tmp_path / "alice.xlsx", tmp_path / "bob.xlsx"
+
+    # ワーカーが一つなら同じテンプレートを使い回すので、前の参加者の達成が残らないこと
+    assert write_batch(
+        layout, [(alice, [SpotID(207134), SpotID(207135)]), (bob, [SpotID(207136)])], 1
+    ) == [alice, bob]
+
+    assert {id for id, cleared in read_progress(alice).items() if cleared} == {207134, 207135}
+    assert {id for id, cleared in read_progress(bob).items() if cleared} == {207136}
+    assert len(read_progress(bob)) == len(layout.spots)
+
+
+def test_excel_batch_jobs(tmp_path: Path) -> None:
+    participants = tmp_path / "participants.json"
+    participants.write_text(json.dumps(["alice"]), encoding="utf-8")
+
+    result = CliRunner().invoke(
+        main, ["excel-batch", "-j", "0", str(participants), str(tmp_path / "out")]
+    )
+    assert result.exit_code == 0, result.output
+    assert (tmp_path / "out" / "alice.xlsx").exists()
+
+
+def _tick(path: Path, rows: list[int]) -> None:
+    wb = create_workbook(build_layout(get_db(Edition(2023))))
+    for row in rows:
+        wb[SPOT_SHEET][f"{CLEARED}{row}"] = True
+    wb.save(path)
+
+
+def test_read_progress(tmp_path: Path) -> None:
+    path = tmp_path / "progress.xlsx"
+    _tick(path, [2, 4])
+
+    progress = read_progress(path)
+    assert len(progress) == len(get_db(Edition(2023)).spots)
+    assert [id for id, cleared in progress.items() if cleared] == [207134, 207136]
+
+
+def test_read_progress_range_ref(tmp_path: Path) -> None:
+    source, path = tmp_path / "source.xlsx", tmp_path / "range.xlsx"
+    _tick(source, [3])
+
+    # Excel はハイパーリンクの ref を範囲で書くこともある
+    with ZipFile(source) as zin, ZipFile(path, "w") as zout:
+        for info in zin.infolist():
+            data = zin.read(info)
+            if info.filename == "xl/worksheets/sheet1.xml":
+                data = data.replace(b'ref="D3"', b'ref="D3:E3"').replace(b'ref="D5"', b'ref="D:D"')
+            zout.writestr(info, data)
+
+    progress = read_progress(path)
+    assert progress[SpotID(207135)] is True
+    assert SpotID(207137) not in progress
+
+
+def test_import_progress(tmp_path: Path) -> None:
+    alice, bob = tmp_path / "alice.xlsx", tmp_path / "bob.xlsx"
+    _tick(alice, [2, 3])
+    _tick(bob, [3, 5])
+
+    runner = CliRunner()
+    merged = tmp_path / "merged.json"
+    result = runner.invoke(main, ["import-progress", "-o", str(merged), str(alice), str(bob)])
+    assert result.exit_code == 0, result.output
+    assert json.loads(merged.read_text(encoding="utf-8")) == [207134, 207135, 207137]
+
+    result = runner.invoke(main, ["import-progress"])
+    assert result.exit_code == 2
+    assert "Missing argument 'FILE...'" in result.output
@@ -0,0 +1,88 @@
+from asyncio import run, sleep
+from collections.abc import Awaitable, Callable, Mapping
+from contextlib import AbstractAsyncContextManager, AsyncExitStack
+
+from aiohttp import web
+
+from bootstrap.replay import serve_app
+from gobo.links import check_links
+from gobo.types import URI
+
+Handler = Callable[[web.Request], Awaitable[web.StreamResponse]]
+
+
+def serve(routes: Mapping[str, Handler]) -> AbstractAsyncContextManager[str]:
+    app = web.Application()
+    for path, handler in routes.items():
+        app.router.add_route("*", path, handler)
+    return serve_app(app)
+
+
+async def ok(request: web.Request) -> web.Response:
+    return web.Response(text="ok")
+
+
+async def missing(request: web.Request) -> web.Response:
+    raise web.HTTPNotFound()
+
+
+async def get_only(request: web.Request) -> web.Response:
+    if request.method == "HEAD":
+        raise web.HTTPMethodNotAllowed(request.method, ["GET"])
+    return web.Response(text="ok")
+
+
+async def head_stalls(request: web.Request) -> web.Response:
+    if request.method == "HEAD":
+        await sleep(1)
+    return web.Response(text="ok")
+
+
+async def slow(request: web.Request) -> web.Response:
+    await sleep(0.25)
+    return web.Response(text="ok")
+
+
+def test_check_links() -> None:
+    async def main() -> None:
+        routes = {"/ok": ok, "/missing": missing, "/get-only": get_only, "/head": head_stalls}
+        async with serve(routes) as root:
+            uris = [URI(root + path) for path in ["/ok", "/missing", "/get-only", "/head"]]
+            statuses = {status.uri: status for status in await check_links(uris, timeout=0.5)}
+
+        assert {uri.removeprefix(root): s.status for uri, s in statuses.items()} == {
+            "/ok": 200,
+            "/missing": 404,
+            "/get-only": 200,
+            "/head": 200,
+        }
+        assert [s.ok for s in statuses.values()] == [True, False, True, True]
+
+    run(main())
+
+
+def test_connection_error() -> None:
+    async def main() -> None:
+        async with serve({}) as root:
+            pass
+        # サーバーを止めたあとのポートにはつながらない
+        (status,) = await check_links([URI(root + "/ok")], timeout=0.5)
+        assert status.status is None
+        assert status.error
+        assert not status.ok
+
+    run(main())
+
+
+def test_waiting_for_connection_is_not_timeout() -> None:
+    async def main() -> None:
+        async with AsyncExitStack() as stack:
+            roots = [await stack.enter_async_context(serve({"/slow": slow})) for _ in range(6)]
+            uris = [URI(f"{root}/slow?{i}") for root in roots for i in range(2)]
+            # 一度に 2 つずつなので全体では 1.5 秒かかるが、個々のリクエストは 0.25 秒
+            statuses = await check_links(uris, limit=2, limit_per_host=2, timeout=1.0)
+
+        assert [s.error for s in statuses] == [None] * len(uris)
+        assert all(s.ok for s in statuses)
+
+    run(main())
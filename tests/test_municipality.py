@@ -0,0 +1,104 @@
+from datetime import date
+from pathlib import Path
+
+import pytest
+from lxml import html
+from lxml.etree import _Element
+
+from bootstrap.municipality import _intervals, _iter_changes, _iter_rows
+from gobo.history import MunicipalityHistory
+from gobo.types import MunicipalityID, Notation
+
+
+@pytest.fixture
+def document(fixtures: Path) -> _Element:
+    return html.fromstring((fixtures / "12tiba.htm").read_text(encoding="utf-8"))
+
+
+@pytest.fixture
+def history(document: _Element) -> MunicipalityHistory:
+    rows = list(_iter_rows(document))
+    current = {MunicipalityID(id): kanji for id, _, (kanji, _) in rows}
+    return MunicipalityHistory(
+        (
+            (MunicipalityID(id), notation, name, valid_from, valid_until)
+            for id, names, valid_from, valid_until in _intervals(
+                rows, list(_iter_changes(document))
+            )
+            for notation, name in zip(Notation, names)
+        ),
+        current,
+    )
+
+
+def test_iter_rows(document: _Element) -> None:
+    rows = {id: (parent, names) for id, parent, names in _iter_rows(document)}
+
+    # 区は市の下、町村は郡の下、市と郡は県の下
+    assert rows[12100] == (12000, ("千葉市", "ちばし"))
+    assert rows[12101] == (12100, ("中央区", "ちゅうおうく"))
+    assert rows[12420] == (12000, ("長生郡", "ちょうせいぐん"))
+    assert rows[12422] == (12420, ("睦沢町", "むつざわまち"))
+
+    # 変更のあった行は最後の名前を使う
+    assert rows[12231] == (12000, ("印西市", "いんざいし"))
+    assert rows[12233] == (12000, ("富里市", "とみさとし"))
+
+
+def test_iter_changes(document: _Element) -> None:
+    assert list(_iter_changes(document)) == [
+        (12224, ("鎌ケ谷町", "かまがやまち"), ("鎌ヶ谷市", "かまがやし"), date(1971, 9, 1)),
+        (12231, ("印西町", "いんざいまち"), ("印西市", "いんざいし"), date(1996, 4, 1)),
+        (12233, ("富里村", "とみさとむら"), ("富里町", "とみさとまち"), date(1985, 4, 1)),
+        (12233, ("富里町", "とみさとまち"), ("富里市", "とみさとし"), date(2002, 4, 1)),
+        (12422, ("睦沢村", "むつざわむら"), ("睦沢町", "むつざわまち"), date(1963, 4, 1)),
+    ]
+
+
+def test_intervals(document: _Element) -> None:
+    rows = list(_iter_rows(document))
+    intervals = [
+        interval
+        for interval in _intervals(rows, list(_iter_changes(document)))
+        if interval[0] in {12202, 12233}
+    ]
+    assert intervals == [
+        (12202, ("銚子市", "ちょうしし"), None, None),
+        (12233, ("富里村", "とみさとむら"), None, date(1985, 4, 1)),
+        (12233, ("富里町", "とみさとまち"), date(1985, 4, 1), date(2002, 4, 1)),
+        (12233, ("富里市", "とみさとし"), date(2002, 4, 1), None),
+    ]
+
+
+def test_name(history: MunicipalityHistory) -> None:
+    id = MunicipalityID(12233)
+    assert history.name(id, date(1980, 1, 1)) == "富里村"
+    assert history.name(id, date(1985, 4, 1)) == "富里町"
+    assert history.name(id, date(2002, 3, 31)) == "富里町"
+    assert history.name(id, date(2002, 4, 1)) == "富里市"
+    assert history.name(id, date(2023, 1, 1), Notation.hiragana) == "とみさとし"
+
+    with pytest.raises(ValueError):
+        history.name(MunicipalityID(99999), date(2023, 1, 1))
+
+
+def test_resolve(history: MunicipalityHistory) -> None:
+    assert history.resolve("富里町") == 12233
+    assert history.resolve("とみさとまち", date(1990, 1, 1)) == 12233
+    assert history.resolve("印西市", date(2000, 1, 1)) == 12231
+
+    with pytest.raises(ValueError):
+        history.resolve("印西市", date(1990, 1, 1))
+
+    assert history.resolve_many(["鎌ケ谷町", "富里村", "存在しない町"]) == {
+        "鎌ケ谷町": 12224,
+        "富里村": 12233,
+    }
+
+
+def test_normalize_address(history: MunicipalityHistory) -> None:
+    assert history.normalize_address("印旛郡富里町七栄") == "印旛郡富里市七栄"
+    assert history.normalize_address("鎌ケ谷町初富") == "鎌ヶ谷市初富"
+    assert history.normalize_address("長生郡睦沢村上之郷") == "長生郡睦沢町上之郷"
+    assert history.normalize_address("銚子市川口町") == "銚子市川口町"
+    assert history.normalize_addresses(["印西町大森", "旭市"]) == ["印西市大森", "旭市"]
@@ -0,0 +1,50 @@
+import json
+from datetime import date
+from pathlib import Path
+from sqlite3 import connect
+
+from click.testing import CliRunner
+
+from bootstrap.__main__ import main
+from gobo.database import Database, get_db
+from gobo.types import Edition, Notation, SpotID
+
+
+def test_replay(fixtures: Path, tmp_path: Path) -> None:
+    runner = CliRunner()
+    tape = str(fixtures / "tape")
+    spots_path = tmp_path / "spots.json"
+    sql_path = tmp_path / "2023.sql"
+
+    result = runner.invoke(main, ["--replay", tape, "spots", "-j", "2", "-o", str(spots_path)])
+    assert result.exit_code == 0, result.output
+
+    spots = json.loads(spots_path.read_text(encoding="utf-8"))
+    assert [spot["id"] for spot in spots] == [207134, 207135, 207136]
+    assert spots[0]["address"] == "銚子市八木町1777-1"
+    assert spots[0]["uri"] == "https://www.city.choshi.chiba.jp/edu/sg-guide/index.html"
+    # iframe の中の相対リンクは iframe の URL から解決する
+    assert spots[2]["uri"] == "https://platinumaps.jp/maps/gogo-boso/spots/207136/info.html"
+
+    result = runner.invoke(
+        main,
+        ["--replay", tape, "database", "--edition", "2023", "-o", str(sql_path), str(spots_path)],
+    )
+    assert result.exit_code == 0, result.output
+
+    connection = connect(":memory:")
+    connection.executescript(sql_path.read_text(encoding="utf-8"))
+    db = Database(connection)
+    bundled = get_db(Edition(2023))
+
+    assert db.edition == 2023
+    assert db.spots == [207134, 207135, 207136]
+    assert db.spot_name(SpotID(207135)) == bundled.spot_name(SpotID(207135))
+    assert db.municipalities == bundled.municipalities
+    assert (
+        12233,
+        Notation.default,
+        "富里町",
+        date(1985, 4, 1),
+        date(2002, 4, 1),
+    ) in db.municipality_history
@@ -0,0 +1,70 @@
+from pathlib import Path
+from sqlite3 import connect
+
+import pytest
+from click.testing import CliRunner
+
+from gobo.__main__ import main
+from gobo.database import Database, get_db
+from gobo.site import build, collect_pages, spot_municipalities
+from gobo.types import Edition, SpotID
+
+SPOT = SpotID(207134)
+
+
+@pytest.fixture
+def db() -> Database:
+    # 書き換えられるように同梱のデータベースを複製する
+    connection = connect(":memory:")
+    get_db(Edition(2023)).connection.backup(connection)
+    return Database(connection)
+
+
+def test_build(db: Database, tmp_path: Path) -> None:
+    municipalities = spot_municipalities(db)
+    (municipality,) = municipalities[SPOT]
+    pages = collect_pages(db, municipalities)
+
+    first = build(tmp_path, pages, 1)
+    assert sorted(first.written) == sorted(page.path for page in pages)
+    assert first.skipped == first.removed == []
+
+    second = build(tmp_path, collect_pages(db, municipalities), 1)
+    assert second.written == second.removed == []
+
+    # 名前を変えたスポットのページと、それを一覧に載せている市町村のページだけを描画し直す
+    with db.connection:
+        db.connection.execute(
+            "UPDATE spot_names SET spot_name = ? WHERE spot_id = ?", ("改名したスポット", SPOT)
+        )
+    renamed = build(tmp_path, collect_pages(db, municipalities), 1)
+    assert sorted(renamed.written) == [f"municipality/{municipality}.html", f"spot/{SPOT}.html"]
+    assert "改名したスポット" in (tmp_path / f"spot/{SPOT}.html").read_text(encoding="utf-8")
+
+    # 消えたページは書き直す
+    (tmp_path / "index.html").unlink()
+    assert build(tmp_path, collect_pages(db, municipalities), 1).written == ["index.html"]
+
+    # 無くなったスポットのページは削除する
+    del municipalities[SPOT]
+    with db.connection:
+        for table in ["spot_names", "spot_addresses", "spot_uris"]:
+            db.connection.execute(f"DELETE FROM {table} WHERE spot_id = ?", (SPOT,))
+    removed = build(tmp_path, collect_pages(db, municipalities), 1)
+    assert removed.removed == [f"spot/{SPOT}.html"]
+    assert not (tmp_path / f"spot/{SPOT}.html").exists()
+    assert sorted(removed.written) == ["index.html", f"municipality/{municipality}.html"]
+
+
+def test_empty_areas(db: Database) -> None:
+    # spot_areas テーブルが無いので、エリアのページは作らない
+    pages = collect_pages(db, spot_municipalities(db))
+    assert not [page for page in pages if page.path.startswith("area/")]
+    assert pages[0].rows["areas"] == []
+
+
+def test_site_command(tmp_path: Path) -> None:
+    result = CliRunner().invoke(main, ["site", "-j", "0", str(tmp_path)])
+    assert result.exit_code == 0, result.output
+    assert "エリア" not in (tmp_path / "index.html").read_text(encoding="utf-8")
+    assert not (tmp_path / "area").exists()
@@ -0,0 +1,113 @@
+from collections.abc import Callable
+from concurrent.futures import ProcessPoolExecutor
+from itertools import cycle
+from pathlib import Path
+from sqlite3 import connect
+from typing import Any
+
+import pytest
+
+from gobo.database import Database, get_db
+from gobo.excel import scraping_address
+from gobo.snapshot import Snapshot, pack, share, write
+from gobo.types import Area, Edition, MunicipalityID, Notation, SpotID
+
+UNKNOWN_SPOT = SpotID(1)
+UNKNOWN_MUNICIPALITY = MunicipalityID(1)
+
+
+@pytest.fixture
+def db() -> Database:
+    return get_db(Edition(2023))
+
+
+def _result(f: Callable[..., Any], *args: Any) -> Any:
+    try:
+        return f(*args)
+    except ValueError as error:
+        return ValueError, error.args
+
+
+def _accessors(db: Database | Snapshot) -> dict[str, Any]:
+    """
+    `Database` と同じシグネチャの読み出しを一通り呼んだ結果
+    """
+    municipality_ids = [MunicipalityID(12000), *db.municipalities, UNKNOWN_MUNICIPALITY]
+    spot_ids = [*db.spots, UNKNOWN_SPOT]
+    return {
+        "edition": db.edition,
+        "platinumaps": db.platinumaps,
+        "platinumaps_uri": db.platinumaps_uri(SpotID(207134)),
+        "area_name": [_result(db.area_name, area, n) for area in Area for n in Notation],
+        "municipalities": db.municipalities,
+        "municipality_by_name": [
+            _result(db.municipality_by_name, name)
+            for name in ["千葉市", "ちばし", "中央区", "印旛郡", "存在しない町"]
+        ],
+        "municipality_parts": [_result(db.municipality_parts, id) for id in municipality_ids],
+        "municipality_name": [
+            _result(db.municipality_name, id, n) for id in municipality_ids for n in Notation
+        ],
+        "municipality_history": db.municipality_history,
+        "spots": db.spots,
+        "spot_name": [_result(db.spot_name, id, n) for id in spot_ids for n in Notation],
+        "spot_uri": [_result(db.spot_uri, id) for id in spot_ids],
+        "spot_uris": db.spot_uris,
+        "spot_address": [_result(db.spot_address, id) for id in spot_ids],
+        "spot_addresses": db.spot_addresses,
+        "scraping_address": [scraping_address(db, id) for id in db.spots],
+    }
+
+
+def test_open(db: Database, tmp_path: Path) -> None:
+    path = tmp_path / "2023.snapshot"
+    with path.open("wb") as f:
+        write(db, f)
+
+    with Snapshot.open(path) as snapshot:
+        assert snapshot.nbytes == len(pack(db))
+        assert _accessors(snapshot) == _accessors(db)
+        # 同梱のデータベースには spot_areas テーブルが無い
+        with pytest.raises(ValueError):
+            snapshot.spot_area(SpotID(207134))
+        with pytest.raises(ValueError):
+            snapshot.spot_area(UNKNOWN_SPOT)
+
+
+def _attach(name: str) -> dict[str, Any]:
+    with Snapshot.attach(name) as snapshot:
+        return _accessors(snapshot)
+
+
+def test_attach(db: Database) -> None:
+    shm = share(db)
+    try:
+        with ProcessPoolExecutor(1) as executor:
+            assert executor.submit(_attach, shm.name).result() == _accessors(db)
+    finally:
+        shm.close()
+        shm.unlink()
+
+
+def test_version(db: Database) -> None:
+    data = bytearray(pack(db))
+    data[:8] = b"NOTASNAP"
+    with pytest.raises(ValueError):
+        Snapshot(data)
+
+
+def test_spot_areas(db: Database) -> None:
+    connection = connect(":memory:")
+    db.connection.backup(connection)
+    with connection:
+        connection.execute("CREATE TABLE spot_areas (spot_id INTEGER, area_id INTEGER)")
+        connection.executemany(
+            "INSERT INTO spot_areas VALUES (?, ?)",
+            [(id, area.value) for id, area in zip(db.spots[:10], cycle(Area))],
+        )
+    with_areas = Database(connection)
+
+    snapshot = Snapshot(pack(with_areas))
+    assert [_result(snapshot.spot_area, id) for id in [*db.spots, UNKNOWN_SPOT]] == [
+        _result(with_areas.spot_area, id) for id in [*db.spots, UNKNOWN_SPOT]
+    ]